@@ -7,7 +7,6 @@ questions. It orchestrates calls to core modules without containing any RAG logi
 import streamlit as st
 
 from config.settings import MAX_SOURCES
-from services.qa_service import process_question
 from ui.components import (
     display_entities,
     render_answer_and_sources,
@@ -21,12 +20,17 @@ from ui.session_state import initialize_session_state
 
 def _process_question(question: str) -> None:
     """Process a question and display the answer."""
+    # Imported on first question: the QA stack is not needed to render the page
+    from services.qa_service import process_question
+
     if st.session_state.get("last_question") != question:
         st.session_state.feedback_submitted = False
         st.session_state.show_comment = False
 
     try:
-        answer, sources, feedback_used = process_question(st.session_state.vectorstore, question)
+        answer, sources, feedback_used = process_question(
+            st.session_state.vectorstore, question, doc_hash=st.session_state.get("doc_hash")
+        )
 
         if feedback_used:
             st.info("💡 This answer was improved using feedback from previous interaction(s).")
@@ -0,0 +1,116 @@
+"""Benchmark Streamlit rerun cost: server CPU time per UI interaction.
+
+Drives app.py with Streamlit's AppTest on an indexed synthetic contract, a
+displayed answer and a feedback log of the given size, and measures the
+process CPU time of each interaction, including reruns requested with
+st.rerun(). AppTest executes fragments as full-script reruns, so interactions
+inside fragments are an upper bound of their cost in a browser session.
+
+Usage:
+    python -m benchmarks.bench_app_reruns [--feedback 10000] [--repeats 5]
+"""
+
+import argparse
+import json
+import tempfile
+import time
+from pathlib import Path
+from typing import Callable, Dict, List, Union
+
+import numpy as np
+from streamlit.testing.v1 import AppTest
+
+import core.feedback
+import core.query_cache
+from benchmarks.common import HashingEmbeddings, synthetic_corpus
+from core.vectorstore import create_vectorstore
+
+APP_PATH = str(Path(__file__).parent.parent / "app.py")
+
+DOC_HASH = "benchmark-document"
+
+
+def _write_feedback(path: Path, entries: int) -> None:
+    """Write a feedback log about the benchmark document."""
+    with open(path, "w", encoding="utf-8") as f:
+        for i in range(entries):
+            entry = {
+                "id": str(i),
+                "timestamp": f"2024-01-01T{i:09d}",
+                "question": f"Question {i % 50}?",
+                "answer": "An answer taken from the contract. " * 5,
+                "rating": "up" if i % 3 else "down",
+                "doc_hash": DOC_HASH,
+            }
+            f.write(json.dumps(entry) + "\n")
+
+
+def _new_session(vectorstore) -> AppTest:
+    """Start an app session showing an answer about the indexed document."""
+    app = AppTest.from_file(APP_PATH, default_timeout=60)
+    app.session_state["vectorstore"] = vectorstore
+    app.session_state["doc_hash"] = DOC_HASH
+    app.session_state["last_question"] = "What are the payment terms?"
+    app.session_state["last_answer"] = "Payment is due within thirty days."
+    app.session_state["last_sources"] = []
+    return app.run()
+
+
+def _interactions() -> Dict[str, Callable[[AppTest], AppTest]]:
+    """Interactions measured, each applied to a fresh session."""
+    return {
+        "rerun": lambda app: app.run(),
+        "quick_question": lambda app: app.button(key="question_0").click().run(),
+        "open_comment": lambda app: app.button(key="feedback_down").click().run(),
+    }
+
+
+def run(feedback: int, repeats: int) -> List[Dict[str, Union[str, float]]]:
+    """Measure the CPU time of every interaction."""
+    chunks, _ = synthetic_corpus(200)
+    embeddings = HashingEmbeddings(dimension=256)
+    texts = [chunk.page_content for chunk in chunks]
+    vectorstore = create_vectorstore(
+        texts,
+        np.asarray(embeddings.embed_documents(texts), dtype=np.float32),
+        [chunk.metadata for chunk in chunks],
+        embeddings,
+    )
+
+    rows = []
+    with tempfile.TemporaryDirectory() as tmp:
+        feedback_path = Path(tmp) / "feedback.jsonl"
+        _write_feedback(feedback_path, feedback)
+        core.feedback.FEEDBACK_FILE_PATH = str(feedback_path)
+        core.query_cache.QUERY_CACHE_PATH = str(Path(tmp) / "query_cache.sqlite3")
+        # Warm up imports and the feedback index
+        _new_session(vectorstore)
+
+        for name, interact in _interactions().items():
+            cpu_seconds = 0.0
+            for _ in range(repeats):
+                app = _new_session(vectorstore)
+                start = time.process_time()
+                interact(app)
+                cpu_seconds += time.process_time() - start
+            rows.append({"interaction": name, "cpu_ms": cpu_seconds / repeats * 1000})
+    return rows
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--feedback", type=int, default=10_000)
+    parser.add_argument("--repeats", type=int, default=5)
+    args = parser.parse_args()
+
+    for row in run(args.feedback, args.repeats):
+        print(
+            "  ".join(
+                f"{key}={value:.3f}" if isinstance(value, float) else f"{key}={value}"
+                for key, value in row.items()
+            )
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,90 @@
+"""Benchmark search speed, memory and recall of reduced embedding dimensions.
+
+Full-size vectors are truncated and re-normalized (as text-embedding-3 models
+do for shortened outputs) and recall@k is measured against search with the
+full 1536-dimensional vectors. The synthetic vectors concentrate signal in the
+leading dimensions like Matryoshka-trained embeddings; validate the quality
+trade-off on real embeddings before lowering EMBEDDING_DIMENSIONS.
+
+Usage:
+    python -m benchmarks.bench_embedding_dimensions [--vectors 20000]
+"""
+
+import argparse
+import time
+from typing import Dict, List
+
+import faiss
+import numpy as np
+
+from benchmarks.common import HashingEmbeddings, clustered_vectors
+from core.embeddings import truncate_embeddings
+from core.rerank import search_candidates
+from core.vectorstore import create_vectorstore
+
+FULL_DIMENSION = 1536
+DIMENSIONS = (256, 512, 1024, 1536)
+
+
+def run(num_vectors: int, k: int, num_queries: int) -> List[Dict[str, float]]:
+    """Run the embedding dimension benchmark and return one result row per dimension."""
+    vectors = clustered_vectors(num_vectors, FULL_DIMENSION, decay=0.01)
+    noise = np.random.default_rng(1).normal(size=(num_queries, FULL_DIMENSION))
+    queries = truncate_embeddings(vectors[:num_queries] + 0.02 * noise, FULL_DIMENSION)
+    texts = [str(i) for i in range(num_vectors)]
+    metadatas = [{"id": i} for i in range(num_vectors)]
+
+    exact_index = faiss.IndexFlatL2(FULL_DIMENSION)
+    exact_index.add(vectors)
+    _, exact = exact_index.search(queries, k)
+
+    rows = []
+    for dimension in DIMENSIONS:
+        vectorstore = create_vectorstore(
+            texts,
+            truncate_embeddings(vectors, dimension),
+            metadatas,
+            HashingEmbeddings(dimension),
+            storage="float32",
+        )
+        index_bytes = faiss.serialize_index(vectorstore.index).nbytes
+
+        start = time.perf_counter()
+        results = search_candidates(vectorstore, truncate_embeddings(queries, dimension), k)
+        elapsed_ms = (time.perf_counter() - start) * 1000 / num_queries
+
+        recall = np.mean(
+            [
+                len({doc.metadata["id"] for doc in documents} & set(expected)) / k
+                for (documents, _), expected in zip(results, exact)
+            ]
+        )
+        rows.append(
+            {
+                "dimension": dimension,
+                "index_mb": index_bytes / 2**20,
+                f"recall@{k}": float(recall),
+                "ms_per_query": elapsed_ms,
+            }
+        )
+    return rows
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--vectors", type=int, default=20000)
+    parser.add_argument("--k", type=int, default=10)
+    parser.add_argument("--queries", type=int, default=200)
+    args = parser.parse_args()
+
+    for row in run(args.vectors, args.k, args.queries):
+        print(
+            "  ".join(
+                f"{key}={value:.3f}" if isinstance(value, float) else f"{key}={value}"
+                for key, value in row.items()
+            )
+        )
+
+
+if __name__ == "__main__":
+    main()
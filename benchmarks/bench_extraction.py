@@ -0,0 +1,88 @@
+"""Benchmark PDF text extraction backends: pages/s and text fidelity.
+
+Fidelity is the word-level similarity (0..1) of the extracted text to the
+reference text: the generated text for synthetic PDFs, and pdfplumber's
+output for data/sample_contract.pdf.
+
+Usage:
+    python -m benchmarks.bench_extraction [--pages 200] [--table-every 5]
+"""
+
+import argparse
+import tempfile
+import time
+from difflib import SequenceMatcher
+from pathlib import Path
+from typing import Dict, List, Union
+
+from benchmarks.common import synthetic_contract_pdf
+from core.extractors import EXTRACTION_BACKENDS
+from core.ingest import load_pdf
+
+SAMPLE_PDF = Path(__file__).parent.parent / "data" / "sample_contract.pdf"
+
+
+def _fidelity(extracted: List[str], reference: List[str]) -> float:
+    """Average word-level similarity of extracted pages to reference pages."""
+    ratios = [
+        SequenceMatcher(None, text.split(), expected.split(), autojunk=False).ratio()
+        for text, expected in zip(extracted, reference)
+    ]
+    return sum(ratios) / len(ratios) if ratios else 0.0
+
+
+def _measure(pdf_path: Union[str, Path], reference: List[str], repeats: int) -> List[Dict]:
+    """Measure every extraction backend on one PDF."""
+    rows = []
+    for extractor in EXTRACTION_BACKENDS:
+        start = time.perf_counter()
+        for _ in range(repeats):
+            documents = load_pdf(pdf_path, use_cache=False, extractor=extractor)
+        elapsed = time.perf_counter() - start
+        rows.append(
+            {
+                "extractor": extractor,
+                "pages_per_s": len(documents) * repeats / elapsed,
+                "fidelity": _fidelity([doc.page_content for doc in documents], reference),
+            }
+        )
+    return rows
+
+
+def run(num_pages: int, table_every: int, repeats: int) -> List[Dict[str, Union[str, float]]]:
+    """Run the extraction benchmark and return one result row per corpus and backend."""
+    rows = []
+
+    reference = [
+        doc.page_content for doc in load_pdf(SAMPLE_PDF, use_cache=False, extractor="pdfplumber")
+    ]
+    for row in _measure(SAMPLE_PDF, reference, repeats * 10):
+        rows.append({"corpus": "sample_contract", **row})
+
+    with tempfile.TemporaryDirectory() as temp_dir:
+        pdf_path = Path(temp_dir) / "synthetic.pdf"
+        reference = synthetic_contract_pdf(pdf_path, num_pages, table_every)
+        for row in _measure(pdf_path, reference, repeats):
+            rows.append({"corpus": f"synthetic_{num_pages}p", **row})
+
+    return rows
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--pages", type=int, default=200)
+    parser.add_argument("--table-every", type=int, default=5)
+    parser.add_argument("--repeats", type=int, default=1)
+    args = parser.parse_args()
+
+    for row in run(args.pages, args.table_every, args.repeats):
+        print(
+            "  ".join(
+                f"{key}={value:.3f}" if isinstance(value, float) else f"{key}={value}"
+                for key, value in row.items()
+            )
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,142 @@
+"""Benchmark the feedback log: write latency and throughput, and load time.
+
+Simulates concurrent reviewers, each saving feedback entries from its own
+thread. Latency is the time save takes to return (what a reviewer waits for
+after clicking); "sync" matches the previous per-entry fsync behaviour.
+Load time compares reading a history from JSONL with reading it from the
+compacted snapshot. Sidebar cost is the time of the feedback statistics and
+first history page on a rerun, before (cold) and after the log is indexed,
+and after one more entry is saved.
+
+Usage:
+    python -m benchmarks.bench_feedback [--reviewers 16] [--entries 50] [--history 100000]
+"""
+
+import argparse
+import json
+import statistics
+import tempfile
+import threading
+import time
+from pathlib import Path
+from typing import Dict, List, Union
+
+import core.feedback
+from core.feedback_store import read_entries, write_snapshot
+from core.feedback_writer import DURABILITY_LEVELS, FeedbackWriter
+
+ENTRY = {
+    "question": "What are the payment terms?",
+    "answer": "Payment is due within thirty days of the invoice date. " * 4,
+    "rating": "up",
+}
+
+
+def _measure(path: Path, durability: str, reviewers: int, entries: int) -> Dict:
+    """Measure one durability level."""
+    writer = FeedbackWriter(path, durability=durability)
+    latencies: List[float] = []
+    lock = threading.Lock()
+
+    def review(reviewer: int) -> None:
+        for i in range(entries):
+            start = time.perf_counter()
+            writer.append({"id": f"{reviewer}-{i}", **ENTRY})
+            elapsed = time.perf_counter() - start
+            with lock:
+                latencies.append(elapsed)
+
+    threads = [threading.Thread(target=review, args=(r,)) for r in range(reviewers)]
+    start = time.perf_counter()
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    writer.flush()
+    elapsed = time.perf_counter() - start
+
+    latencies.sort()
+    return {
+        "durability": durability,
+        "writes_per_s": len(latencies) / elapsed,
+        "ack_p50_ms": statistics.median(latencies) * 1000,
+        "ack_p95_ms": latencies[int(len(latencies) * 0.95) - 1] * 1000,
+    }
+
+
+def _measure_load(tmp: Path, history: int) -> List[Dict]:
+    """Measure loading a feedback history from JSONL and from the snapshot."""
+    entries = [
+        {"id": str(i), "timestamp": f"2024-01-01T00:00:{i % 60:02d}+00:00", **ENTRY}
+        for i in range(history)
+    ]
+    jsonl_path, snapshot_log = tmp / "history.jsonl", tmp / "compacted.jsonl"
+    with open(jsonl_path, "w", encoding="utf-8") as f:
+        f.writelines(json.dumps(entry) + "\n" for entry in entries)
+    write_snapshot(snapshot_log, entries)
+
+    rows = []
+    for storage, path in (("jsonl", jsonl_path), ("snapshot", snapshot_log)):
+        start = time.perf_counter()
+        loaded = read_entries(path)
+        rows.append(
+            {
+                "storage": storage,
+                "entries": len(loaded),
+                "load_ms": (time.perf_counter() - start) * 1000,
+            }
+        )
+    return rows
+
+
+def _measure_sidebar(tmp: Path, history: int) -> List[Dict]:
+    """Measure the feedback statistics and first history page of a sidebar rerun."""
+    path = tmp / "sidebar.jsonl"
+    with open(path, "w", encoding="utf-8") as f:
+        f.writelines(
+            json.dumps({"id": str(i), "timestamp": f"2024-01-01T{i:09d}", **ENTRY}) + "\n"
+            for i in range(history)
+        )
+    core.feedback.FEEDBACK_FILE_PATH = str(path)
+
+    def rerun() -> float:
+        start = time.perf_counter()
+        core.feedback.get_feedback_stats()
+        core.feedback.load_feedback_page(limit=20)
+        return (time.perf_counter() - start) * 1000
+
+    rows = [{"sidebar": "cold", "entries": history, "rerun_ms": rerun()}]
+    rows.append({"sidebar": "warm", "entries": history, "rerun_ms": rerun()})
+    core.feedback.save_feedback(question="Q", answer="A", rating="up")
+    rows.append({"sidebar": "after_save", "entries": history + 1, "rerun_ms": rerun()})
+    return rows
+
+
+def run(reviewers: int, entries: int, history: int) -> List[Dict[str, Union[str, float]]]:
+    """Run the write, load and sidebar benchmarks."""
+    with tempfile.TemporaryDirectory() as tmp:
+        rows = [
+            _measure(Path(tmp) / f"{durability}.jsonl", durability, reviewers, entries)
+            for durability in DURABILITY_LEVELS
+        ]
+        return rows + _measure_load(Path(tmp), history) + _measure_sidebar(Path(tmp), history)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--reviewers", type=int, default=16)
+    parser.add_argument("--entries", type=int, default=50)
+    parser.add_argument("--history", type=int, default=100_000)
+    args = parser.parse_args()
+
+    for row in run(args.reviewers, args.entries, args.history):
+        print(
+            "  ".join(
+                f"{key}={value:.3f}" if isinstance(value, float) else f"{key}={value}"
+                for key, value in row.items()
+            )
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,105 @@
+"""Benchmark import time of the application entry points.
+
+Imports each module in a fresh interpreter with `python -X importtime` and
+reports its cumulative import time (best of the repeats) together with the
+top-level packages that took longest to import. Heavy dependencies such as
+langchain_openai, faiss and pdfplumber should only appear for entry points
+that need them before doing any work.
+
+Usage:
+    python -m benchmarks.bench_import_time [--repeats 5] [--top 3] [modules ...]
+"""
+
+import argparse
+import re
+import subprocess
+import sys
+from pathlib import Path
+from typing import Dict, List, Sequence, Union
+
+ROOT = Path(__file__).parent.parent
+
+DEFAULT_MODULES = ("app", "core.qa", "core.ner", "cli.ask", "cli.ingest")
+
+# "import time: <self us> | <cumulative us> | <indented module name>"
+_IMPORTTIME_LINE = re.compile(r"import time:\s+\d+ \|\s+(\d+) \| +(\S+)")
+
+
+def _is_project_package(name: str) -> bool:
+    """Whether a top-level name is a package or module of this repository."""
+    return (ROOT / name).is_dir() or (ROOT / f"{name}.py").exists()
+
+
+def profile_import(module: str) -> Dict[str, int]:
+    """Import a module in a fresh interpreter and parse its import-time profile.
+
+    Args:
+        module: Dotted module name, importable from the repository root, or
+                an empty string to profile interpreter startup only.
+
+    Returns:
+        Cumulative import time in microseconds by top-level package (the
+        slowest import of any of its modules), with the module itself under
+        its full name.
+    """
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}" if module else "pass"],
+        cwd=ROOT,
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    packages: Dict[str, int] = {}
+    for match in _IMPORTTIME_LINE.finditer(result.stderr):
+        cumulative, name = int(match.group(1)), match.group(2)
+        key = name if name == module else name.split(".")[0]
+        packages[key] = max(packages.get(key, 0), cumulative)
+    return packages
+
+
+def run(
+    modules: Sequence[str] = DEFAULT_MODULES, repeats: int = 5, top: int = 3
+) -> List[Dict[str, Union[str, float]]]:
+    # Packages imported at interpreter startup are not attributed to modules
+    startup = set(profile_import(""))
+    rows: List[Dict[str, Union[str, float]]] = []
+    for module in modules:
+        profiles = [profile_import(module) for _ in range(repeats)]
+        best = min(profiles, key=lambda profile: profile[module])
+        heaviest = sorted(
+            (
+                name
+                for name in best
+                if name not in startup and name != module and not _is_project_package(name)
+            ),
+            key=best.get,
+            reverse=True,
+        )[:top]
+        rows.append(
+            {
+                "module": module,
+                "import_ms": best[module] / 1000,
+                "heaviest": ",".join(f"{name}:{best[name] / 1000:.0f}ms" for name in heaviest),
+            }
+        )
+    return rows
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("modules", nargs="*", default=list(DEFAULT_MODULES))
+    parser.add_argument("--repeats", type=int, default=5)
+    parser.add_argument("--top", type=int, default=3)
+    args = parser.parse_args()
+
+    for row in run(args.modules, args.repeats, args.top):
+        print(
+            "  ".join(
+                f"{key}={value:.1f}" if isinstance(value, float) else f"{key}={value}"
+                for key, value in row.items()
+            )
+        )
+
+
+if __name__ == "__main__":
+    main()
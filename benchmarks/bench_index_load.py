@@ -0,0 +1,127 @@
+"""Benchmark loading a persisted index: pickled docstore vs chunk store.
+
+Saves the same synthetic index in LangChain's save_local format (index.faiss
+plus pickled index.pkl) and in the save_vectorstore format (index.faiss plus
+chunks.sqlite), then loads each in a fresh process and reports load time,
+resident memory added by the load and the latency of the first search,
+which reads its top-k chunks from the chunk store.
+
+Usage:
+    python -m benchmarks.bench_index_load [--chunks 20000] [--repeats 3]
+"""
+
+import argparse
+import json
+import os
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+from typing import Dict, List, Union
+
+import numpy as np
+
+from benchmarks.common import HashingEmbeddings, clustered_vectors
+from config.settings import EMBEDDING_DIMENSIONS
+
+ROOT = Path(__file__).parent.parent
+
+CHUNK_TEXT = (
+    "The Supplier shall deliver the services described in Schedule 1 in accordance with the "
+    "service levels, and the Customer shall pay the fees within thirty days of invoice. "
+) * 6
+
+
+def _save_indexes(num_chunks: int, directory: Path) -> None:
+    """Save the benchmark index in the legacy and chunk store formats."""
+    from core.vectorstore import create_vectorstore, save_vectorstore
+
+    vectors = clustered_vectors(num_chunks, EMBEDDING_DIMENSIONS)
+    texts = [f"{i}: {CHUNK_TEXT}" for i in range(num_chunks)]
+    metadatas = [{"page": i // 4 + 1, "source": "contract.pdf"} for i in range(num_chunks)]
+    vectorstore = create_vectorstore(
+        texts, vectors, metadatas, HashingEmbeddings(EMBEDDING_DIMENSIONS), storage="float32"
+    )
+    vectorstore.save_local(str(directory / "legacy"))
+    save_vectorstore(vectorstore, directory / "chunk_store")
+
+
+def _resident_mb() -> float:
+    """Get the current resident memory of the process in MiB (Linux)."""
+    with open("/proc/self/statm") as f:
+        return int(f.read().split()[1]) * os.sysconf("SC_PAGE_SIZE") / 2**20
+
+
+def _load_in_child(path: Path) -> Dict[str, float]:
+    """Load an index and run one search, measuring time and resident memory."""
+    from core.rerank import search_candidates
+    from core.vectorstore import load_vectorstore
+
+    query = clustered_vectors(1, EMBEDDING_DIMENSIONS, seed=1)
+    rss_before = _resident_mb()
+    start = time.perf_counter()
+    vectorstore = load_vectorstore(path)
+    loaded = time.perf_counter()
+    rss_after = _resident_mb()
+    search_candidates(vectorstore, query, k=5, rescore_candidates=0)
+    searched = time.perf_counter()
+    return {
+        "load_ms": (loaded - start) * 1000,
+        "rss_mb": rss_after - rss_before,
+        "first_search_ms": (searched - loaded) * 1000,
+    }
+
+
+def run(num_chunks: int, repeats: int) -> List[Dict[str, Union[str, float]]]:
+    """Run the index load benchmark and return one result row per format."""
+    rows: List[Dict[str, Union[str, float]]] = []
+    with tempfile.TemporaryDirectory() as directory:
+        _save_indexes(num_chunks, Path(directory))
+        for name in ("legacy", "chunk_store"):
+            path = Path(directory) / name
+            size_mb = sum(file.stat().st_size for file in path.iterdir()) / 2**20
+            results = [
+                json.loads(
+                    subprocess.run(
+                        [sys.executable, "-m", "benchmarks.bench_index_load", "--child", str(path)],
+                        cwd=ROOT,
+                        capture_output=True,
+                        text=True,
+                        check=True,
+                    ).stdout.splitlines()[-1]
+                )
+                for _ in range(repeats)
+            ]
+            rows.append(
+                {
+                    "format": name,
+                    "size_mb": size_mb,
+                    **{key: float(np.median([r[key] for r in results])) for key in results[0]},
+                }
+            )
+    return rows
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--chunks", type=int, default=20000)
+    parser.add_argument("--repeats", type=int, default=3)
+    parser.add_argument("--child", type=Path, help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.child:
+        print(json.dumps(_load_in_child(args.child)))
+        return
+
+    for row in run(args.chunks, args.repeats):
+        print(
+            "  ".join(
+                f"{key}={value:.3f}" if isinstance(value, float) else f"{key}={value}"
+                for key, value in row.items()
+            )
+        )
+
+
+if __name__ == "__main__":
+    main()
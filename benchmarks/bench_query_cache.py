@@ -0,0 +1,97 @@
+"""Benchmark question embedding with and without the query embedding cache.
+
+Embeds the prefilled questions with an embedder that sleeps for a simulated
+API round trip per request, and reports the requests made and the total
+time for: one request per question (the retriever's embed_query), one
+embed_queries call for all questions, and the same call again with the
+in-process cache warm and with only the database warm (a new process).
+
+Usage:
+    python -m benchmarks.bench_query_cache [--latency-ms 150] [--repeat 3]
+"""
+
+import argparse
+import tempfile
+import time
+from pathlib import Path
+from typing import Callable, Dict, List, Union
+
+from langchain_core.embeddings import Embeddings
+
+import core.query_cache
+from benchmarks.common import HashingEmbeddings
+from config.settings import PREFILLED_QUESTIONS
+from core.query_cache import clear_query_cache, embed_queries
+
+
+class SlowEmbeddings(Embeddings):
+    """Hashing embeddings sleeping for a simulated round trip per request."""
+
+    def __init__(self, latency_s: float) -> None:
+        self.latency_s = latency_s
+        self.requests = 0
+        self._embeddings = HashingEmbeddings()
+
+    def embed_documents(self, texts: List[str]) -> List[List[float]]:
+        self.requests += 1
+        time.sleep(self.latency_s)
+        return self._embeddings.embed_documents(texts)
+
+    def embed_query(self, text: str) -> List[float]:
+        return self.embed_documents([text])[0]
+
+
+def _measure(
+    name: str, embed: Callable[[SlowEmbeddings], object], embeddings: SlowEmbeddings
+) -> Dict[str, Union[str, int, float]]:
+    """Time one embedding pass and count the requests it made."""
+    requests = embeddings.requests
+    start = time.perf_counter()
+    embed(embeddings)
+    return {
+        "mode": name,
+        "requests": embeddings.requests - requests,
+        "total_ms": (time.perf_counter() - start) * 1000,
+    }
+
+
+def run(latency_ms: float, repeat: int) -> List[Dict[str, Union[str, int, float]]]:
+    """Run the query cache benchmark and return one result row per mode."""
+    # Asked repeatedly, as the quick questions are across sessions
+    questions = list(PREFILLED_QUESTIONS) * repeat
+    embeddings = SlowEmbeddings(latency_ms / 1000)
+
+    with tempfile.TemporaryDirectory() as directory:
+        core.query_cache.QUERY_CACHE_PATH = str(Path(directory) / "query_cache.sqlite3")
+        clear_query_cache()
+        rows = [
+            _measure(
+                "per_question",
+                lambda e: [e.embed_query(question) for question in questions],
+                embeddings,
+            ),
+            _measure("batch_cold", lambda e: embed_queries(e, questions), embeddings),
+            _measure("batch_memory", lambda e: embed_queries(e, questions), embeddings),
+        ]
+        clear_query_cache()
+        rows.append(_measure("batch_database", lambda e: embed_queries(e, questions), embeddings))
+    return rows
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--latency-ms", type=float, default=150.0)
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    for row in run(args.latency_ms, args.repeat):
+        print(
+            "  ".join(
+                f"{key}={value:.1f}" if isinstance(value, float) else f"{key}={value}"
+                for key, value in row.items()
+            )
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,72 @@
+"""Benchmark retrieval quality and latency of rerankers versus plain top-k.
+
+Usage:
+    python -m benchmarks.bench_rerank [--chunks 2000] [--k 3]
+"""
+
+import argparse
+import statistics
+import time
+from typing import Dict, List
+
+from langchain_community.vectorstores import FAISS
+
+import core.query_cache
+from benchmarks.common import HashingEmbeddings, synthetic_corpus
+from core.query_cache import clear_query_cache
+from core.rerank import retrieve_documents
+
+
+def run(num_chunks: int, k: int, num_questions: int) -> List[Dict[str, float]]:
+    """Run the reranking benchmark and return one result row per method."""
+    chunks, questions = synthetic_corpus(num_chunks)
+    for i, chunk in enumerate(chunks):
+        chunk.metadata["chunk_id"] = i
+    vectorstore = FAISS.from_documents(chunks, HashingEmbeddings())
+    questions = questions[:num_questions]
+    # Every method embeds the questions itself; nothing is written to data/
+    core.query_cache.QUERY_CACHE_PATH = ""
+
+    rows = []
+    for method in ("none", "lexical", "mmr"):
+        clear_query_cache()
+        latencies, hits, reciprocal_ranks = [], 0, []
+        for question, relevant in questions:
+            start = time.perf_counter()
+            documents = retrieve_documents(vectorstore, question, k=k, method=method)
+            latencies.append((time.perf_counter() - start) * 1000)
+
+            ids = [doc.metadata["chunk_id"] for doc in documents]
+            hits += relevant in ids
+            reciprocal_ranks.append(1 / (ids.index(relevant) + 1) if relevant in ids else 0.0)
+
+        rows.append(
+            {
+                "method": method,
+                f"recall@{k}": hits / len(questions),
+                "mrr": statistics.mean(reciprocal_ranks),
+                "p50_ms": statistics.median(latencies),
+                "p95_ms": statistics.quantiles(latencies, n=20)[-1],
+            }
+        )
+    return rows
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--chunks", type=int, default=2000)
+    parser.add_argument("--k", type=int, default=3)
+    parser.add_argument("--questions", type=int, default=200)
+    args = parser.parse_args()
+
+    for row in run(args.chunks, args.k, args.questions):
+        print(
+            "  ".join(
+                f"{key}={value:.3f}" if isinstance(value, float) else f"{key}={value}"
+                for key, value in row.items()
+            )
+        )
+
+
+if __name__ == "__main__":
+    main()
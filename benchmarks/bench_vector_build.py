@@ -0,0 +1,118 @@
+"""Benchmark build time and peak memory of indexing embedded chunks.
+
+Compares the LangChain list path (embeddings decoded to lists of Python
+floats, converted to an array, then back to lists for FAISS.add_embeddings)
+with the float32 array path of core.vectorstore.build_vectorstore. The
+embedder replays base64 float32 payloads as returned by the OpenAI API, so
+decoding is included but no network time. Peak memory is the peak of Python
+and NumPy allocations traced by tracemalloc; FAISS's own index memory is the
+same for both paths and not included.
+
+Usage:
+    python -m benchmarks.bench_vector_build [--chunks 10000] [--dim 1536] [--repeats 3]
+"""
+
+import argparse
+import base64
+import time
+import tracemalloc
+from typing import Callable, Dict, List
+
+import numpy as np
+from langchain_community.docstore.in_memory import InMemoryDocstore
+from langchain_community.vectorstores import FAISS
+from langchain_core.documents import Document
+from langchain_core.embeddings import Embeddings
+
+from benchmarks.common import clustered_vectors
+from core.vectorstore import _create_index, build_vectorstore
+
+
+class Base64Embeddings(Embeddings):
+    """Embeddings replaying base64 float32 payloads, as sent by the OpenAI API."""
+
+    def __init__(self, texts: List[str], dimension: int) -> None:
+        vectors = clustered_vectors(len(texts), dimension)
+        self.payloads = {
+            text: base64.b64encode(vector.tobytes()).decode()
+            for text, vector in zip(texts, vectors)
+        }
+
+    def embed_documents(self, texts: List[str]) -> List[List[float]]:
+        # What the OpenAI SDK and LangChain return: a list of floats per text
+        return [
+            np.frombuffer(base64.b64decode(self.payloads[text]), dtype=np.float32).tolist()
+            for text in texts
+        ]
+
+    def embed_query(self, text: str) -> List[float]:
+        return self.embed_documents([text])[0]
+
+    def embed_documents_array(self, texts: List[str]) -> np.ndarray:
+        buffers = [base64.b64decode(self.payloads[text]) for text in texts]
+        return np.frombuffer(bytearray().join(buffers), dtype=np.float32).reshape(len(texts), -1)
+
+
+def build_with_lists(documents: List[Document], embeddings: Embeddings) -> FAISS:
+    """Index documents through embed_documents lists and FAISS.add_embeddings."""
+    texts = [document.page_content for document in documents]
+    vectors = np.asarray(embeddings.embed_documents(texts), dtype=np.float32)
+    vectorstore = FAISS(
+        embedding_function=embeddings,
+        index=_create_index(vectors, "float32"),
+        docstore=InMemoryDocstore(),
+        index_to_docstore_id={},
+    )
+    vectorstore.add_embeddings(
+        list(zip(texts, vectors.tolist())), [document.metadata for document in documents]
+    )
+    return vectorstore
+
+
+def _measure(build: Callable[[], FAISS], repeats: int) -> Dict[str, float]:
+    """Measure the best build time and the traced peak memory of a build."""
+    seconds = []
+    for _ in range(repeats):
+        start = time.perf_counter()
+        build()
+        seconds.append(time.perf_counter() - start)
+
+    tracemalloc.start()
+    build()
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return {"build_s": min(seconds), "peak_mb": peak / 2**20}
+
+
+def run(num_chunks: int, dimension: int, repeats: int) -> List[Dict[str, float]]:
+    """Run the build benchmark and return one result row per path."""
+    documents = [
+        Document(page_content=f"Chunk {i} of the contract.", metadata={"page": i // 4 + 1})
+        for i in range(num_chunks)
+    ]
+    embeddings = Base64Embeddings([document.page_content for document in documents], dimension)
+
+    return [
+        {"path": "lists", **_measure(lambda: build_with_lists(documents, embeddings), repeats)},
+        {"path": "arrays", **_measure(lambda: build_vectorstore(documents, embeddings), repeats)},
+    ]
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--chunks", type=int, default=10000)
+    parser.add_argument("--dim", type=int, default=1536)
+    parser.add_argument("--repeats", type=int, default=3)
+    args = parser.parse_args()
+
+    for row in run(args.chunks, args.dim, args.repeats):
+        print(
+            "  ".join(
+                f"{key}={value:.3f}" if isinstance(value, float) else f"{key}={value}"
+                for key, value in row.items()
+            )
+        )
+
+
+if __name__ == "__main__":
+    main()
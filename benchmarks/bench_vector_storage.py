@@ -0,0 +1,88 @@
+"""Benchmark memory, recall and latency of float32/float16/int8 vector storage.
+
+Recall@k is measured against exact float32 search, with and without rescoring
+the top candidates using full-precision vectors. Storage counts the serialized
+index plus the float32 copy of the vectors (vectors.npy) kept for rescoring.
+
+Usage:
+    python -m benchmarks.bench_vector_storage [--vectors 20000] [--dim 1536]
+"""
+
+import argparse
+import time
+from typing import Dict, List
+
+import faiss
+import numpy as np
+
+import core.vectorstore
+from benchmarks.common import HashingEmbeddings, clustered_vectors
+from core.rerank import search_candidates
+from core.vectorstore import create_vectorstore
+
+
+def run(num_vectors: int, dimension: int, k: int, num_queries: int) -> List[Dict[str, float]]:
+    """Run the vector storage benchmark and return one result row per configuration."""
+    vectors = clustered_vectors(num_vectors, dimension)
+    queries = vectors[:num_queries] + 0.05 * np.random.default_rng(1).normal(
+        size=(num_queries, dimension)
+    ).astype(np.float32)
+    texts = [str(i) for i in range(num_vectors)]
+    metadatas = [{"id": i} for i in range(num_vectors)]
+    embeddings = HashingEmbeddings(dimension)
+
+    exact_index = faiss.IndexFlatL2(dimension)
+    exact_index.add(vectors)
+    _, exact = exact_index.search(queries, k)
+
+    rows = []
+    for storage in ("float32", "float16", "int8"):
+        for rescore in (0, 50) if storage != "float32" else (0,):
+            core.vectorstore.VECTOR_RESCORE_CANDIDATES = rescore
+            vectorstore = create_vectorstore(texts, vectors, metadatas, embeddings, storage=storage)
+            index_bytes = faiss.serialize_index(vectorstore.index).nbytes
+            full_vectors = getattr(vectorstore, "full_vectors", None)
+            full_vectors_bytes = full_vectors.nbytes if full_vectors is not None else 0
+
+            start = time.perf_counter()
+            results = search_candidates(vectorstore, queries, k, rescore_candidates=rescore)
+            elapsed_ms = (time.perf_counter() - start) * 1000 / num_queries
+
+            recall = np.mean(
+                [
+                    len({doc.metadata["id"] for doc in documents} & set(expected)) / k
+                    for (documents, _), expected in zip(results, exact)
+                ]
+            )
+            rows.append(
+                {
+                    "storage": storage,
+                    "rescore": rescore,
+                    "index_mb": index_bytes / 2**20,
+                    "storage_mb": (index_bytes + full_vectors_bytes) / 2**20,
+                    f"recall@{k}": float(recall),
+                    "ms_per_query": elapsed_ms,
+                }
+            )
+    return rows
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--vectors", type=int, default=20000)
+    parser.add_argument("--dim", type=int, default=1536)
+    parser.add_argument("--k", type=int, default=10)
+    parser.add_argument("--queries", type=int, default=200)
+    args = parser.parse_args()
+
+    for row in run(args.vectors, args.dim, args.k, args.queries):
+        print(
+            "  ".join(
+                f"{key}={value:.3f}" if isinstance(value, float) else f"{key}={value}"
+                for key, value in row.items()
+            )
+        )
+
+
+if __name__ == "__main__":
+    main()
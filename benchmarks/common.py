@@ -0,0 +1,243 @@
+"""Shared helpers for benchmarks: synthetic contract corpora and offline embeddings.
+
+Benchmarks must run without an OpenAI API key, so they use a deterministic
+hashing bag-of-words embedding that preserves lexical similarity between
+texts. Absolute quality numbers are therefore only meaningful relative to
+each other within a benchmark run.
+"""
+
+import random
+import re
+import textwrap
+import zlib
+from pathlib import Path
+from typing import List, Optional, Sequence, Tuple, Union
+
+import numpy as np
+from langchain_core.documents import Document
+from langchain_core.embeddings import Embeddings
+
+_WORD_PATTERN = re.compile(r"[a-z0-9]+")
+
+_SUBJECTS = [
+    "payment", "termination", "confidentiality", "indemnification", "warranty",
+    "liability", "insurance", "assignment", "notices", "audit", "delivery",
+    "acceptance", "intellectual property", "non-solicitation", "force majeure",
+    "governing law", "dispute resolution", "renewal", "pricing", "data protection",
+]  # fmt: skip
+
+_PARTIES = ["Supplier", "Customer", "Licensor", "Licensee", "Contractor", "Company"]
+
+_FILLER = (
+    "The parties acknowledge that this section shall be read together with the "
+    "schedules and exhibits attached hereto and any amendments agreed in writing."
+)
+
+
+class HashingEmbeddings(Embeddings):
+    """Deterministic offline embeddings using the hashing trick over words."""
+
+    def __init__(self, dimension: int = 1536) -> None:
+        self.dimension = dimension
+
+    def _embed(self, text: str) -> List[float]:
+        vector = np.zeros(self.dimension, dtype=np.float32)
+        for word in _WORD_PATTERN.findall(text.lower()):
+            vector[zlib.crc32(word.encode()) % self.dimension] += 1.0
+        norm = np.linalg.norm(vector)
+        if norm > 0:
+            vector /= norm
+        return vector.tolist()
+
+    def embed_documents(self, texts: List[str]) -> List[List[float]]:
+        return [self._embed(text) for text in texts]
+
+    def embed_query(self, text: str) -> List[float]:
+        return self._embed(text)
+
+
+def synthetic_corpus(
+    num_chunks: int, seed: int = 0
+) -> Tuple[List[Document], List[Tuple[str, int]]]:
+    """Generate synthetic contract chunks and questions with known answers.
+
+    Args:
+        num_chunks: Number of chunks to generate.
+        seed: Random seed for reproducibility.
+
+    Returns:
+        Tuple of (chunks, list of (question, index of the relevant chunk)).
+    """
+    rng = random.Random(seed)
+    chunks: List[Document] = []
+    questions: List[Tuple[str, int]] = []
+
+    for i in range(num_chunks):
+        subject = rng.choice(_SUBJECTS)
+        party = rng.choice(_PARTIES)
+        days = rng.randint(5, 120)
+        amount = rng.randint(1, 500) * 1000
+        code = f"clause{i}"
+        text = (
+            f"Section {i} {subject.title()} ({code}). The {party} shall comply with the "
+            f"{subject} obligations within {days} days, subject to a cap of ${amount:,}. "
+            f"{_FILLER}"
+        )
+        chunks.append(Document(page_content=text, metadata={"page": i // 4 + 1}))
+        questions.append(
+            (f"How many days does the {party} have for {subject} under the ${amount:,} cap?", i)
+        )
+
+    return chunks, questions
+
+
+def clustered_vectors(count: int, dimension: int, seed: int = 0, decay: float = 0.0) -> np.ndarray:
+    """Generate unit-normalized vectors grouped around random topic centroids.
+
+    Args:
+        count: Number of vectors.
+        dimension: Vector dimension.
+        seed: Random seed for reproducibility.
+        decay: If positive, component i is scaled by 1 / (1 + i * decay) so that
+               leading dimensions carry most of the signal, mimicking
+               Matryoshka-trained embeddings.
+
+    Returns:
+        Float32 array of shape (count, dimension).
+    """
+    rng = np.random.default_rng(seed)
+    centroids = rng.normal(size=(max(count // 50, 1), dimension)).astype(np.float32)
+    vectors = centroids[rng.integers(len(centroids), size=count)]
+    vectors = vectors + 0.5 * rng.normal(size=(count, dimension)).astype(np.float32)
+    if decay > 0:
+        vectors = vectors / (1 + np.arange(dimension, dtype=np.float32) * decay)
+    return vectors / np.linalg.norm(vectors, axis=1, keepdims=True)
+
+
+# Page layout of generated PDFs, in points
+_PAGE_WIDTH, _PAGE_HEIGHT = 612, 792
+_MARGIN, _LINE_HEIGHT, _FONT_SIZE = 50, 12, 9
+_LINES_PER_PAGE = 55
+_TABLE_COLUMN_WIDTH, _TABLE_ROW_HEIGHT = 128, 16
+
+
+def _pdf_string(text: str) -> str:
+    """Escape text for a PDF literal string."""
+    return "(" + text.replace("\\", "\\\\").replace("(", "\\(").replace(")", "\\)") + ")"
+
+
+def _page_stream(lines: Sequence[str], table: Optional[Sequence[Sequence[str]]]) -> bytes:
+    """Build the content stream of a page with text lines and an optional ruled table."""
+    top = _PAGE_HEIGHT - _MARGIN
+    ops = [f"BT /F1 {_FONT_SIZE} Tf {_LINE_HEIGHT} TL {_MARGIN} {top} Td"]
+    ops += [f"{_pdf_string(line)} Tj T*" for line in lines]
+    ops.append("ET")
+
+    if table:
+        columns = len(table[0])
+        table_top = top - (len(lines) + 1) * _LINE_HEIGHT
+        right = _MARGIN + columns * _TABLE_COLUMN_WIDTH
+        for r in range(len(table) + 1):
+            y = table_top - r * _TABLE_ROW_HEIGHT
+            ops.append(f"{_MARGIN} {y} m {right} {y} l S")
+        bottom = table_top - len(table) * _TABLE_ROW_HEIGHT
+        for c in range(columns + 1):
+            x = _MARGIN + c * _TABLE_COLUMN_WIDTH
+            ops.append(f"{x} {table_top} m {x} {bottom} l S")
+        for r, row in enumerate(table):
+            y = table_top - (r + 1) * _TABLE_ROW_HEIGHT + 5
+            for c, cell in enumerate(row):
+                x = _MARGIN + c * _TABLE_COLUMN_WIDTH + 4
+                ops.append(f"BT /F1 {_FONT_SIZE} Tf {x} {y} Td {_pdf_string(cell)} Tj ET")
+
+    return "\n".join(ops).encode("latin-1")
+
+
+def write_text_pdf(
+    path: Union[str, Path],
+    pages: Sequence[Sequence[str]],
+    tables: Optional[Sequence[Optional[Sequence[Sequence[str]]]]] = None,
+) -> None:
+    """Write a minimal PDF with Helvetica text lines and optional ruled tables.
+
+    Args:
+        path: Output file path.
+        pages: Text lines of each page.
+        tables: Optional table (list of rows of cell texts) drawn below the
+                text of each page, None for pages without a table.
+    """
+    tables = tables or [None] * len(pages)
+    objects = [
+        b"<< /Type /Catalog /Pages 2 0 R >>",
+        None,  # Page tree, filled in once the page object numbers are known
+        b"<< /Type /Font /Subtype /Type1 /BaseFont /Helvetica /Encoding /WinAnsiEncoding >>",
+    ]
+    page_refs = []
+    for lines, table in zip(pages, tables):
+        stream = _page_stream(lines, table)
+        objects.append(b"<< /Length %d >>\nstream\n%s\nendstream" % (len(stream), stream))
+        objects.append(
+            b"<< /Type /Page /Parent 2 0 R /MediaBox [0 0 %d %d] "
+            b"/Resources << /Font << /F1 3 0 R >> >> /Contents %d 0 R >>"
+            % (_PAGE_WIDTH, _PAGE_HEIGHT, len(objects))
+        )
+        page_refs.append(b"%d 0 R" % len(objects))
+    objects[1] = b"<< /Type /Pages /Kids [%s] /Count %d >>" % (b" ".join(page_refs), len(pages))
+
+    output = bytearray(b"%PDF-1.4\n")
+    offsets = []
+    for number, body in enumerate(objects, start=1):
+        offsets.append(len(output))
+        output += b"%d 0 obj\n%s\nendobj\n" % (number, body)
+    xref = len(output)
+    output += b"xref\n0 %d\n0000000000 65535 f \n" % (len(objects) + 1)
+    output += b"".join(b"%010d 00000 n \n" % offset for offset in offsets)
+    output += b"trailer\n<< /Size %d /Root 1 0 R >>\nstartxref\n%d\n%%%%EOF\n" % (
+        len(objects) + 1,
+        xref,
+    )
+    Path(path).write_bytes(bytes(output))
+
+
+def synthetic_contract_pdf(
+    path: Union[str, Path], num_pages: int, table_every: int = 0, seed: int = 0
+) -> List[str]:
+    """Write a synthetic contract PDF and return the text of each page.
+
+    Args:
+        path: Output file path.
+        num_pages: Number of pages.
+        table_every: If positive, every table_every-th page also carries a
+                     ruled payment schedule table.
+        seed: Random seed for reproducibility.
+
+    Returns:
+        Ground-truth text of each page (text lines, then table rows with
+        cells separated by spaces).
+    """
+    rng = random.Random(seed)
+    chunks, _ = synthetic_corpus(num_pages * 6, seed)
+    pages: List[List[str]] = []
+    tables: List[Optional[List[List[str]]]] = []
+    texts: List[str] = []
+
+    for page in range(num_pages):
+        text = " ".join(chunk.page_content for chunk in chunks[page * 6 : page * 6 + 6])
+        has_table = table_every > 0 and page % table_every == 0
+        lines = textwrap.wrap(text, 110)[: _LINES_PER_PAGE - (12 if has_table else 0)]
+        table = None
+        if has_table:
+            table = [["Milestone", "Due date", "Amount"]] + [
+                [
+                    f"Milestone {m}",
+                    f"2025-{m:02d}-{rng.randint(1, 28):02d}",
+                    f"${rng.randint(1, 90)},000",
+                ]
+                for m in range(1, 9)
+            ]
+        pages.append(lines)
+        tables.append(table)
+        texts.append("\n".join(lines + [" ".join(row) for row in table or []]))
+
+    write_text_pdf(path, pages, tables)
+    return texts
@@ -0,0 +1,122 @@
+"""Command-line entry point for answering a checklist of questions.
+
+Usage:
+    python -m cli.ask questions.txt --output results.jsonl
+    python -m cli.ask questions.txt --pdf contract.pdf --output results.csv
+
+Questions are read one per line (blank lines and lines starting with '#' are
+ignored). Results are written as JSONL or CSV depending on the output suffix.
+"""
+
+import argparse
+import csv
+import json
+import sys
+import time
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, Dict, List, Optional, Tuple
+
+from core.qa import answer_questions
+from core.usage import format_llm_usage, get_llm_usage
+
+if TYPE_CHECKING:
+    from langchain_community.vectorstores import FAISS
+
+
+def read_questions(path: Path) -> List[str]:
+    """Read questions from a text file, one per line.
+
+    Args:
+        path: Path to the questions file, or '-' for standard input.
+
+    Returns:
+        List of non-empty questions.
+    """
+    text = sys.stdin.read() if str(path) == "-" else path.read_text(encoding="utf-8")
+    lines = [line.strip() for line in text.splitlines()]
+    return [line for line in lines if line and not line.startswith("#")]
+
+
+def write_results(results: List[Dict[str, Any]], output_path: Path) -> None:
+    """Write batch results to a JSONL or CSV file.
+
+    Args:
+        results: Results returned by answer_questions.
+        output_path: Destination file; '.csv' selects CSV, anything else JSONL.
+    """
+    output_path.parent.mkdir(parents=True, exist_ok=True)
+
+    if output_path.suffix.lower() == ".csv":
+        with open(output_path, "w", encoding="utf-8", newline="") as f:
+            writer = csv.writer(f)
+            writer.writerow(["question", "answer", "pages", "error"])
+            for result in results:
+                pages = ";".join(str(source["page"]) for source in result["sources"])
+                writer.writerow(
+                    [result["question"], result["answer"] or "", pages, result["error"] or ""]
+                )
+        return
+
+    with open(output_path, "w", encoding="utf-8") as f:
+        for result in results:
+            f.write(json.dumps(result, ensure_ascii=False) + "\n")
+
+
+def _load_vectorstore(pdf: Optional[Path], index: Optional[Path]) -> Tuple["FAISS", Optional[str]]:
+    """Build a vector store from a PDF or load a persisted one.
+
+    Returns:
+        Tuple of (vector store, content hash of the PDF or None for a
+        persisted index, which may hold several documents).
+    """
+    # Imported once the arguments are valid, keeping --help and usage errors fast
+    from core.chunking import chunk_documents
+    from core.ingest import compute_file_hash, load_pdf
+    from core.vectorstore import build_vectorstore, load_vectorstore
+
+    if pdf is None:
+        return load_vectorstore(index), None
+    return build_vectorstore(chunk_documents(load_pdf(pdf))), compute_file_hash(pdf)
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    """Run the batch question answering command."""
+    parser = argparse.ArgumentParser(description="Answer a checklist of contract questions.")
+    parser.add_argument("questions", type=Path, help="Questions file (one per line) or '-'")
+    parser.add_argument("--output", type=Path, default=Path("results.jsonl"))
+    source = parser.add_mutually_exclusive_group()
+    source.add_argument("--pdf", type=Path, help="Contract PDF to index before answering")
+    source.add_argument("--index", type=Path, help="Persisted FAISS index directory")
+    parser.add_argument("--concurrency", type=int, default=None, help="Max concurrent LLM calls")
+    args = parser.parse_args(argv)
+
+    questions = read_questions(args.questions)
+    if not questions:
+        print("No questions to answer.", file=sys.stderr)
+        return 1
+
+    try:
+        vectorstore, doc_hash = _load_vectorstore(args.pdf, args.index)
+        start = time.perf_counter()
+        results = answer_questions(
+            vectorstore, questions, max_concurrency=args.concurrency, doc_hash=doc_hash
+        )
+    except RuntimeError as e:
+        print(f"Error: {e}", file=sys.stderr)
+        return 1
+    elapsed = time.perf_counter() - start
+
+    write_results(results, args.output)
+    failed = sum(1 for result in results if result["error"])
+    print(
+        f"Answered {len(results) - failed}/{len(results)} questions in {elapsed:.1f}s "
+        f"-> {args.output}",
+        file=sys.stderr,
+    )
+    for line in format_llm_usage(get_llm_usage()):
+        print(f"LLM usage {line}", file=sys.stderr)
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,42 @@
+"""Command-line entry point for bulk ingestion of a directory of PDFs.
+
+Usage:
+    python -m cli.ingest contracts/ [--index data/faiss_index] [--workers 4]
+
+Files whose content hash is already recorded in the index manifest are skipped.
+"""
+
+import argparse
+import sys
+from pathlib import Path
+from typing import List, Optional
+
+from core.bulk_ingest import ingest_directory
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    """Run the bulk ingestion command."""
+    parser = argparse.ArgumentParser(description="Index a directory of PDF contracts.")
+    parser.add_argument("directory", type=Path, help="Directory searched recursively for PDFs")
+    parser.add_argument("--index", type=Path, default=None, help="FAISS index directory")
+    parser.add_argument("--workers", type=int, default=None, help="Worker processes")
+    parser.add_argument("--batch-size", type=int, default=None, help="Chunks per embedding call")
+    args = parser.parse_args(argv)
+
+    stats = ingest_directory(args.directory, args.index, args.workers, args.batch_size)
+
+    seconds = max(stats["seconds"], 1e-9)
+    print(
+        f"Indexed {stats['files']} files ({stats['skipped']} already indexed, "
+        f"{stats['failed']} failed): {stats['pages']} pages, {stats['chunks']} chunks "
+        f"in {stats['seconds']:.1f}s"
+    )
+    print(
+        f"Throughput: {stats['pages'] / seconds:.1f} pages/s, "
+        f"{stats['chunks'] / seconds:.1f} chunks/s"
+    )
+    return 1 if stats["failed"] else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
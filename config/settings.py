@@ -23,6 +23,10 @@ LLM_MODEL: str = os.getenv("LLM_MODEL", "gpt-4o-mini")
 # Embedding model name for creating vector embeddings
 EMBEDDING_MODEL: str = os.getenv("EMBEDDING_MODEL", "text-embedding-3-small")
 
+# Embedding vector dimension; text-embedding-3 models support shortened outputs
+# (e.g. 256, 512 or 1024) with some loss of retrieval quality
+EMBEDDING_DIMENSIONS: int = int(os.getenv("EMBEDDING_DIMENSIONS", "1536"))
+
 
 # Text chunking configuration
 # Size of each text chunk in characters
@@ -32,19 +36,110 @@ CHUNK_SIZE: int = int(os.getenv("CHUNK_SIZE", "800"))
 CHUNK_OVERLAP: int = int(os.getenv("CHUNK_OVERLAP", "150"))
 
 
+# Retrieval and context assembly configuration
+# Number of candidate chunks retrieved from the vector store per question
+RETRIEVAL_CANDIDATES: int = int(os.getenv("RETRIEVAL_CANDIDATES", "10"))
+
+# Maximum number of tokens of retrieved context placed into the QA prompt
+CONTEXT_TOKEN_BUDGET: int = int(os.getenv("CONTEXT_TOKEN_BUDGET", "1500"))
+
+# Reranking strategy applied to retrieved candidates ("none", "lexical" or "mmr")
+RERANKER: str = os.getenv("RERANKER", "lexical")
+
+# Number of candidates fetched from the vector store before reranking
+RERANK_CANDIDATES: int = int(os.getenv("RERANK_CANDIDATES", "30"))
+
+# Time budget for reranking in milliseconds; remaining candidates keep vector order
+RERANK_TIME_BUDGET_MS: float = float(os.getenv("RERANK_TIME_BUDGET_MS", "20"))
+
+# Weight of lexical overlap versus vector similarity in lexical reranking (0..1)
+LEXICAL_WEIGHT: float = float(os.getenv("LEXICAL_WEIGHT", "0.5"))
+
+# Relevance/diversity trade-off for MMR reranking (1 = relevance only)
+MMR_LAMBDA: float = float(os.getenv("MMR_LAMBDA", "0.7"))
+
+# Maximum number of concurrent LLM calls when answering a batch of questions
+QA_BATCH_CONCURRENCY: int = int(os.getenv("QA_BATCH_CONCURRENCY", "8"))
+
+# Maximum number of concurrent LLM calls across all async question answering requests
+LLM_MAX_CONCURRENCY: int = int(os.getenv("LLM_MAX_CONCURRENCY", "8"))
+
+
 # Vector store configuration
 # Path where the FAISS vector store index will be saved and loaded from
 FAISS_INDEX_PATH: str = os.getenv("FAISS_INDEX_PATH", "data/faiss_index")
 
+# Storage format for index vectors ("float32", "float16" or "int8")
+VECTOR_STORAGE: str = os.getenv("VECTOR_STORAGE", "float32")
+
+# Number of compact-index candidates rescored with full-precision vectors (0 disables).
+# Rescoring keeps a float32 copy of every vector next to the compact index.
+VECTOR_RESCORE_CANDIDATES: int = int(os.getenv("VECTOR_RESCORE_CANDIDATES", "0"))
+
+# Memory-map persisted FAISS indexes on load instead of reading them into memory ("true"/"false")
+VECTOR_INDEX_MMAP: bool = os.getenv("VECTOR_INDEX_MMAP", "true").lower() == "true"
+
+# Number of chunks embedded per request during bulk ingestion
+EMBEDDING_BATCH_SIZE: int = int(os.getenv("EMBEDDING_BATCH_SIZE", "256"))
+
 
 # PDF processing configuration
 # Temporary path for uploaded PDF files
 PDF_TEMP_PATH: str = os.getenv("PDF_TEMP_PATH", "data/temp.pdf")
 
+# PDF text extraction backend ("auto", "pdfium" or "pdfplumber"); "auto" uses the fast
+# pdfium text layer and falls back to pdfplumber layout analysis for table-like pages
+PDF_EXTRACTOR: str = os.getenv("PDF_EXTRACTOR", "auto")
+
+# Render tables detected by pdfplumber as Markdown chunks ("true"/"false"); only pages
+# with ruling lines are searched, and the pdfium extractor never extracts tables
+TABLE_EXTRACTION: bool = os.getenv("TABLE_EXTRACTION", "true").lower() == "true"
+
+# SQLite database caching extracted page text by PDF content hash (empty disables)
+PAGE_CACHE_PATH: str = os.getenv("PAGE_CACHE_PATH", "data/page_cache.sqlite3")
+
+# Entity extraction configuration
+# Directory of the persistent entity extraction cache shared by all sessions
+NER_CACHE_PATH: str = os.getenv("NER_CACHE_PATH", "data/ner_cache")
+
+# Number of times entity fields with invalid values are requested again
+NER_MAX_RETRIES: int = int(os.getenv("NER_MAX_RETRIES", "1"))
+
 # Feedback configuration
 # Path to the JSONL file where feedback is stored
 FEEDBACK_FILE_PATH: str = os.getenv("FEEDBACK_FILE_PATH", "data/feedback.jsonl")
 
+# Size in bytes from which the active feedback log is rotated to a numbered segment
+FEEDBACK_SEGMENT_BYTES: int = int(os.getenv("FEEDBACK_SEGMENT_BYTES", str(4 * 1024 * 1024)))
+
+# Number of rotated feedback segments from which the log is compacted into a snapshot
+FEEDBACK_MAX_SEGMENTS: int = int(os.getenv("FEEDBACK_MAX_SEGMENTS", "4"))
+
+# Number of most recent feedback entries kept per question on compaction (0 keeps all)
+FEEDBACK_KEEP_PER_QUESTION: int = int(os.getenv("FEEDBACK_KEEP_PER_QUESTION", "20"))
+
+# Age in days after which feedback entries are dropped on compaction (0 keeps all)
+FEEDBACK_RETENTION_DAYS: int = int(os.getenv("FEEDBACK_RETENTION_DAYS", "0"))
+
+# Durability of saved feedback: "sync" (fsync each entry before returning), "group" (wait
+# for the fsync shared by concurrently saved entries) or "async" (fsync in the background)
+FEEDBACK_DURABILITY: str = os.getenv("FEEDBACK_DURABILITY", "group")
+
+# Maximum number of feedback entries written with a single fsync
+FEEDBACK_BATCH_SIZE: int = int(os.getenv("FEEDBACK_BATCH_SIZE", "256"))
+
+# Seconds the background writer gathers entries before an "async" fsync
+FEEDBACK_FLUSH_INTERVAL: float = float(os.getenv("FEEDBACK_FLUSH_INTERVAL", "0.2"))
+
+# Maximum number of feedback-enhanced QA prompt variants kept in memory
+PROMPT_CACHE_SIZE: int = int(os.getenv("PROMPT_CACHE_SIZE", "128"))
+
+# Maximum number of question embeddings kept in memory
+QUERY_CACHE_SIZE: int = int(os.getenv("QUERY_CACHE_SIZE", "1024"))
+
+# SQLite database caching question embeddings by model and normalized question (empty disables)
+QUERY_CACHE_PATH: str = os.getenv("QUERY_CACHE_PATH", "data/query_cache.sqlite3")
+
 # UI configuration
 # Maximum number of source documents to display
 MAX_SOURCES: int = int(os.getenv("MAX_SOURCES", "3"))
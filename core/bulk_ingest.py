@@ -0,0 +1,195 @@
+"""Bulk ingestion module for indexing a directory of PDF contracts.
+
+PDF text extraction and chunking run across a process pool while the main
+process streams the resulting chunks into batched embedding requests and
+builds or extends a persisted FAISS index. A manifest stored next to the
+index records the content hash of every indexed file so that re-running the
+ingestion skips files that are already indexed. Saving a different index to
+the same directory, as the app does, removes the manifest.
+"""
+
+import json
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+from typing import Any, Dict, Iterator, List, Optional, Set, Tuple, Union
+
+from langchain_core.documents import Document
+from langchain_community.vectorstores import FAISS
+
+from config.settings import EMBEDDING_BATCH_SIZE, FAISS_INDEX_PATH
+from core.chunking import chunk_documents
+from core.embeddings import embed_texts, get_embeddings
+from core.ingest import compute_file_hash, load_pdf
+from core.vectorstore import (
+    MANIFEST_FILE_NAME,
+    add_vectors,
+    create_vectorstore,
+    load_vectorstore,
+    save_vectorstore,
+)
+
+
+def load_manifest(index_path: Union[str, Path]) -> Dict[str, Dict[str, Any]]:
+    """Load the manifest of indexed files.
+
+    Args:
+        index_path: Directory of the persisted FAISS index.
+
+    Returns:
+        Dictionary mapping file content hashes to file information.
+    """
+    manifest_path = Path(index_path) / MANIFEST_FILE_NAME
+    if not manifest_path.exists():
+        return {}
+    with open(manifest_path, "r", encoding="utf-8") as f:
+        return json.load(f).get("files", {})
+
+
+def save_manifest(index_path: Union[str, Path], files: Dict[str, Dict[str, Any]]) -> None:
+    """Save the manifest of indexed files.
+
+    Args:
+        index_path: Directory of the persisted FAISS index.
+        files: Dictionary mapping file content hashes to file information.
+    """
+    manifest_path = Path(index_path) / MANIFEST_FILE_NAME
+    manifest_path.parent.mkdir(parents=True, exist_ok=True)
+    temp_path = manifest_path.with_suffix(".tmp")
+    with open(temp_path, "w", encoding="utf-8") as f:
+        json.dump({"files": files}, f, indent=2)
+    os.replace(temp_path, manifest_path)
+
+
+def _load_and_chunk(pdf_path: Path, source: str) -> Tuple[Path, int, List[Document], Optional[str]]:
+    """Extract and chunk a single PDF in a worker process.
+
+    Args:
+        pdf_path: Path to the PDF file.
+        source: Source recorded on the chunks; the path relative to the
+                ingested directory, so same-named files in different
+                folders stay apart.
+
+    Returns:
+        Tuple of (path, number of pages, chunks, error message or None).
+    """
+    try:
+        documents = load_pdf(pdf_path)
+        for document in documents:
+            document.metadata["source"] = source
+        pages = [document for document in documents if document.page_content.strip()]
+        return pdf_path, len(documents), chunk_documents(pages) if pages else [], None
+    except Exception as e:
+        return pdf_path, 0, [], str(e)
+
+
+def _find_new_pdfs(directory: Path, indexed_hashes: Set[str]) -> Tuple[List[Tuple[Path, str]], int]:
+    """Find PDFs in a directory whose content is not indexed yet.
+
+    Returns:
+        Tuple of (list of (path, content hash) pairs, number of skipped files).
+    """
+    new_files: List[Tuple[Path, str]] = []
+    skipped = 0
+    for pdf_path in sorted(directory.rglob("*.pdf")):
+        file_hash = compute_file_hash(pdf_path)
+        if file_hash in indexed_hashes:
+            skipped += 1
+            continue
+        indexed_hashes.add(file_hash)
+        new_files.append((pdf_path, file_hash))
+    return new_files, skipped
+
+
+def _batches(chunks: Iterator[Document], batch_size: int) -> Iterator[List[Document]]:
+    """Group a stream of chunks into lists of at most batch_size chunks."""
+    batch: List[Document] = []
+    for chunk in chunks:
+        batch.append(chunk)
+        if len(batch) >= batch_size:
+            yield batch
+            batch = []
+    if batch:
+        yield batch
+
+
+def ingest_directory(
+    directory: Union[str, Path],
+    index_path: Union[str, Path, None] = None,
+    workers: Optional[int] = None,
+    batch_size: Optional[int] = None,
+) -> Dict[str, Any]:
+    """Index all PDFs in a directory into a persisted FAISS vector store.
+
+    Args:
+        directory: Directory searched recursively for PDF files.
+        index_path: Directory of the persisted FAISS index to build or extend.
+                    If not provided, uses FAISS_INDEX_PATH from settings.
+        workers: Number of worker processes for extraction and chunking.
+                 Defaults to the number of CPUs.
+        batch_size: Number of chunks per embedding request. If not provided,
+                    uses EMBEDDING_BATCH_SIZE from settings.
+
+    Returns:
+        Dictionary with ingestion statistics: 'files', 'skipped', 'failed',
+        'pages', 'chunks' and 'seconds'.
+
+    Raises:
+        FileNotFoundError: If the directory does not exist.
+    """
+    directory = Path(directory)
+    if not directory.is_dir():
+        raise FileNotFoundError(f"Directory not found: {directory}")
+
+    index_path = Path(index_path or FAISS_INDEX_PATH)
+    batch_size = batch_size or EMBEDDING_BATCH_SIZE
+    start = time.perf_counter()
+
+    manifest = load_manifest(index_path)
+    new_files, skipped = _find_new_pdfs(directory, set(manifest))
+    stats: Dict[str, Any] = {"files": 0, "skipped": skipped, "failed": 0, "pages": 0, "chunks": 0}
+
+    vectorstore: Optional[FAISS] = None
+    if new_files and (index_path / "index.faiss").exists():
+        vectorstore = load_vectorstore(index_path, mmap=False)
+    embeddings = get_embeddings()
+    hashes = dict(new_files)
+
+    def chunk_stream(executor: ProcessPoolExecutor) -> Iterator[Document]:
+        paths = [path for path, _ in new_files]
+        sources = [path.relative_to(directory).as_posix() for path in paths]
+        for pdf_path, pages, chunks, error in executor.map(_load_and_chunk, paths, sources):
+            if error is not None:
+                stats["failed"] += 1
+                continue
+            stats["files"] += 1
+            stats["pages"] += pages
+            stats["chunks"] += len(chunks)
+            manifest[hashes[pdf_path]] = {
+                "path": str(pdf_path),
+                "pages": pages,
+                "chunks": len(chunks),
+            }
+            for chunk in chunks:
+                chunk.metadata["file_hash"] = hashes[pdf_path]
+                yield chunk
+
+    if new_files:
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            for batch in _batches(chunk_stream(executor), batch_size):
+                texts = [chunk.page_content for chunk in batch]
+                metadatas = [chunk.metadata for chunk in batch]
+                vectors = embed_texts(embeddings, texts)
+                if vectorstore is None:
+                    vectorstore = create_vectorstore(texts, vectors, metadatas, embeddings)
+                else:
+                    add_vectors(vectorstore, texts, vectors, metadatas)
+
+    if vectorstore is not None:
+        save_vectorstore(vectorstore, index_path)
+    if stats["files"]:
+        save_manifest(index_path, manifest)
+
+    stats["seconds"] = time.perf_counter() - start
+    return stats
@@ -0,0 +1,154 @@
+"""Append-only SQLite store of chunk texts and metadata.
+
+Persisted vector stores keep their chunks in a SQLite database next to the
+FAISS index instead of LangChain's pickled docstore: loading an index reads
+only the chunk ids, chunk bodies are read by id when a search returns them,
+and nothing is unpickled. Rows are keyed by their position in the FAISS
+index, so extending an index only appends rows.
+"""
+
+import json
+import os
+import sqlite3
+import threading
+from contextlib import closing
+from pathlib import Path
+from typing import Dict, List, Union
+
+from langchain_core.documents import Document
+from langchain_community.docstore.base import AddableMixin, Docstore
+
+# Seconds to wait for a database lock held by another process
+_BUSY_TIMEOUT = 30.0
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS chunks (
+    position INTEGER PRIMARY KEY,
+    id TEXT NOT NULL UNIQUE,
+    text TEXT NOT NULL,
+    metadata TEXT NOT NULL
+);
+"""
+
+_INSERT = "INSERT OR REPLACE INTO chunks (position, id, text, metadata) VALUES (?, ?, ?, ?)"
+
+
+class ChunkStore(Docstore, AddableMixin):
+    """Docstore reading chunks from SQLite by id on demand.
+
+    Documents added to the store are kept in memory until append writes them
+    at their index positions, which save_vectorstore does on save.
+    """
+
+    def __init__(self, path: Union[str, Path]):
+        """Open a chunk store, creating it if needed.
+
+        Args:
+            path: Path to the SQLite database.
+        """
+        self.path = Path(path)
+        self._connection = sqlite3.connect(
+            self.path, timeout=_BUSY_TIMEOUT, check_same_thread=False
+        )
+        self._connection.executescript(_SCHEMA)
+        self._lock = threading.Lock()
+        self._pending: Dict[str, Document] = {}
+
+    def positions(self) -> Dict[int, str]:
+        """Get the ids of the stored chunks by index position."""
+        with self._lock:
+            return dict(self._connection.execute("SELECT position, id FROM chunks"))
+
+    def search(self, search: str) -> Union[str, Document]:
+        """Look up a chunk by id.
+
+        Args:
+            search: Chunk id.
+
+        Returns:
+            Document if found, else an error message as InMemoryDocstore does.
+        """
+        document = self._pending.get(search)
+        if document is not None:
+            return document
+
+        with self._lock:
+            row = self._connection.execute(
+                "SELECT text, metadata FROM chunks WHERE id = ?", (search,)
+            ).fetchone()
+        if row is None:
+            return f"ID {search} not found."
+        return Document(id=search, page_content=row[0], metadata=json.loads(row[1]))
+
+    def add(self, texts: Dict[str, Document]) -> None:
+        """Add documents by id; they are written to the database by append.
+
+        Args:
+            texts: Dictionary of id -> document.
+        """
+        self._pending.update(texts)
+
+    def delete(self, ids: List) -> None:
+        """Reject deletes: the chunk store is append-only.
+
+        Chunks are keyed by their FAISS index position, so removing one would
+        leave the index pointing at missing chunks.
+
+        Raises:
+            ValueError: Always.
+        """
+        raise ValueError("ChunkStore is append-only; rebuild the index to delete chunks")
+
+    def append(self, index_to_docstore_id: Dict[int, str]) -> None:
+        """Write the added documents at their index positions.
+
+        Args:
+            index_to_docstore_id: Mapping of FAISS index positions to chunk ids.
+        """
+        rows = [
+            (position, id_, document.page_content, json.dumps(document.metadata))
+            for position, id_ in index_to_docstore_id.items()
+            if (document := self._pending.get(id_)) is not None
+        ]
+        with self._lock, self._connection:
+            self._connection.executemany(_INSERT, rows)
+        self._pending.clear()
+
+    def close(self) -> None:
+        """Close the database connection."""
+        self._connection.close()
+
+
+def write_chunk_store(
+    path: Union[str, Path], index_to_docstore_id: Dict[int, str], docstore: Docstore
+) -> None:
+    """Write all chunks of a docstore to a new chunk store, replacing any existing one.
+
+    The database is written to a temporary file and moved into place, so
+    processes reading the previous store are not affected.
+
+    Args:
+        path: Path to the SQLite database.
+        index_to_docstore_id: Mapping of FAISS index positions to chunk ids.
+        docstore: Docstore holding the chunks. Chunk metadata must be
+                  JSON-serializable.
+    """
+    path = Path(path)
+    tmp_path = path.with_name(f".{path.name}.tmp")
+    tmp_path.unlink(missing_ok=True)
+
+    def rows():
+        for position, id_ in index_to_docstore_id.items():
+            document = docstore.search(id_)
+            if isinstance(document, Document):
+                yield position, id_, document.page_content, json.dumps(document.metadata)
+
+    try:
+        with closing(sqlite3.connect(tmp_path)) as connection:
+            connection.executescript(_SCHEMA)
+            with connection:
+                connection.executemany(_INSERT, rows())
+        os.replace(tmp_path, path)
+    except BaseException:
+        tmp_path.unlink(missing_ok=True)
+        raise
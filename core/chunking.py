@@ -6,6 +6,7 @@ from langchain_core.documents import Document
 from langchain_text_splitters import RecursiveCharacterTextSplitter
 
 from config.settings import CHUNK_OVERLAP, CHUNK_SIZE
+from core.tables import split_table_chunks
 
 
 def chunk_documents(documents: List[Document]) -> List[Document]:
@@ -14,7 +15,10 @@ def chunk_documents(documents: List[Document]) -> List[Document]:
 
     Uses RecursiveCharacterTextSplitter to split documents into chunks of
     configurable size with configurable overlap. Preserves metadata from
-    the original documents in each chunk.
+    the original documents in each chunk and records the chunk's character
+    offset within its page as 'start_index'. Markdown tables in the page text
+    are kept out of the prose chunks and emitted as chunks of whole table
+    rows, marked with 'content_type' "table".
 
     Args:
         documents: List of LangChain Document objects to chunk.
@@ -33,9 +37,14 @@ def chunk_documents(documents: List[Document]) -> List[Document]:
     text_splitter = RecursiveCharacterTextSplitter(
         chunk_size=CHUNK_SIZE,
         chunk_overlap=CHUNK_OVERLAP,
+        add_start_index=True,
     )
 
-    # Split all documents into chunks
-    chunked_documents = text_splitter.split_documents(documents)
+    # Split all documents into chunks, keeping tables apart from the prose
+    chunked_documents = []
+    for document in documents:
+        prose, table_chunks = split_table_chunks(document, CHUNK_SIZE)
+        chunked_documents.extend(text_splitter.split_documents([prose]))
+        chunked_documents.extend(table_chunks)
 
     return chunked_documents
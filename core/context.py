@@ -0,0 +1,149 @@
+"""Context assembly module for building token-budgeted QA prompts.
+
+Retrieved chunks frequently overlap (consecutive chunks share CHUNK_OVERLAP
+characters) or repeat each other. This module removes that redundancy and
+fills a token budget with the most relevant text instead of stuffing a fixed
+number of chunks into the prompt.
+"""
+
+from functools import lru_cache
+from typing import Any, Dict, List, Optional, Tuple
+
+import tiktoken
+from langchain_core.documents import Document
+
+from config.settings import CONTEXT_TOKEN_BUDGET, LLM_MODEL
+
+# Fallback encoding for models unknown to tiktoken
+DEFAULT_ENCODING = "cl100k_base"
+
+# Minimum number of shared characters for two chunks to be merged
+MIN_MERGE_OVERLAP = 20
+
+
+@lru_cache(maxsize=1)
+def _get_encoding() -> tiktoken.Encoding:
+    """Get the tiktoken encoding for the configured LLM model."""
+    try:
+        return tiktoken.encoding_for_model(LLM_MODEL)
+    except KeyError:
+        return tiktoken.get_encoding(DEFAULT_ENCODING)
+
+
+def count_tokens(text: str) -> int:
+    """Count the number of LLM tokens in a text.
+
+    Args:
+        text: Text to count tokens for.
+
+    Returns:
+        Number of tokens according to the LLM model's tokenizer.
+    """
+    return len(_get_encoding().encode(text))
+
+
+def _merge_overlapping(first: str, second: str) -> Optional[str]:
+    """Merge two texts if one contains the other or they share an overlap.
+
+    Args:
+        first: Text that comes first in the document.
+        second: Text that comes after the first one.
+
+    Returns:
+        Merged text without the duplicated span, or None if the texts
+        do not overlap.
+    """
+    if second in first:
+        return first
+    if first in second:
+        return second
+
+    for size in range(min(len(first), len(second)), MIN_MERGE_OVERLAP - 1, -1):
+        if first.endswith(second[:size]):
+            return first + second[size:]
+    return None
+
+
+def _group_key(document: Document) -> Tuple[Any, Any]:
+    """Get the key identifying the page a chunk belongs to."""
+    return document.metadata.get("source"), document.metadata.get("page")
+
+
+def _merge_page_chunks(ranked_chunks: List[Tuple[int, Document]]) -> List[Tuple[int, Document]]:
+    """Merge overlapping chunks that belong to the same page.
+
+    Args:
+        ranked_chunks: List of (relevance rank, chunk) pairs from a single page.
+
+    Returns:
+        List of (best relevance rank, merged chunk) pairs.
+    """
+    ordered = sorted(
+        ranked_chunks,
+        key=lambda item: (item[1].metadata.get("start_index", float("inf")), item[0]),
+    )
+
+    merged: List[Tuple[int, Document]] = []
+    for rank, chunk in ordered:
+        if merged:
+            last_rank, last_chunk = merged[-1]
+            merged_text = _merge_overlapping(last_chunk.page_content, chunk.page_content)
+            if merged_text is not None:
+                metadata: Dict[str, Any] = dict(last_chunk.metadata)
+                merged[-1] = (
+                    min(last_rank, rank),
+                    Document(page_content=merged_text, metadata=metadata),
+                )
+                continue
+        merged.append((rank, chunk))
+    return merged
+
+
+def build_context(documents: List[Document], token_budget: Optional[int] = None) -> List[Document]:
+    """Assemble retrieved chunks into a deduplicated, token-budgeted context.
+
+    Chunks are taken in relevance order until the token budget is filled;
+    chunks that do not fit are skipped in favour of smaller, less relevant
+    ones. The most relevant chunk is always kept so the context is never
+    empty. Selected chunks from the same page are then merged so that
+    overlapping spans appear only once.
+
+    Args:
+        documents: Retrieved chunks, most relevant first.
+        token_budget: Maximum number of context tokens. If not provided,
+                      uses CONTEXT_TOKEN_BUDGET from settings.
+
+    Returns:
+        List of context Document objects ordered by relevance. Each keeps
+        the metadata (including page number) of its source chunks.
+    """
+    if token_budget is None:
+        token_budget = CONTEXT_TOKEN_BUDGET
+
+    selected: List[Tuple[int, Document]] = []
+    seen_texts = set()
+    used_tokens = 0
+
+    for rank, document in enumerate(documents):
+        text = document.page_content.strip()
+        if not text or text in seen_texts:
+            continue
+
+        tokens = count_tokens(text)
+        if selected and used_tokens + tokens > token_budget:
+            continue
+
+        seen_texts.add(text)
+        selected.append((rank, document))
+        used_tokens += tokens
+
+    pages: Dict[Tuple[Any, Any], List[Tuple[int, Document]]] = {}
+    for rank, document in selected:
+        pages.setdefault(_group_key(document), []).append((rank, document))
+
+    merged: List[Tuple[int, Document]] = []
+    for page_chunks in pages.values():
+        merged.extend(_merge_page_chunks(page_chunks))
+
+    merged.sort(key=lambda item: item[0])
+    return [document for _, document in merged]
@@ -1,10 +1,14 @@
 """Embeddings module for creating vector embeddings from documents."""
 
-from typing import List
+from typing import List, Optional
 
+import numpy as np
 from langchain_core.embeddings import Embeddings
 
-from config.settings import OPENAI_API_KEY, EMBEDDING_MODEL
+from config.settings import EMBEDDING_DIMENSIONS, EMBEDDING_MODEL, OPENAI_API_KEY
+
+# Model family that supports shortened (Matryoshka) output dimensions
+SHORTENABLE_MODEL_PREFIX = "text-embedding-3"
 
 
 class MockEmbeddings(Embeddings):
@@ -14,14 +18,15 @@ class MockEmbeddings(Embeddings):
     and development when API access is not available.
     """
 
-    def __init__(self, dimension: int = 1536) -> None:
+    def __init__(self, dimension: Optional[int] = None) -> None:
         """Initialize mock embeddings.
 
         Args:
-            dimension: Dimension of the embedding vectors (default: 1536,
+            dimension: Dimension of the embedding vectors. If not provided,
+                       uses EMBEDDING_DIMENSIONS from settings (default: 1536,
                        matching OpenAI's text-embedding-3-small).
         """
-        self.dimension = dimension
+        self.dimension = dimension or EMBEDDING_DIMENSIONS
 
     def embed_documents(self, texts: List[str]) -> List[List[float]]:
         """Generate mock embeddings for a list of documents.
@@ -34,6 +39,17 @@ class MockEmbeddings(Embeddings):
         """
         return [[0.0] * self.dimension for _ in texts]
 
+    def embed_documents_array(self, texts: List[str]) -> np.ndarray:
+        """Generate mock embeddings for a list of documents as one array.
+
+        Args:
+            texts: List of text strings to embed.
+
+        Returns:
+            Zero float32 matrix with one row per text.
+        """
+        return np.zeros((len(texts), self.dimension), dtype=np.float32)
+
     def embed_query(self, text: str) -> List[float]:
         """Generate a mock embedding for a query.
 
@@ -46,17 +62,70 @@ class MockEmbeddings(Embeddings):
         return [0.0] * self.dimension
 
 
+def truncate_embeddings(vectors: np.ndarray, dimension: int) -> np.ndarray:
+    """Shorten Matryoshka embeddings to a smaller dimension.
+
+    Keeps the leading components of each vector and re-normalizes it to unit
+    length, which is equivalent to requesting the shorter dimension from a
+    text-embedding-3 model.
+
+    Args:
+        vectors: Embedding vectors, one row per vector.
+        dimension: Target dimension.
+
+    Returns:
+        Truncated, L2-normalized float32 vectors.
+
+    Raises:
+        ValueError: If the target dimension exceeds the vector dimension.
+    """
+    vectors = np.asarray(vectors, dtype=np.float32)
+    if dimension > vectors.shape[-1]:
+        raise ValueError(
+            f"Cannot truncate {vectors.shape[-1]}-dimensional embeddings to {dimension}"
+        )
+
+    truncated = np.array(vectors[..., :dimension], dtype=np.float32)
+    norms = np.linalg.norm(truncated, axis=-1, keepdims=True)
+    np.divide(truncated, norms, out=truncated, where=norms > 0)
+    return truncated
+
+
+def embed_texts(embeddings: Embeddings, texts: List[str]) -> np.ndarray:
+    """Embed texts into a contiguous float32 matrix.
+
+    Embeddings implementing embed_documents_array (MockEmbeddings and the
+    OpenAI embeddings returned by get_embeddings) produce the matrix directly;
+    any other Embeddings falls back to converting the lists returned by
+    embed_documents.
+
+    Args:
+        embeddings: Embeddings instance.
+        texts: Texts to embed.
+
+    Returns:
+        Float32 matrix with one row per text.
+    """
+    embed_array = getattr(embeddings, "embed_documents_array", None)
+    if embed_array is not None:
+        return np.ascontiguousarray(embed_array(texts), dtype=np.float32)
+    return np.asarray(embeddings.embed_documents(texts), dtype=np.float32)
+
+
 def get_embeddings() -> Embeddings:
     """Get an embeddings instance, using OpenAI if available, otherwise mock.
 
-    Checks if OPENAI_API_KEY is set. If available, returns OpenAIEmbeddings.
-    Otherwise, returns MockEmbeddings for fallback functionality.
+    Checks if OPENAI_API_KEY is set. If available, returns OpenAIEmbeddings
+    producing EMBEDDING_DIMENSIONS-dimensional vectors. Otherwise, returns
+    MockEmbeddings for fallback functionality.
 
     Returns:
         Embeddings instance (OpenAIEmbeddings or MockEmbeddings).
     """
     if OPENAI_API_KEY:
-        from langchain_openai import OpenAIEmbeddings
+        from core.openai_embeddings import ArrayOpenAIEmbeddings
 
-        return OpenAIEmbeddings(model=EMBEDDING_MODEL)
+        if EMBEDDING_MODEL.startswith(SHORTENABLE_MODEL_PREFIX):
+            return ArrayOpenAIEmbeddings(model=EMBEDDING_MODEL, dimensions=EMBEDDING_DIMENSIONS)
+        return ArrayOpenAIEmbeddings(model=EMBEDDING_MODEL)
     return MockEmbeddings()
@@ -0,0 +1,194 @@
+"""Rule-based extraction of regularly phrased contract entities.
+
+Dates, governing law and parties usually follow stock phrasing such as
+"effective as of ...", "governed by the laws of ..." and "by and between ...".
+Compiled patterns resolve these fields in milliseconds; a field is resolved
+only when every match in the contract agrees, and is otherwise left for the
+LLM-based extraction in core.ner.
+"""
+
+import re
+from datetime import date, datetime
+from typing import Callable, Dict, List, Optional, Pattern, Sequence
+
+from langchain_core.documents import Document
+
+_MONTH = (
+    r"(?i:jan(?:uary)?|feb(?:ruary)?|mar(?:ch)?|apr(?:il)?|may|june?|july?|aug(?:ust)?"
+    r"|sep(?:t(?:ember)?)?|oct(?:ober)?|nov(?:ember)?|dec(?:ember)?)\.?"
+)
+_DATE = (
+    r"(?P<date>\d{4}-\d{2}-\d{2}"
+    rf"|{_MONTH}\s+\d{{1,2}}(?:st|nd|rd|th)?,?\s+\d{{4}}"
+    rf"|\d{{1,2}}(?:st|nd|rd|th)?\s+(?:day\s+of\s+)?{_MONTH},?\s+\d{{4}}"
+    r"|\d{1,2}/\d{1,2}/\d{4})"
+)
+_DATE_FORMATS = ("%Y-%m-%d", "%B %d %Y", "%b %d %Y", "%d %B %Y", "%d %b %Y", "%m/%d/%Y")
+
+_EFFECTIVE_DATE_PATTERNS = [
+    re.compile(
+        r"(?i:\b(?:effective(?:\s+date)?|dated|entered\s+into|made)\b"
+        r"(?:\s+(?:as\s+of|on|from|is|shall\s+be|of))*[\s:,\"”)]*(?:the\s+)?)" + _DATE
+    ),
+]
+_TERMINATION_DATE_PATTERNS = [
+    re.compile(
+        r"(?i:\b(?:terminat(?:e|es|ion)|expir(?:e|es|ation)|end)(?:\s+date)?\b"
+        r"(?:\s+(?:on|as\s+of|is|shall\s+be|upon))*[\s:,\"”)]*(?:the\s+)?)" + _DATE
+    ),
+    re.compile(r"(?i:\buntil\s+(?:the\s+)?)" + _DATE),
+]
+
+_JURISDICTION = (
+    r"(?P<law>(?:(?:State|Commonwealth|Province)\s+of\s+)?"
+    r"[A-Z][\w'-]*(?:\s+(?:and\s+)?[A-Z][\w'-]*)*)"
+)
+_GOVERNING_LAW_PATTERNS = [
+    re.compile(r"(?i:\bgoverned\s+by\b[^.]{0,80}?\blaws?\s+of\s+(?:the\s+)?)" + _JURISDICTION),
+    re.compile(r"(?i:\bgoverned\s+by\s+(?:the\s+)?)" + _JURISDICTION + r"(?i:\s+law)\b"),
+]
+
+_PARTIES_PATTERN = re.compile(
+    r"(?i:\bbetween)[\s:]+(?P<first>.{2,300}?)\s+(?i:and)[\s:]+(?P<second>.{2,300})"
+)
+_PARTY_END_PATTERN = re.compile(
+    r"\s*\(|,\s*(?:an?|the)\s|,\s*(?:located|having|with|whose|organized|incorporated)\b"
+    r"|\.\s|\s+(?:and|hereinafter)\s",
+    re.IGNORECASE,
+)
+_COMPANY_SUFFIX_PATTERN = re.compile(
+    r"\b(?:inc|ltd|co|corp|l\.l\.c|s\.r\.o|s\.a|n\.v|b\.v|p\.c)\.$", re.IGNORECASE
+)
+_MAX_PARTY_NAME_LENGTH = 100
+
+# Number of leading pages searched for the contracting parties
+PARTY_PAGES = 2
+
+# Page keywords used to select the pages sent to the LLM for each field
+FIELD_PAGE_PATTERNS: Dict[str, Pattern[str]] = {
+    "parties": re.compile(r"\bbetween\b|\bpart(?:y|ies)\b", re.IGNORECASE),
+    "effective_date": re.compile(r"\beffective\b|\bdated\b|\bentered\s+into\b", re.IGNORECASE),
+    "termination_date": re.compile(r"\bterminat|\bexpir|\bterm\b", re.IGNORECASE),
+    "payment_terms": re.compile(
+        r"\bpayment|\bfees?\b|\binvoice|\bcompensation\b|\bprice\b|\$", re.IGNORECASE
+    ),
+    "ip_owner": re.compile(
+        r"\bintellectual\s+property\b|\bproprietary\b|\bownership\b|\bcopyright|\bpatent",
+        re.IGNORECASE,
+    ),
+    "governing_law": re.compile(
+        r"\bgovern(?:ing|ed)\b|\blaws?\s+of\b|\bjurisdiction\b", re.IGNORECASE
+    ),
+}
+
+
+def _normalize_whitespace(text: str) -> str:
+    """Collapse line breaks and runs of whitespace into single spaces."""
+    return " ".join(text.split())
+
+
+def parse_date(text: str) -> Optional[str]:
+    """Parse a date written in a common contract format.
+
+    Args:
+        text: Date text such as "January 15, 2024", "15th day of March 2024",
+              "2024-01-15" or "01/15/2024" (US month/day order).
+
+    Returns:
+        Date in YYYY-MM-DD format, or None if the text is not a valid date.
+    """
+    cleaned = re.sub(r"(?<=\d)(?:st|nd|rd|th)\b|\bday\s+of\b|[,.]", " ", text, flags=re.I)
+    cleaned = re.sub(r"(?i)\bsept\b", "Sep", " ".join(cleaned.split()))
+    for date_format in _DATE_FORMATS:
+        try:
+            parsed: date = datetime.strptime(cleaned, date_format).date()
+        except ValueError:
+            continue
+        return parsed.isoformat()
+    return None
+
+
+def _unique_match(
+    texts: Sequence[str],
+    patterns: List[Pattern[str]],
+    group: str,
+    normalize: Callable[[str], Optional[str]],
+) -> Optional[str]:
+    """Get the single value all pattern matches agree on, or None if ambiguous."""
+    values = set()
+    for text in texts:
+        for pattern in patterns:
+            for match in pattern.finditer(text):
+                value = normalize(match.group(group))
+                if value:
+                    values.add(value)
+    return values.pop() if len(values) == 1 else None
+
+
+def _clean_jurisdiction(text: str) -> str:
+    """Strip a trailing conjunction captured after a jurisdiction name."""
+    return re.sub(r"\s+and$", "", text.strip())
+
+
+def _clean_party(text: str) -> Optional[str]:
+    """Cut a party description down to the party name, or None if implausible."""
+    name = _PARTY_END_PATTERN.split(text, maxsplit=1)[0].strip(' ,;:"“”')
+    if name.endswith(".") and not _COMPANY_SUFFIX_PATTERN.search(name):
+        name = name[:-1]
+    if not 2 <= len(name) <= _MAX_PARTY_NAME_LENGTH or not name[0].isupper():
+        return None
+    return name
+
+
+def _extract_parties(texts: Sequence[str]) -> Optional[List[str]]:
+    """Extract the two contracting parties from a "by and between" clause."""
+    for text in texts[:PARTY_PAGES]:
+        for match in _PARTIES_PATTERN.finditer(text):
+            first = _clean_party(match.group("first"))
+            second = _clean_party(match.group("second"))
+            if first and second and first != second:
+                return [first, second]
+    return None
+
+
+def extract_rule_entities(documents: List[Document]) -> Dict[str, str | List[str]]:
+    """Extract regularly phrased entities from page documents with rules.
+
+    Args:
+        documents: Page documents as returned by load_pdf.
+
+    Returns:
+        Dictionary with the fields resolved with confidence, a subset of
+        'parties', 'effective_date', 'termination_date' and 'governing_law'.
+        Unresolved fields are omitted.
+    """
+    texts = [_normalize_whitespace(doc.page_content) for doc in documents]
+    candidates = {
+        "parties": _extract_parties(texts),
+        "effective_date": _unique_match(texts, _EFFECTIVE_DATE_PATTERNS, "date", parse_date),
+        "termination_date": _unique_match(texts, _TERMINATION_DATE_PATTERNS, "date", parse_date),
+        "governing_law": _unique_match(texts, _GOVERNING_LAW_PATTERNS, "law", _clean_jurisdiction),
+    }
+    return {field: value for field, value in candidates.items() if value}
+
+
+def select_relevant_pages(documents: List[Document], fields: Sequence[str]) -> List[Document]:
+    """Select the pages likely to mention any of the given entity fields.
+
+    Args:
+        documents: Page documents as returned by load_pdf.
+        fields: Entity fields to look for.
+
+    Returns:
+        Pages mentioning keywords of any field, in page order. The first
+        pages are always included when looking for parties. Falls back to all
+        pages if no page matches.
+    """
+    patterns = [FIELD_PAGE_PATTERNS[field] for field in fields if field in FIELD_PAGE_PATTERNS]
+    selected = [
+        doc
+        for i, doc in enumerate(documents)
+        if ("parties" in fields and i < PARTY_PAGES)
+        or any(pattern.search(doc.page_content) for pattern in patterns)
+    ]
+    return selected or list(documents)
@@ -0,0 +1,208 @@
+"""PDF text extraction backends.
+
+pdfplumber analyzes the layout of every character, which is accurate for
+tables and multi-column pages but slow. pypdfium2 (a pdfplumber dependency)
+reads the text layer directly and is many times faster on text-native
+contracts. The "auto" backend extracts with pypdfium2 and switches to
+pdfplumber only for pages a cheap heuristic flags as layout-sensitive.
+"""
+
+from pathlib import Path
+from typing import Dict, Optional, Tuple, Type, Union
+
+import pdfplumber
+import pypdfium2 as pdfium
+import pypdfium2.raw as pdfium_c
+from pypdfium2.version import PYPDFIUM_INFO
+
+from config.settings import TABLE_EXTRACTION
+from core.tables import extract_text_with_tables
+
+# Number of vector path objects (ruling lines, cell borders) from which a page
+# is treated as containing tables
+TABLE_PATH_OBJECTS = 10
+
+# Fraction of unmapped characters from which text-layer output is considered garbled
+MAX_UNREADABLE_CHAR_RATIO = 0.1
+
+
+class _Backend:
+    """Base class of extraction backends, usable as context managers."""
+
+    name: str
+    version: str
+
+    @classmethod
+    def cache_key(cls) -> str:
+        """Get the identifier of the backend and settings its output depends on."""
+        return f"{cls.name}:{cls.version}"
+
+    def __len__(self) -> int:
+        raise NotImplementedError
+
+    def extract_text(self, index: int) -> str:
+        """Extract the text of a page (0-indexed)."""
+        raise NotImplementedError
+
+    def close(self) -> None:
+        """Close the PDF file."""
+
+    def __enter__(self) -> "_Backend":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+
+class PdfplumberBackend(_Backend):
+    """Extract page text with pdfplumber's character-level layout analysis.
+
+    If TABLE_EXTRACTION is enabled, pages drawing enough ruling lines and
+    rectangles to hold a table are searched for tables, which are appended to
+    the page text as Markdown.
+    """
+
+    name = "pdfplumber"
+    version = f"pdfplumber-{pdfplumber.__version__}"
+
+    @classmethod
+    def cache_key(cls) -> str:
+        """Get the identifier of the backend and settings its output depends on."""
+        return super().cache_key() + (":tables" if TABLE_EXTRACTION else "")
+
+    def __init__(self, pdf_path: Union[str, Path]):
+        self._pdf = pdfplumber.open(pdf_path)
+
+    def __len__(self) -> int:
+        # Page objects are lightweight until their layout is analyzed
+        return len(self._pdf.pages)
+
+    def extract_text(self, index: int) -> str:
+        """Extract the text of a page (0-indexed)."""
+        page = self._pdf.pages[index]
+        try:
+            # Table detection is slow, so only run it on pages with ruled cells
+            if TABLE_EXTRACTION and len(page.lines) + len(page.rects) >= TABLE_PATH_OBJECTS:
+                return extract_text_with_tables(page)
+            return page.extract_text() or ""
+        finally:
+            # Release the layout objects and text map cached on the page
+            page.close()
+
+    def close(self) -> None:
+        """Close the PDF file."""
+        self._pdf.close()
+
+
+class PdfiumBackend(_Backend):
+    """Extract page text from the PDF text layer with pypdfium2."""
+
+    name = "pdfium"
+    version = f"pypdfium2-{PYPDFIUM_INFO}"
+
+    def __init__(self, pdf_path: Union[str, Path]):
+        self._pdf = pdfium.PdfDocument(str(pdf_path))
+
+    def __len__(self) -> int:
+        return len(self._pdf)
+
+    def extract_text(self, index: int) -> str:
+        """Extract the text of a page (0-indexed)."""
+        return self.extract_page(index)[0]
+
+    def extract_page(self, index: int) -> Tuple[str, bool]:
+        """Extract the text of a page and check whether it is layout-sensitive.
+
+        A page is layout-sensitive if it draws many vector paths, as ruled
+        tables do, or if much of its text layer cannot be mapped to Unicode.
+
+        Returns:
+            Tuple of (page text, whether layout analysis is recommended).
+        """
+        page = self._pdf[index]
+        textpage = page.get_textpage()
+        try:
+            text = textpage.get_text_range().replace("\r\n", "\n").replace("\r", "\n")
+            unreadable = text.count("\ufffd") + text.count("\x00")
+            paths = sum(1 for _ in page.get_objects(filter=[pdfium_c.FPDF_PAGEOBJ_PATH]))
+        finally:
+            textpage.close()
+            page.close()
+
+        needs_layout = paths >= TABLE_PATH_OBJECTS or (
+            bool(text) and unreadable / len(text) > MAX_UNREADABLE_CHAR_RATIO
+        )
+        return text, needs_layout
+
+    def close(self) -> None:
+        """Close the PDF file."""
+        self._pdf.close()
+
+
+class AutoBackend(_Backend):
+    """Extract with pypdfium2, using pdfplumber for layout-sensitive pages."""
+
+    name = "auto"
+    version = f"{PdfiumBackend.version}+{PdfplumberBackend.version}"
+
+    @classmethod
+    def cache_key(cls) -> str:
+        """Get the identifier of the backend and settings its output depends on."""
+        return super().cache_key() + (":tables" if TABLE_EXTRACTION else "")
+
+    def __init__(self, pdf_path: Union[str, Path]):
+        self._pdf_path = pdf_path
+        self._fast = PdfiumBackend(pdf_path)
+        self._layout: Optional[PdfplumberBackend] = None
+
+    def __len__(self) -> int:
+        return len(self._fast)
+
+    def extract_text(self, index: int) -> str:
+        """Extract the text of a page (0-indexed)."""
+        text, needs_layout = self._fast.extract_page(index)
+        if not needs_layout:
+            return text
+        if self._layout is None:
+            self._layout = PdfplumberBackend(self._pdf_path)
+        return self._layout.extract_text(index)
+
+    def close(self) -> None:
+        """Close the PDF file."""
+        self._fast.close()
+        if self._layout is not None:
+            self._layout.close()
+
+
+EXTRACTION_BACKENDS: Dict[str, Type[_Backend]] = {
+    "pdfplumber": PdfplumberBackend,
+    "pdfium": PdfiumBackend,
+    "auto": AutoBackend,
+}
+
+
+def get_backend(name: str) -> Type[_Backend]:
+    """Get the extraction backend class with the given name.
+
+    Raises:
+        ValueError: If the backend name is unknown.
+    """
+    if name not in EXTRACTION_BACKENDS:
+        raise ValueError(f"Unknown PDF extractor: {name}")
+    return EXTRACTION_BACKENDS[name]
+
+
+def open_backend(pdf_path: Union[str, Path], name: str) -> _Backend:
+    """Open a PDF with the named extraction backend.
+
+    Args:
+        pdf_path: Path to the PDF file.
+        name: Backend name ("pdfplumber", "pdfium" or "auto").
+
+    Returns:
+        Opened backend, usable as a context manager.
+
+    Raises:
+        ValueError: If the backend name is unknown.
+    """
+    return get_backend(name)(pdf_path)
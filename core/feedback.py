@@ -1,16 +1,33 @@
 """Feedback mechanism for improving answers over multiple interactions.
 
 This module handles collecting, storing, and retrieving user feedback
-to improve the contract QA system's responses.
+to improve the contract QA system's responses. Feedback is scoped to the
+document it was given on: entries record the content hash ('doc_hash') and
+identifier ('doc_id') of the active document, and lookups for a document only
+consider its own entries.
 """
 
+import bisect
 import json
-import os
+import threading
+import uuid
 from datetime import datetime, timezone
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Tuple
 
 from config.settings import FEEDBACK_FILE_PATH
+from core.feedback_store import (
+    archive_signature,
+    compact_log,
+    delete_log,
+    log_lock,
+    normalize_question,
+    read_archive,
+    read_log_bytes_before,
+    read_log_tail,
+)
+from core.feedback_writer import get_feedback_writer
+from core.prompts import clear_prompt_cache
 
 
 def save_feedback(
@@ -19,20 +36,30 @@ def save_feedback(
     rating: str,
     comment: Optional[str] = None,
     sources: Optional[List[Dict[str, Any]]] = None,
+    doc_hash: Optional[str] = None,
+    doc_id: Optional[str] = None,
 ) -> None:
     """Save user feedback to a JSONL file.
 
+    Entries are appended by a shared group-commit writer; depending on
+    FEEDBACK_DURABILITY, this returns after the entry is fsynced on its own
+    ("sync"), together with concurrently saved entries ("group"), or as soon
+    as it is queued ("async").
+
     Args:
         question: The question that was asked.
         answer: The answer that was provided.
         rating: User rating - "up" for positive, "down" for negative.
         comment: Optional comment from the user.
         sources: Optional list of source documents used in the answer.
+        doc_hash: Content hash of the document the question was asked about.
+        doc_id: Identifier of the document, e.g. its file name.
 
     Raises:
         RuntimeError: If feedback cannot be saved to file.
     """
     feedback_entry: Dict[str, Any] = {
+        "id": uuid.uuid4().hex,
         "timestamp": datetime.now(timezone.utc).isoformat(),
         "question": question,
         "answer": answer,
@@ -45,98 +72,293 @@ def save_feedback(
     if sources:
         feedback_entry["sources"] = [{"page": src.get("page", "Unknown")} for src in sources]
 
-    feedback_path = Path(FEEDBACK_FILE_PATH)
-    feedback_path.parent.mkdir(parents=True, exist_ok=True)
+    if doc_hash:
+        feedback_entry["doc_hash"] = doc_hash
 
-    try:
-        with open(feedback_path, "a+", encoding="utf-8") as f:
-            f.write(json.dumps(feedback_entry) + "\n")
-            f.flush()
-            os.fsync(f.fileno())
-    except Exception as e:
-        raise RuntimeError(f"Failed to save feedback to {feedback_path}: {str(e)}") from e
+    if doc_id:
+        feedback_entry["doc_id"] = doc_id
+
+    get_feedback_writer(FEEDBACK_FILE_PATH).append(feedback_entry)
+    clear_prompt_cache()
+
+
+def flush_feedback() -> None:
+    """Wait until all feedback saved by this process has been written."""
+    get_feedback_writer(FEEDBACK_FILE_PATH).flush()
+
+
+def compact_feedback(
+    keep_per_question: Optional[int] = None, retention_days: Optional[int] = None
+) -> int:
+    """Compact the feedback log into its snapshot.
+
+    The log is also compacted automatically once more than
+    FEEDBACK_MAX_SEGMENTS rotated segments accumulate.
+
+    Args:
+        keep_per_question: Number of most recent entries kept per normalized
+                           question (0 keeps all). If not provided, uses
+                           FEEDBACK_KEEP_PER_QUESTION from settings.
+        retention_days: Age in days after which entries are dropped (0 keeps
+                        all). If not provided, uses FEEDBACK_RETENTION_DAYS
+                        from settings.
+
+    Returns:
+        Number of entries kept.
+    """
+    flush_feedback()
+    with log_lock(FEEDBACK_FILE_PATH):
+        kept = compact_log(
+            FEEDBACK_FILE_PATH, keep_per_question=keep_per_question, retention_days=retention_days
+        )
+    clear_prompt_cache()
+    return kept
 
 
 def clear_all_feedback() -> None:
-    """Clear all feedback entries from the feedback file.
+    """Clear all feedback entries, including rotated segments and the snapshot.
 
     Raises:
         RuntimeError: If feedback file cannot be deleted.
     """
-    feedback_path = Path(FEEDBACK_FILE_PATH)
-    if feedback_path.exists():
+    global _index
+    flush_feedback()
+    try:
+        with log_lock(FEEDBACK_FILE_PATH):
+            delete_log(FEEDBACK_FILE_PATH)
+    except Exception as e:
+        raise RuntimeError(f"Failed to clear feedback file: {str(e)}") from e
+    with _index_lock:
+        _index = None
+    clear_prompt_cache()
+
+
+def _entry_key(entry: Dict[str, Any]) -> Tuple[str, str]:
+    """Get the sort key of a feedback entry: timestamp, then ID."""
+    return entry.get("timestamp", ""), entry.get("id", "")
+
+
+def _empty_stats() -> Dict[str, int]:
+    return {"total": 0, "positive": 0, "negative": 0}
+
+
+class _FeedbackIndex:
+    """Feedback entries grouped by document, with incrementally maintained statistics.
+
+    The index follows the active log: entries appended since the last read
+    are parsed from the previous end offset, so refreshing costs time
+    proportional to the new entries only, including when the active log is
+    rotated. It is rebuilt from scratch when the log is compacted or replaced;
+    a replaced log is detected by its file ID or by the bytes before the end
+    offset, which differ even if a new log reuses the file ID of the old one.
+    """
+
+    def __init__(self, path: str, archive: Tuple[Any, ...]):
+        self.path = path
+        self.archive = archive
+        self.offset = 0
+        self.file_id: Optional[int] = None
+        # Bytes of the active log just before offset
+        self.tail = b""
+        # Entries sorted by timestamp, oldest first
+        self.entries: List[Dict[str, Any]] = []
+        self.documents: Dict[Optional[str], List[Dict[str, Any]]] = {}
+        self.questions: Dict[Optional[str], Dict[str, List[Dict[str, Any]]]] = {}
+        self.stats = _empty_stats()
+        self.document_stats: Dict[Optional[str], Dict[str, int]] = {}
+
+    def add(self, entry: Dict[str, Any]) -> None:
+        """Add an entry to the index and update the statistics."""
+        doc_hash = entry.get("doc_hash")
+        bisect.insort(self.entries, entry, key=_entry_key)
+        bisect.insort(self.documents.setdefault(doc_hash, []), entry, key=_entry_key)
+        self.questions.setdefault(doc_hash, {}).setdefault(
+            normalize_question(entry.get("question", "")), []
+        ).append(entry)
+
+        document_stats = self.document_stats.setdefault(doc_hash, _empty_stats())
+        rating = {"up": "positive", "down": "negative"}.get(entry.get("rating"))
+        for stats in (self.stats, document_stats):
+            stats["total"] += 1
+            if rating:
+                stats[rating] += 1
+
+
+# Index of the feedback log, updated as the log grows
+_index: Optional[_FeedbackIndex] = None
+_index_lock = threading.Lock()
+
+
+def _rotated(index: _FeedbackIndex, archive: Tuple[Any, ...]) -> bool:
+    """Check whether the only change to the archive is the rotation of the indexed log."""
+    return (
+        index.file_id is not None
+        and len(archive) == len(index.archive) + 1
+        and archive[:-1] == index.archive
+        and archive[-1][1] == index.file_id
+    )
+
+
+def _get_index() -> _FeedbackIndex:
+    """Get the feedback index, reading only what was written since the last call."""
+    global _index
+    # Entries saved by this process must be visible; returns at once if none are queued
+    flush_feedback()
+    path = str(FEEDBACK_FILE_PATH)
+    with log_lock(path, shared=True), _index_lock:
+        archive = archive_signature(path)
         try:
-            feedback_path.unlink()
-        except Exception as e:
-            raise RuntimeError(f"Failed to clear feedback file: {str(e)}") from e
+            stat = Path(path).stat()
+            file_id, size = stat.st_ino, stat.st_size
+        except FileNotFoundError:
+            file_id, size = None, 0
+
+        index = _index
+        if index is not None and index.path == path and _rotated(index, archive):
+            # The indexed active log became the newest segment; finish reading it
+            entries = read_log_tail(Path(path).with_name(archive[-1][0]), index.offset)[0]
+            for entry in entries:
+                index.add(entry)
+            index.archive, index.offset, index.file_id, index.tail = archive, 0, None, b""
 
+        if (
+            index is None
+            or index.path != path
+            or index.archive != archive
+            or (index.file_id is not None and index.file_id != file_id)
+            or size < index.offset
+            or read_log_bytes_before(path, index.offset) != index.tail
+        ):
+            index = _FeedbackIndex(path, archive)
+            for entry in read_archive(path):
+                index.add(entry)
 
-def load_feedback(limit: Optional[int] = None) -> List[Dict[str, Any]]:
-    """Load feedback history from the JSONL file.
+        if size > index.offset:
+            entries, index.offset, index.file_id = read_log_tail(path, index.offset)
+            index.tail = read_log_bytes_before(path, index.offset)
+            for entry in entries:
+                index.add(entry)
+        _index = index
+        return index
+
+
+def load_feedback(
+    limit: Optional[int] = None, doc_hash: Optional[str] = None
+) -> List[Dict[str, Any]]:
+    """Load feedback history from the feedback log.
+
+    Reads the compacted snapshot followed by the rotated segments and the
+    active JSONL file. The parsed log is kept in memory and only entries
+    appended since the previous call are read.
 
     Args:
         limit: Optional limit on number of feedback entries to return.
+        doc_hash: Optional content hash of a document; if provided, only
+                  feedback given on that document is returned.
 
     Returns:
         List of feedback dictionaries, most recent first.
     """
-    feedback_path = Path(FEEDBACK_FILE_PATH)
-    if not feedback_path.exists():
-        return []
+    return load_feedback_page(limit=limit, doc_hash=doc_hash)[0]
 
-    feedback_entries = []
+
+def load_feedback_page(
+    cursor: Optional[str] = None, limit: Optional[int] = None, doc_hash: Optional[str] = None
+) -> Tuple[List[Dict[str, Any]], Optional[str]]:
+    """Load a page of feedback history, most recent first.
+
+    Args:
+        cursor: Cursor returned with the previous page; if not provided,
+                starts with the most recent entry.
+        limit: Maximum number of entries on the page. If not provided,
+               returns all remaining entries.
+        doc_hash: Optional content hash of a document; if provided, only
+                  feedback given on that document is returned.
+
+    Returns:
+        Tuple of (entries, cursor of the next page or None if this is the
+        last page).
+    """
     try:
-        with open(feedback_path, "r", encoding="utf-8") as f:
-            for line in f:
-                line = line.strip()
-                if line:
-                    try:
-                        feedback_entries.append(json.loads(line))
-                    except json.JSONDecodeError:
-                        # Skip malformed lines
-                        continue
+        index = _get_index()
     except OSError:
         # File may be locked or inaccessible, return empty list
-        return []
+        return [], None
 
-    feedback_entries.sort(key=lambda x: x.get("timestamp", ""), reverse=True)
-    return feedback_entries[:limit] if limit else feedback_entries
+    with _index_lock:
+        entries = index.entries if doc_hash is None else index.documents.get(doc_hash, [])
+        end = len(entries)
+        if cursor:
+            end = bisect.bisect_left(entries, tuple(json.loads(cursor)), key=_entry_key)
+        start = max(0, end - limit) if limit else 0
 
+        page = entries[start:end][::-1]
+        next_cursor = json.dumps(list(_entry_key(entries[start]))) if start > 0 else None
+    return page, next_cursor
 
-def get_feedback_stats() -> Dict[str, int]:
+
+def get_feedback_stats(doc_hash: Optional[str] = None) -> Dict[str, int]:
     """Get statistics about feedback collected.
 
+    Statistics are maintained as entries are indexed, so this does not
+    depend on the amount of feedback.
+
+    Args:
+        doc_hash: Optional content hash of a document to restrict the
+                  statistics to.
+
     Returns:
         Dictionary with feedback statistics including total count,
         positive/negative counts.
     """
     try:
-        feedback_entries = load_feedback()
-    except (OSError, json.JSONDecodeError):
-        return {"total": 0, "positive": 0, "negative": 0}
-
-    return {
-        "total": len(feedback_entries),
-        "positive": sum(1 for entry in feedback_entries if entry.get("rating") == "up"),
-        "negative": sum(1 for entry in feedback_entries if entry.get("rating") == "down"),
-    }
+        index = _get_index()
+    except OSError:
+        return _empty_stats()
+
+    with _index_lock:
+        stats = index.stats if doc_hash is None else index.document_stats.get(doc_hash)
+        return dict(stats or _empty_stats())
 
 
-def get_feedback_for_question(question: str) -> List[Dict[str, Any]]:
+def get_feedback_for_question(
+    question: str, doc_hash: Optional[str] = None
+) -> List[Dict[str, Any]]:
     """Get feedback entries for a specific question (or similar questions).
 
+    Questions match if their normalized text (case, whitespace and trailing
+    punctuation ignored) is equal to or contains the normalized question.
+
     Args:
         question: The question to search for.
+        doc_hash: Optional content hash of the active document; if provided,
+                  only feedback given on that document is searched.
 
     Returns:
-        List of feedback entries related to the question.
+        List of feedback entries related to the question, most recent first.
     """
-    all_feedback = load_feedback()
-    question_lower = question.lower().strip()
-
-    return [
-        entry
-        for entry in all_feedback
-        if question_lower == entry.get("question", "").lower().strip()
-        or question_lower in entry.get("question", "").lower().strip()
-    ]
+    normalized = normalize_question(question)
+    if not normalized:
+        # An empty string is contained in every question
+        return []
+
+    try:
+        index = _get_index()
+    except OSError:
+        return []
+
+    # Another thread may be adding entries to the index; collect under its lock
+    with _index_lock:
+        if doc_hash is None:
+            documents = list(index.questions.values())
+        else:
+            documents = [index.questions.get(doc_hash, {})]
+        matches = [
+            entry
+            for questions in documents
+            for entry_question, entries in questions.items()
+            if normalized in entry_question
+            for entry in entries
+        ]
+    matches.sort(key=_entry_key, reverse=True)
+    return matches
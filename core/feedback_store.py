@@ -0,0 +1,394 @@
+"""Segmented feedback log with compaction and a compact snapshot.
+
+The feedback log at FEEDBACK_FILE_PATH is the active JSONL segment. Once it
+grows past FEEDBACK_SEGMENT_BYTES it is rotated to a numbered segment
+(feedback.000001.jsonl, ...). When more than FEEDBACK_MAX_SEGMENTS segments
+accumulate, all segments are compacted into a snapshot (feedback.snapshot):
+only the latest FEEDBACK_KEEP_PER_QUESTION entries per normalized question
+within the FEEDBACK_RETENTION_DAYS window are kept, stored column by column
+as zlib-compressed JSON, which loads much faster than many small JSON lines.
+
+All operations on the log hold a lock on a separate lock file
+(feedback.jsonl.lock), so processes sharing the log see consistent segments.
+"""
+
+import json
+import os
+import re
+import tempfile
+import zlib
+from contextlib import contextmanager
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+from typing import IO, Any, Dict, Iterator, List, Optional, Tuple, Union
+
+from config.settings import (
+    FEEDBACK_KEEP_PER_QUESTION,
+    FEEDBACK_MAX_SEGMENTS,
+    FEEDBACK_RETENTION_DAYS,
+    FEEDBACK_SEGMENT_BYTES,
+)
+
+try:
+    import fcntl
+except ImportError:  # pragma: no cover - Windows
+    fcntl = None
+
+# Version of the snapshot format, bumped on incompatible changes
+SNAPSHOT_VERSION = 1
+
+
+@contextmanager
+def locked_file(file: IO[Any], shared: bool = False) -> Iterator[IO[Any]]:
+    """Hold an advisory lock on an open file shared with other processes.
+
+    Args:
+        file: Open file object.
+        shared: Whether to take a shared (read) lock instead of an exclusive one.
+
+    Yields:
+        The locked file object.
+    """
+    if fcntl is None:
+        yield file
+        return
+    fcntl.flock(file.fileno(), fcntl.LOCK_SH if shared else fcntl.LOCK_EX)
+    try:
+        yield file
+    finally:
+        fcntl.flock(file.fileno(), fcntl.LOCK_UN)
+
+
+@contextmanager
+def log_lock(path: Union[str, Path], shared: bool = False) -> Iterator[None]:
+    """Lock a feedback log, including its segments and snapshot.
+
+    Args:
+        path: Path to the active feedback log.
+        shared: Whether to take a shared (read) lock instead of an exclusive one.
+    """
+    path = Path(path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    with open(f"{path}.lock", "a") as f, locked_file(f, shared=shared):
+        yield
+
+
+def normalize_question(question: str) -> str:
+    """Normalize a question for matching: case, whitespace and trailing punctuation.
+
+    Shared by feedback grouping, the query embedding cache and QA request
+    coalescing, so all of them treat the same questions as equal.
+    """
+    return " ".join(question.lower().split()).rstrip("?!. ")
+
+
+def snapshot_path(path: Union[str, Path]) -> Path:
+    """Get the snapshot path of a feedback log."""
+    path = Path(path)
+    return path.with_name(f"{path.stem}.snapshot")
+
+
+def _numbered_segments(path: Path) -> List[Tuple[int, Path]]:
+    """Get the (number, path) pairs of the rotated segments of a log, oldest first."""
+    pattern = re.compile(rf"{re.escape(path.stem)}\.(\d+){re.escape(path.suffix)}")
+    return sorted(
+        (int(match.group(1)), candidate)
+        for candidate in path.parent.glob(f"{path.stem}.*{path.suffix}")
+        if (match := pattern.fullmatch(candidate.name))
+    )
+
+
+def segment_paths(path: Union[str, Path]) -> List[Path]:
+    """Get the rotated segments of a feedback log, oldest first."""
+    return [segment for _, segment in _numbered_segments(Path(path))]
+
+
+def rotate_segment(path: Union[str, Path], max_bytes: Optional[int] = None) -> bool:
+    """Rotate the active log to a numbered segment if it has grown too large.
+
+    Must be called while holding the exclusive log lock.
+
+    Args:
+        path: Path to the active feedback log.
+        max_bytes: Size from which the log is rotated. If not provided, uses
+                   FEEDBACK_SEGMENT_BYTES from settings.
+
+    Returns:
+        True if the log was rotated.
+    """
+    path = Path(path)
+    max_bytes = FEEDBACK_SEGMENT_BYTES if max_bytes is None else max_bytes
+    try:
+        if path.stat().st_size < max_bytes:
+            return False
+    except FileNotFoundError:
+        return False
+
+    segments = _numbered_segments(path)
+    number = segments[-1][0] + 1 if segments else 1
+    os.replace(path, path.with_name(f"{path.stem}.{number:06d}{path.suffix}"))
+    return True
+
+
+def archive_signature(path: Union[str, Path]) -> Tuple[Tuple[str, int, int, int], ...]:
+    """Get a signature of the snapshot and rotated segments of a feedback log.
+
+    The signature changes on rotation and compaction, but not on appends to
+    the active log.
+
+    Args:
+        path: Path to the active feedback log.
+
+    Returns:
+        Tuple of (file name, file ID, size, modification time) of the
+        archived files, snapshot first.
+    """
+    signature = []
+    for file in [snapshot_path(path), *segment_paths(path)]:
+        try:
+            stat = file.stat()
+        except FileNotFoundError:
+            continue
+        signature.append((file.name, stat.st_ino, stat.st_size, stat.st_mtime_ns))
+    return tuple(signature)
+
+
+def _parse_lines(data: bytes) -> List[Dict[str, Any]]:
+    """Parse JSON lines, skipping malformed lines."""
+    entries = []
+    for line in data.decode("utf-8", errors="replace").splitlines():
+        line = line.strip()
+        if line:
+            try:
+                entries.append(json.loads(line))
+            except json.JSONDecodeError:
+                # Skip malformed lines
+                continue
+    return entries
+
+
+def _read_jsonl(path: Path) -> List[Dict[str, Any]]:
+    """Read the entries of a JSONL segment, skipping malformed lines."""
+    try:
+        return _parse_lines(path.read_bytes())
+    except FileNotFoundError:
+        return []
+
+
+def read_log_tail(
+    path: Union[str, Path], offset: int = 0
+) -> Tuple[List[Dict[str, Any]], int, Optional[int]]:
+    """Read the entries appended to the active feedback log after a byte offset.
+
+    Should be called while holding the log lock.
+
+    Args:
+        path: Path to the active feedback log.
+        offset: Byte offset to read from, as returned by a previous call.
+
+    Returns:
+        Tuple of (entries, offset after the last complete line, file ID of the
+        active log or None if it does not exist). A different file ID means the
+        log was replaced and must be read again from the start.
+    """
+    try:
+        f = open(path, "rb")
+    except FileNotFoundError:
+        return [], 0, None
+    with f:
+        file_id = os.fstat(f.fileno()).st_ino
+        f.seek(offset)
+        data = f.read()
+    end = data.rfind(b"\n") + 1
+    return _parse_lines(data[:end]), offset + end, file_id
+
+
+def read_log_bytes_before(path: Union[str, Path], offset: int, size: int = 64) -> bytes:
+    """Read the bytes of the active feedback log just before a byte offset.
+
+    Used to check that the log read up to an offset has not been replaced
+    since, even by a new file that reuses the file ID of the old one.
+
+    Args:
+        path: Path to the active feedback log.
+        offset: Byte offset, as returned by read_log_tail.
+        size: Maximum number of bytes to read.
+
+    Returns:
+        The bytes before the offset, or an empty byte string if the log does
+        not exist or is shorter than the offset.
+    """
+    try:
+        with open(path, "rb") as f:
+            f.seek(max(0, offset - size))
+            data = f.read(min(offset, size))
+    except FileNotFoundError:
+        return b""
+    return data if len(data) == min(offset, size) else b""
+
+
+def read_snapshot(path: Union[str, Path]) -> List[Dict[str, Any]]:
+    """Read the entries of a feedback log snapshot.
+
+    Args:
+        path: Path to the active feedback log.
+
+    Returns:
+        Snapshot entries, or an empty list if there is no valid snapshot.
+    """
+    try:
+        data = json.loads(zlib.decompress(snapshot_path(path).read_bytes()))
+    except (FileNotFoundError, zlib.error, ValueError):
+        return []
+    if data.get("version") != SNAPSHOT_VERSION:
+        return []
+
+    columns: Dict[str, List[Any]] = data["columns"]
+    return [
+        {key: value for key, value in zip(columns, row) if value is not None}
+        for row in zip(*columns.values())
+    ]
+
+
+def write_snapshot(path: Union[str, Path], entries: List[Dict[str, Any]]) -> None:
+    """Atomically replace the snapshot of a feedback log.
+
+    Args:
+        path: Path to the active feedback log.
+        entries: Entries to store.
+    """
+    keys = list(dict.fromkeys(key for entry in entries for key in entry))
+    data = {
+        "version": SNAPSHOT_VERSION,
+        "columns": {key: [entry.get(key) for entry in entries] for key in keys},
+    }
+    target = snapshot_path(path)
+    fd, tmp_path = tempfile.mkstemp(dir=target.parent, prefix=f".{target.name}.")
+    try:
+        with os.fdopen(fd, "wb") as f:
+            f.write(zlib.compress(json.dumps(data, separators=(",", ":")).encode("utf-8")))
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp_path, target)
+    except BaseException:
+        Path(tmp_path).unlink(missing_ok=True)
+        raise
+
+
+def read_archive(path: Union[str, Path]) -> List[Dict[str, Any]]:
+    """Read the entries of the snapshot and rotated segments of a feedback log.
+
+    Should be called while holding the log lock.
+
+    Args:
+        path: Path to the active feedback log.
+
+    Returns:
+        Entries in write order.
+    """
+    entries = read_snapshot(path)
+    for segment in segment_paths(path):
+        entries.extend(_read_jsonl(segment))
+    return entries
+
+
+def read_entries(path: Union[str, Path]) -> List[Dict[str, Any]]:
+    """Read all entries of a feedback log: snapshot, segments and active log.
+
+    Should be called while holding the log lock.
+
+    Args:
+        path: Path to the active feedback log.
+
+    Returns:
+        Entries in write order.
+    """
+    return read_archive(path) + read_log_tail(path)[0]
+
+
+def compact_entries(
+    entries: List[Dict[str, Any]],
+    keep_per_question: Optional[int] = None,
+    retention_days: Optional[int] = None,
+    now: Optional[datetime] = None,
+) -> List[Dict[str, Any]]:
+    """Apply the compaction and retention policies to feedback entries.
+
+    Args:
+        entries: Entries in write order.
+        keep_per_question: Number of most recent entries kept per document
+                           and normalized question (0 keeps all). If not
+                           provided, uses FEEDBACK_KEEP_PER_QUESTION from settings.
+        retention_days: Age in days after which entries are dropped (0 keeps
+                        all). If not provided, uses FEEDBACK_RETENTION_DAYS
+                        from settings.
+        now: Current time, used for retention.
+
+    Returns:
+        Kept entries, oldest first.
+    """
+    keep = FEEDBACK_KEEP_PER_QUESTION if keep_per_question is None else keep_per_question
+    days = FEEDBACK_RETENTION_DAYS if retention_days is None else retention_days
+
+    ordered = sorted(entries, key=lambda entry: entry.get("timestamp", ""))
+    if days > 0:
+        cutoff = ((now or datetime.now(timezone.utc)) - timedelta(days=days)).isoformat()
+        ordered = [entry for entry in ordered if entry.get("timestamp", "") >= cutoff]
+    if keep <= 0:
+        return ordered
+
+    # Feedback is scoped per document, so each document keeps its own entries
+    kept: List[Dict[str, Any]] = []
+    counts: Dict[Tuple[Optional[str], str], int] = {}
+    for entry in reversed(ordered):
+        key = (entry.get("doc_hash"), normalize_question(entry.get("question", "")))
+        if counts.get(key, 0) < keep:
+            counts[key] = counts.get(key, 0) + 1
+            kept.append(entry)
+    kept.reverse()
+    return kept
+
+
+def compact_log(path: Union[str, Path], **policy: Any) -> int:
+    """Compact a feedback log into its snapshot and remove the merged segments.
+
+    Must be called while holding the exclusive log lock.
+
+    Args:
+        path: Path to the active feedback log.
+        **policy: Optional keep_per_question and retention_days overrides,
+                  see compact_entries.
+
+    Returns:
+        Number of entries kept in the snapshot.
+    """
+    path = Path(path)
+    entries = compact_entries(read_entries(path), **policy)
+    write_snapshot(path, entries)
+    for segment in [*segment_paths(path), path]:
+        segment.unlink(missing_ok=True)
+    return len(entries)
+
+
+def maybe_compact(path: Union[str, Path]) -> bool:
+    """Compact a feedback log if it has more than FEEDBACK_MAX_SEGMENTS segments.
+
+    Must be called while holding the exclusive log lock.
+
+    Returns:
+        True if the log was compacted.
+    """
+    if len(segment_paths(path)) <= FEEDBACK_MAX_SEGMENTS:
+        return False
+    compact_log(path)
+    return True
+
+
+def delete_log(path: Union[str, Path]) -> None:
+    """Delete a feedback log with its segments and snapshot.
+
+    Must be called while holding the exclusive log lock.
+    """
+    path = Path(path)
+    for file in [snapshot_path(path), *segment_paths(path), path]:
+        file.unlink(missing_ok=True)
@@ -0,0 +1,197 @@
+"""Group-commit writer for the feedback log.
+
+Feedback entries are appended to a JSONL file by a background thread that
+writes queued entries in batches and calls fsync once per batch instead of
+once per entry. Appends hold the exclusive log lock, so several processes
+can share the same log without interleaving lines; before each append the
+log is rotated and compacted as configured (see core.feedback_store).
+
+Durability levels:
+    sync: the entry is written and fsynced by the caller before returning.
+    group: the caller waits until the batch containing the entry is fsynced.
+    async: the caller returns at once; the batch is fsynced in the background
+           after FEEDBACK_FLUSH_INTERVAL seconds or FEEDBACK_BATCH_SIZE entries.
+"""
+
+import atexit
+import json
+import logging
+import os
+import queue
+import threading
+import time
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Union
+
+from config.settings import FEEDBACK_BATCH_SIZE, FEEDBACK_DURABILITY, FEEDBACK_FLUSH_INTERVAL
+from core.feedback_store import log_lock, maybe_compact, rotate_segment
+
+logger = logging.getLogger(__name__)
+
+DURABILITY_LEVELS = ("sync", "group", "async")
+
+
+class _Pending:
+    """A queued feedback line, or a flush marker if the line is None."""
+
+    def __init__(self, line: Optional[str]):
+        self.line = line
+        self.done = threading.Event()
+        self.error: Optional[Exception] = None
+
+
+class FeedbackWriter:
+    """Append feedback entries to a JSONL file with group commit."""
+
+    def __init__(
+        self,
+        path: Union[str, Path],
+        durability: Optional[str] = None,
+        batch_size: Optional[int] = None,
+        flush_interval: Optional[float] = None,
+    ):
+        """Create a writer for a feedback file.
+
+        Args:
+            path: Path to the JSONL feedback file.
+            durability: "sync", "group" or "async". If not provided, uses
+                        FEEDBACK_DURABILITY from settings.
+            batch_size: Maximum number of entries per write and fsync. If not
+                        provided, uses FEEDBACK_BATCH_SIZE from settings.
+            flush_interval: Seconds to wait for more entries before an "async"
+                            batch is written. If not provided, uses
+                            FEEDBACK_FLUSH_INTERVAL from settings.
+
+        Raises:
+            ValueError: If the durability level is unknown.
+        """
+        self.path = Path(path)
+        self.durability = durability or FEEDBACK_DURABILITY
+        if self.durability not in DURABILITY_LEVELS:
+            raise ValueError(f"Unknown feedback durability level: {self.durability}")
+        self.batch_size = max(1, batch_size or FEEDBACK_BATCH_SIZE)
+        self.flush_interval = FEEDBACK_FLUSH_INTERVAL if flush_interval is None else flush_interval
+
+        self._queue: "queue.Queue[_Pending]" = queue.Queue()
+        self._thread: Optional[threading.Thread] = None
+        self._thread_lock = threading.Lock()
+        # Entries queued but not yet written, so flush can return at once
+        self._unwritten = 0
+        self._unwritten_lock = threading.Lock()
+
+    def append(self, entry: Dict[str, Any]) -> None:
+        """Append a feedback entry to the file.
+
+        Args:
+            entry: JSON-serializable feedback entry.
+
+        Raises:
+            RuntimeError: If the entry cannot be written (not raised in
+                          "async" mode, where failures are logged).
+        """
+        line = json.dumps(entry) + "\n"
+        if self.durability == "sync":
+            self._write([line])
+            return
+
+        pending = _Pending(line)
+        self._start()
+        with self._unwritten_lock:
+            self._unwritten += 1
+        self._queue.put(pending)
+        if self.durability == "group":
+            pending.done.wait()
+            if pending.error is not None:
+                raise pending.error
+
+    def flush(self) -> None:
+        """Wait until all queued entries have been written and fsynced."""
+        if self._thread is None or not self.has_pending():
+            return
+        marker = _Pending(None)
+        self._queue.put(marker)
+        marker.done.wait()
+
+    def has_pending(self) -> bool:
+        """Check whether queued entries are still waiting to be written."""
+        with self._unwritten_lock:
+            return self._unwritten > 0
+
+    def _start(self) -> None:
+        """Start the background writer thread if it is not running."""
+        with self._thread_lock:
+            if self._thread is None:
+                self._thread = threading.Thread(
+                    target=self._run, name="feedback-writer", daemon=True
+                )
+                self._thread.start()
+                atexit.register(self.flush)
+
+    def _next_batch(self) -> List[_Pending]:
+        """Block for the next queued entry and gather a batch around it."""
+        batch = [self._queue.get()]
+        wait = self.flush_interval if self.durability == "async" else 0.0
+        deadline = time.monotonic() + wait
+        while len(batch) < self.batch_size and batch[-1].line is not None:
+            try:
+                timeout = deadline - time.monotonic()
+                if timeout > 0:
+                    batch.append(self._queue.get(timeout=timeout))
+                else:
+                    batch.append(self._queue.get_nowait())
+            except queue.Empty:
+                break
+        return batch
+
+    def _run(self) -> None:
+        """Write queued entries in batches, one fsync per batch."""
+        while True:
+            batch = self._next_batch()
+            lines = [pending.line for pending in batch if pending.line is not None]
+            error: Optional[Exception] = None
+            if lines:
+                try:
+                    self._write(lines)
+                except RuntimeError as e:
+                    error = e
+                    if self.durability == "async":
+                        logger.error("%s (%d entries lost)", e, len(lines))
+            with self._unwritten_lock:
+                self._unwritten -= len(lines)
+            for pending in batch:
+                pending.error = error if pending.line is not None else None
+                pending.done.set()
+
+    def _write(self, lines: List[str]) -> None:
+        """Append lines to the log under the exclusive log lock and fsync it."""
+        try:
+            with log_lock(self.path):
+                if rotate_segment(self.path):
+                    maybe_compact(self.path)
+                with open(self.path, "a", encoding="utf-8") as f:
+                    f.write("".join(lines))
+                    f.flush()
+                    os.fsync(f.fileno())
+        except Exception as e:
+            raise RuntimeError(f"Failed to save feedback to {self.path}: {str(e)}") from e
+
+
+# Writers by feedback file path, shared by all sessions of the process
+_writers: Dict[str, FeedbackWriter] = {}
+_writers_lock = threading.Lock()
+
+
+def get_feedback_writer(path: Union[str, Path]) -> FeedbackWriter:
+    """Get the process-wide writer of a feedback file.
+
+    Args:
+        path: Path to the JSONL feedback file.
+
+    Returns:
+        Writer shared by all callers writing to the same file.
+    """
+    with _writers_lock:
+        writer = _writers.get(str(path))
+        if writer is None:
+            writer = _writers[str(path)] = FeedbackWriter(path)
+        return writer
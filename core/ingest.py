@@ -1,55 +1,191 @@
 """PDF ingestion module for extracting text from PDF files."""
 
+import hashlib
+import sqlite3
+from contextlib import ExitStack
 from pathlib import Path
-from typing import List, Union
+from typing import Dict, Iterator, List, Optional, Union
 
-import pdfplumber
 from langchain_core.documents import Document
 
+from config.settings import PAGE_CACHE_PATH, PDF_EXTRACTOR
+from core.extractors import get_backend
+from core.page_cache import load_cached_pages, load_page_count, save_cached_pages
 
-def load_pdf(pdf_path: Union[str, Path]) -> List[Document]:
-    """Load a PDF file and extract text page by page.
+# Block size used when hashing files
+HASH_BLOCK_SIZE = 1024 * 1024
 
-    Extracts text from each page of the PDF and creates LangChain Document
-    objects with page numbers in metadata. Handles empty or malformed pages
-    gracefully by skipping them or including empty text.
+# Number of pages read from or written to the page cache at a time
+PAGE_CACHE_BATCH_SIZE = 32
+
+# Page cache errors that must not fail an extraction: database errors and an
+# unwritable cache directory
+_PAGE_CACHE_ERRORS = (sqlite3.Error, OSError)
+
+
+def compute_file_hash(file_path: Union[str, Path]) -> str:
+    """Compute the SHA-256 hash of a file's content.
 
     Args:
-        pdf_path: Path to the PDF file to load.
+        file_path: Path to the file to hash.
 
     Returns:
-        List of LangChain Document objects, each containing:
+        Hex-encoded SHA-256 digest.
+    """
+    digest = hashlib.sha256()
+    with open(file_path, "rb") as f:
+        for block in iter(lambda: f.read(HASH_BLOCK_SIZE), b""):
+            digest.update(block)
+    return digest.hexdigest()
+
+
+def _save_pages(pdf_hash: str, settings: str, page_count: int, pages: Dict[int, str]) -> None:
+    """Store extracted page text in the page cache, ignoring cache errors."""
+    try:
+        save_cached_pages(pdf_hash, settings, page_count, pages)
+    except _PAGE_CACHE_ERRORS:
+        # An unwritable cache must not fail the extraction
+        pass
+
+
+def _load_pages(pdf_hash: str, settings: str, start: int, stop: int) -> Dict[int, str]:
+    """Load a window of cached page text, treating an unreadable cache as empty."""
+    try:
+        return load_cached_pages(pdf_hash, settings, start, stop)
+    except _PAGE_CACHE_ERRORS:
+        return {}
+
+
+def iter_pdf_pages(
+    pdf_path: Union[str, Path],
+    first_page: int = 1,
+    last_page: Optional[int] = None,
+    use_cache: bool = True,
+    extractor: Optional[str] = None,
+) -> Iterator[Document]:
+    """Extract text from a PDF file lazily, one page at a time.
+
+    Yields one LangChain Document per page as soon as its text is extracted
+    and releases the page's layout cache before moving on, so memory use stays
+    constant however many pages the file has. Extracted page text is cached in
+    PAGE_CACHE_PATH by PDF content hash and read back in windows of
+    PAGE_CACHE_BATCH_SIZE pages; if every requested page is cached, the PDF is
+    not opened at all.
+
+    Args:
+        pdf_path: Path to the PDF file to load.
+        first_page: Number of the first page to extract (1-indexed).
+        last_page: Number of the last page to extract (inclusive). If not
+                   provided, extracts up to the end of the document.
+        use_cache: Whether to read and write the page text cache.
+        extractor: Text extraction backend ("auto", "pdfium" or "pdfplumber").
+                   If not provided, uses PDF_EXTRACTOR from settings.
+
+    Yields:
+        LangChain Document objects, each containing:
         - page_content: The extracted text from the page
         - metadata: Dictionary with 'page' key containing the page number (1-indexed)
 
     Raises:
         FileNotFoundError: If the PDF file does not exist.
-        ValueError: If the file is not a valid PDF.
+        ValueError: If the page range or extractor is invalid, or the file is
+                    not a valid PDF.
     """
     pdf_path = Path(pdf_path)
 
     if not pdf_path.exists():
         raise FileNotFoundError(f"PDF file not found: {pdf_path}")
 
-    documents: List[Document] = []
+    if first_page < 1 or (last_page is not None and last_page < first_page):
+        raise ValueError(f"Invalid page range: {first_page}-{last_page}")
+
+    backend = get_backend(extractor or PDF_EXTRACTOR)
+    settings = backend.cache_key()
+
+    use_cache = use_cache and bool(PAGE_CACHE_PATH)
+    page_count: Optional[int] = None
+    if use_cache:
+        pdf_hash = compute_file_hash(pdf_path)
+        try:
+            page_count = load_page_count(pdf_hash, settings)
+        except _PAGE_CACHE_ERRORS:
+            # An unreadable cache is treated as empty
+            pass
+
+    # Pages are cached only for PDFs whose page count is recorded
+    read_cache = page_count is not None
+    extracted_pages: Dict[int, str] = {}
+    cached_pages: Dict[int, str] = {}
 
     try:
-        with pdfplumber.open(pdf_path) as pdf:
-            for page_num, page in enumerate(pdf.pages, start=1):
+        with ExitStack() as stack:
+            # The PDF is opened only once a page is missing from the cache
+            document = None
+            if page_count is None:
+                document = stack.enter_context(backend(pdf_path))
+                page_count = len(document)
+
+            stop = min(last_page or page_count, page_count)
+            for index in range(first_page - 1, stop):
+                if read_cache and (index - first_page + 1) % PAGE_CACHE_BATCH_SIZE == 0:
+                    cached_pages = _load_pages(
+                        pdf_hash, settings, index, min(index + PAGE_CACHE_BATCH_SIZE, stop)
+                    )
+                if index in cached_pages:
+                    yield Document(page_content=cached_pages[index], metadata={"page": index + 1})
+                    continue
+
+                if document is None:
+                    document = stack.enter_context(backend(pdf_path))
+
                 try:
-                    text = page.extract_text()
+                    text = document.extract_text(index)
 
                     if text is None or text.strip() == "":
                         text = ""
 
-                    doc = Document(page_content=text, metadata={"page": page_num})
-                    documents.append(doc)
+                    doc = Document(page_content=text, metadata={"page": index + 1})
+                    extracted_pages[index] = text
 
                 except Exception as e:
-                    doc = Document(page_content="", metadata={"page": page_num, "error": str(e)})
-                    documents.append(doc)
+                    doc = Document(page_content="", metadata={"page": index + 1, "error": str(e)})
+
+                if use_cache and len(extracted_pages) >= PAGE_CACHE_BATCH_SIZE:
+                    _save_pages(pdf_hash, settings, page_count, extracted_pages)
+                    extracted_pages = {}
+
+                yield doc
 
     except Exception as e:
         raise ValueError(f"Failed to load PDF: {pdf_path}. Error: {e}") from e
 
-    return documents
+    if use_cache and extracted_pages:
+        _save_pages(pdf_hash, settings, page_count, extracted_pages)
+
+
+def load_pdf(
+    pdf_path: Union[str, Path], use_cache: bool = True, extractor: Optional[str] = None
+) -> List[Document]:
+    """Load a PDF file and extract text page by page.
+
+    Extracts text from each page of the PDF and creates LangChain Document
+    objects with page numbers in metadata. Handles empty or malformed pages
+    gracefully by skipping them or including empty text. See iter_pdf_pages
+    for extracting large files lazily or only a range of pages.
+
+    Args:
+        pdf_path: Path to the PDF file to load.
+        use_cache: Whether to read and write the page text cache.
+        extractor: Text extraction backend ("auto", "pdfium" or "pdfplumber").
+                   If not provided, uses PDF_EXTRACTOR from settings.
+
+    Returns:
+        List of LangChain Document objects, each containing:
+        - page_content: The extracted text from the page
+        - metadata: Dictionary with 'page' key containing the page number (1-indexed)
+
+    Raises:
+        FileNotFoundError: If the PDF file does not exist.
+        ValueError: If the file is not a valid PDF.
+    """
+    return list(iter_pdf_pages(pdf_path, use_cache=use_cache, extractor=extractor))
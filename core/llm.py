@@ -0,0 +1,24 @@
+"""Chat model facade.
+
+langchain_openai and the openai SDK beneath it take longer to import than the
+rest of the application together, so the chat model class is imported when
+the first client is created rather than when the application starts.
+"""
+
+from typing import TYPE_CHECKING
+
+from config.settings import LLM_MODEL
+
+if TYPE_CHECKING:
+    from langchain_openai import ChatOpenAI
+
+
+def create_chat_model() -> "ChatOpenAI":
+    """Create a chat model client for LLM_MODEL with deterministic output.
+
+    Returns:
+        ChatOpenAI client.
+    """
+    from langchain_openai import ChatOpenAI
+
+    return ChatOpenAI(model=LLM_MODEL, temperature=0)
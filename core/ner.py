@@ -1,24 +1,197 @@
 """Named Entity Recognition module for extracting key contract entities."""
 
+import hashlib
 import json
-from typing import Dict, List, Optional
+import os
+import tempfile
+import time
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, Dict, List, Optional, Sequence, Tuple
 
+from langchain_core.documents import Document
 from langchain_core.prompts import ChatPromptTemplate
-from langchain_openai import ChatOpenAI
+from pydantic import BaseModel, Field
 
-from config.settings import LLM_MODEL, OPENAI_API_KEY
-from core.prompts import NER_PROMPT
+from config.settings import LLM_MODEL, NER_CACHE_PATH, NER_MAX_RETRIES, OPENAI_API_KEY
+from core.entity_rules import extract_rule_entities, parse_date, select_relevant_pages
+from core.llm import create_chat_model
+from core.prompts import NER_FIELD_DESCRIPTIONS, get_ner_prompt
+from core.usage import record_llm_usage
 
+if TYPE_CHECKING:
+    from langchain_openai import ChatOpenAI
 
-def extract_entities(contract_text: str) -> Dict[str, Optional[str | List[str]]]:
+# Entity fields extracted from contracts, in display order
+ENTITY_FIELDS = tuple(NER_FIELD_DESCRIPTIONS)
+
+# Entity fields holding dates in YYYY-MM-DD format
+DATE_FIELDS = frozenset({"effective_date", "termination_date"})
+
+
+def _prompt_version(prompt: str) -> str:
+    """Get the version of an NER prompt; cached results of other versions are ignored."""
+    return hashlib.sha256(prompt.encode("utf-8")).hexdigest()[:16]
+
+
+def _entity_cache_key(contract_text: str, prompt: str) -> str:
+    """Build the entity cache key from the text, the NER prompt version and the LLM model."""
+    digest = hashlib.sha256()
+    for part in (_prompt_version(prompt), LLM_MODEL, contract_text):
+        digest.update(part.encode("utf-8"))
+        digest.update(b"\0")
+    return digest.hexdigest()
+
+
+def load_cached_entities(
+    contract_text: str, fields: Optional[Sequence[str]] = None
+) -> Optional[Dict[str, Optional[str | List[str]]]]:
+    """Load previously extracted entities for a contract text from the cache.
+
+    Args:
+        contract_text: Full text content of the contract.
+        fields: Entity fields that were extracted. Defaults to all fields.
+
+    Returns:
+        Cached entities dictionary, or None on a cache miss.
+    """
+    cache_key = _entity_cache_key(contract_text, get_ner_prompt(fields))
+    cache_file = Path(NER_CACHE_PATH) / f"{cache_key}.json"
+    try:
+        with open(cache_file, "r", encoding="utf-8") as f:
+            return json.load(f)["entities"]
+    except (OSError, ValueError, KeyError):
+        return None
+
+
+def save_cached_entities(
+    contract_text: str,
+    entities: Dict[str, Optional[str | List[str]]],
+    fields: Optional[Sequence[str]] = None,
+) -> None:
+    """Store extracted entities for a contract text in the cache.
+
+    The entry is written to a temporary file and renamed into place, so
+    concurrent processes never read a partially written entry.
+
+    Args:
+        contract_text: Full text content of the contract.
+        entities: Extracted entities dictionary.
+        fields: Entity fields that were extracted. Defaults to all fields.
+    """
+    prompt = get_ner_prompt(fields)
+    cache_dir = Path(NER_CACHE_PATH)
+    cache_dir.mkdir(parents=True, exist_ok=True)
+    entry = {"prompt_version": _prompt_version(prompt), "model": LLM_MODEL, "entities": entities}
+
+    fd, temp_path = tempfile.mkstemp(dir=cache_dir, suffix=".tmp")
+    try:
+        with os.fdopen(fd, "w", encoding="utf-8") as f:
+            json.dump(entry, f, ensure_ascii=False)
+        os.replace(temp_path, cache_dir / f"{_entity_cache_key(contract_text, prompt)}.json")
+    except BaseException:
+        Path(temp_path).unlink(missing_ok=True)
+        raise
+
+
+class ContractEntities(BaseModel):
+    """Key entities of a contract as returned by the LLM."""
+
+    parties: Optional[List[str]] = Field(None, description="Names of the contracting parties")
+    effective_date: Optional[str] = Field(
+        None, description="Date the contract becomes effective, YYYY-MM-DD"
+    )
+    termination_date: Optional[str] = Field(
+        None, description="Date the contract terminates or expires, YYYY-MM-DD"
+    )
+    payment_terms: Optional[str] = Field(None, description="Payment terms, amounts and schedules")
+    ip_owner: Optional[str] = Field(None, description="Owner of the intellectual property")
+    governing_law: Optional[str] = Field(
+        None, description="Jurisdiction whose law governs the contract"
+    )
+
+
+def _request_entities(
+    llm: "ChatOpenAI", contract_text: str, fields: List[str]
+) -> Optional[Dict[str, Any]]:
+    """Ask the LLM for entity fields using schema-constrained structured output.
+
+    Every request uses the full entity schema and lists the requested fields
+    after the contract text, so requests for the same contract share their
+    schema, instructions and contract text as a cacheable prompt prefix.
+
+    Returns:
+        Raw field values, or None if the response could not be parsed at all.
+    """
+    prompt = ChatPromptTemplate.from_template(get_ner_prompt(fields))
+    structured_llm = llm.with_structured_output(ContractEntities, include_raw=True)
+
+    start = time.perf_counter()
+    output = (prompt | structured_llm).invoke({"contract_text": contract_text})
+    record_llm_usage("ner", output["raw"], time.perf_counter() - start)
+
+    if output.get("parsed") is not None:
+        return output["parsed"].model_dump()
+
+    # The schema was violated; keep whichever fields are present in the raw JSON
+    try:
+        values = json.loads(output["raw"].content)
+    except (TypeError, ValueError):
+        return None
+    return values if isinstance(values, dict) else None
+
+
+def _validate_entities(
+    values: Dict[str, Any], fields: List[str]
+) -> Tuple[Dict[str, Optional[str | List[str]]], List[str]]:
+    """Normalize extracted entity values and find the invalid ones.
+
+    Returns:
+        Tuple of (valid values by field, fields whose values are invalid).
+    """
+    valid: Dict[str, Optional[str | List[str]]] = {}
+    invalid: List[str] = []
+    for field in fields:
+        value = values.get(field)
+        if isinstance(value, str):
+            value = value.strip() or None
+
+        if value is None:
+            valid[field] = None
+        elif field == "parties" and isinstance(value, list):
+            parties = [str(party).strip() for party in value if str(party).strip()]
+            valid[field] = parties or None
+        elif field in DATE_FIELDS and isinstance(value, str) and parse_date(value):
+            valid[field] = parse_date(value)
+        elif field not in DATE_FIELDS and field != "parties" and isinstance(value, str):
+            valid[field] = value
+        else:
+            invalid.append(field)
+    return valid, invalid
+
+
+def extract_entities(
+    contract_text: str,
+    use_cache: bool = True,
+    fields: Optional[Sequence[str]] = None,
+    llm: Optional["ChatOpenAI"] = None,
+) -> Dict[str, Optional[str | List[str]]]:
     """
     Extract key entities from contract text using LLM.
 
     Extracts structured information including parties, dates, payment terms,
-    IP ownership, and governing law from the provided contract text.
+    IP ownership, and governing law from the provided contract text. The LLM
+    fills in a typed entity schema; fields with invalid values are requested
+    again, up to NER_MAX_RETRIES times, and set to None if still invalid. Results
+    are cached on disk by a hash of the text, the NER prompt version and the
+    LLM model, so re-uploading the same contract skips the LLM call.
 
     Args:
         contract_text: Full text content of the contract.
+        use_cache: Whether to read and write the persistent entity cache.
+        fields: Entity fields to extract. If provided, the prompt asks only
+                for these fields and only they are returned.
+        llm: Optional chat model to reuse. If not provided, a client for
+             LLM_MODEL is created.
 
     Returns:
         Dictionary containing extracted entities with the following keys:
@@ -32,64 +205,78 @@ def extract_entities(contract_text: str) -> Dict[str, Optional[str | List[str]]]
     Raises:
         ValueError: If contract_text is empty.
         RuntimeError: If OPENAI_API_KEY is not set.
-        ValueError: If the LLM response cannot be parsed as valid JSON.
     """
     if not contract_text or not contract_text.strip():
         raise ValueError("Contract text cannot be empty")
 
+    if use_cache:
+        cached = load_cached_entities(contract_text, fields)
+        if cached is not None:
+            return cached
+
     if not OPENAI_API_KEY:
         raise RuntimeError("OPENAI_API_KEY is required for entity extraction")
 
-    # Initialize LLM
-    llm = ChatOpenAI(model=LLM_MODEL, temperature=0)
+    llm = llm or create_chat_model()
+    requested = list(fields or ENTITY_FIELDS)
 
-    # Create prompt template from NER_PROMPT
-    prompt = ChatPromptTemplate.from_template(NER_PROMPT)
+    # Re-ask only for fields whose values were missing or malformed
+    result: Dict[str, Optional[str | List[str]]] = dict.fromkeys(requested)
+    remaining = requested
+    parse_failed = False
+    for _ in range(NER_MAX_RETRIES + 1):
+        values = _request_entities(llm, contract_text, remaining)
+        if values is None:
+            # An unparseable response leaves every requested field to retry
+            parse_failed = True
+            continue
+        valid, remaining = _validate_entities(values, remaining)
+        result.update(valid)
+        if not remaining:
+            break
 
-    # Create chain
-    chain = prompt | llm
+    # Unresolved fields and all-null results after a parse failure are not
+    # cached, so the next call asks the LLM again
+    if use_cache and not remaining and not (parse_failed and not any(result.values())):
+        try:
+            save_cached_entities(contract_text, result, fields)
+        except OSError:
+            # An unwritable cache must not discard a successful extraction
+            pass
+    return result
 
-    # Invoke the chain
-    response = chain.invoke({"contract_text": contract_text})
 
-    # Extract content from response
-    content = response.content
-    if isinstance(content, list):
-        response_text = "\n".join(str(item) for item in content)
-    else:
-        response_text = content
-    response_text = response_text.strip()
+def extract_contract_entities(
+    documents: List[Document], use_cache: bool = True, llm: Optional["ChatOpenAI"] = None
+) -> Dict[str, Optional[str | List[str]]]:
+    """
+    Extract key entities from contract pages, using rules before the LLM.
 
-    # Parse JSON response
-    try:
-        # Remove markdown code blocks if present
-        if response_text.startswith("```json"):
-            response_text = response_text[7:]
-        if response_text.startswith("```"):
-            response_text = response_text[3:]
-        if response_text.endswith("```"):
-            response_text = response_text[:-3]
-        response_text = response_text.strip()
-
-        entities = json.loads(response_text)
-    except json.JSONDecodeError as e:
-        raise ValueError(
-            f"Failed to parse LLM response as JSON: {e}. Response: {response_text[:200]}"
-        )
-
-    # Validate and normalize the response structure
-    expected_keys = {
-        "parties",
-        "effective_date",
-        "termination_date",
-        "payment_terms",
-        "ip_owner",
-        "governing_law",
-    }
-
-    # Ensure all expected keys are present
-    result: Dict[str, Optional[str | List[str]]] = {}
-    for key in expected_keys:
-        result[key] = entities.get(key)
+    Fields resolved with confidence by the rule-based extractor are taken
+    as-is. Only the remaining fields are sent to the LLM, with a prompt that
+    asks for just those fields over the pages that mention them.
 
-    return result
+    Args:
+        documents: Page documents as returned by load_pdf.
+        use_cache: Whether to read and write the persistent entity cache.
+        llm: Optional chat model to reuse. If not provided, a client for
+             LLM_MODEL is created when needed.
+
+    Returns:
+        Dictionary with all entity fields, as returned by extract_entities.
+
+    Raises:
+        RuntimeError: If OPENAI_API_KEY is not set and fields remain unresolved.
+    """
+    entities: Dict[str, Optional[str | List[str]]] = dict(extract_rule_entities(documents))
+    missing = [field for field in ENTITY_FIELDS if field not in entities]
+
+    if missing:
+        pages = select_relevant_pages(documents, missing)
+        contract_text = "\n\n".join(doc.page_content for doc in pages)
+        if contract_text.strip():
+            entities.update(
+                extract_entities(contract_text, use_cache=use_cache, fields=missing, llm=llm)
+            )
+
+    return {field: entities.get(field) for field in ENTITY_FIELDS}
@@ -0,0 +1,57 @@
+"""OpenAI embeddings returning NumPy arrays.
+
+The OpenAI SDK receives embeddings as base64-encoded float32 buffers and
+LangChain turns them into lists of Python floats, which the vector store then
+converts back into an array: for 10k chunks of 1536 dimensions that is over
+15 million boxed floats. ArrayOpenAIEmbeddings requests the base64 payload
+and decodes each buffer straight into a float32 matrix.
+
+Imported on first use by core.embeddings.get_embeddings, since
+langchain_openai is slow to import.
+"""
+
+import base64
+from typing import List
+
+import numpy as np
+from langchain_openai import OpenAIEmbeddings
+
+
+class ArrayOpenAIEmbeddings(OpenAIEmbeddings):
+    """OpenAIEmbeddings with an embed_documents_array fast path."""
+
+    def embed_documents_array(self, texts: List[str]) -> np.ndarray:
+        """Embed texts into a float32 matrix without intermediate Python lists.
+
+        Texts are sent as they are, in batches of chunk_size. Texts that may
+        exceed the model context (more UTF-8 bytes than embedding_ctx_length
+        tokens) are embedded through embed_documents instead, which splits
+        them as LangChain does.
+
+        Args:
+            texts: Texts to embed.
+
+        Returns:
+            Float32 matrix with one row per text.
+        """
+        if self.check_embedding_ctx_length and any(
+            len(text.encode("utf-8")) > self.embedding_ctx_length for text in texts
+        ):
+            return np.asarray(self.embed_documents(texts), dtype=np.float32)
+
+        self._ensure_sync_client_available()
+        buffers: List[bytes] = []
+        for start in range(0, len(texts), self.chunk_size):
+            response = self.client.create(
+                input=texts[start : start + self.chunk_size],
+                encoding_format="base64",
+                **self._invocation_params,
+            )
+            data = sorted(response.data, key=lambda item: item.index)
+            buffers.extend(base64.b64decode(item.embedding) for item in data)
+
+        if not buffers:
+            return np.empty((0, self.dimensions or 0), dtype=np.float32)
+        # Joined into a bytearray so the matrix is writable
+        matrix = np.frombuffer(bytearray().join(buffers), dtype=np.float32)
+        return matrix.reshape(len(buffers), -1)
@@ -0,0 +1,123 @@
+"""Persistent cache of extracted PDF page text.
+
+Page text is stored zlib-compressed in a SQLite database, keyed by the PDF
+content hash, the extractor settings and the page index. SQLite makes the
+cache safe to share between sessions and worker processes.
+"""
+
+import sqlite3
+import zlib
+from contextlib import closing
+from pathlib import Path
+from typing import Dict, Optional, Union
+
+from config.settings import PAGE_CACHE_PATH
+
+# Seconds to wait for a database lock held by another process
+_BUSY_TIMEOUT = 30.0
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS documents (
+    pdf_hash TEXT NOT NULL,
+    settings TEXT NOT NULL,
+    page_count INTEGER NOT NULL,
+    PRIMARY KEY (pdf_hash, settings)
+) WITHOUT ROWID;
+CREATE TABLE IF NOT EXISTS pages (
+    pdf_hash TEXT NOT NULL,
+    settings TEXT NOT NULL,
+    page_index INTEGER NOT NULL,
+    text BLOB NOT NULL,
+    PRIMARY KEY (pdf_hash, settings, page_index)
+) WITHOUT ROWID;
+"""
+
+
+def _connect(path: Union[str, Path, None]) -> sqlite3.Connection:
+    """Open the cache database, creating it if needed."""
+    path = Path(path or PAGE_CACHE_PATH)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    connection = sqlite3.connect(path, timeout=_BUSY_TIMEOUT)
+    connection.executescript(_SCHEMA)
+    return connection
+
+
+def load_page_count(
+    pdf_hash: str, settings: str, path: Union[str, Path, None] = None
+) -> Optional[int]:
+    """Load the number of pages recorded for a cached PDF.
+
+    Args:
+        pdf_hash: Content hash of the PDF file.
+        settings: Identifier of the extractor and its settings.
+        path: Optional cache database path. If not provided, uses
+              PAGE_CACHE_PATH from settings.
+
+    Returns:
+        Number of pages of the PDF, or None if no page of it is cached.
+    """
+    with closing(_connect(path)) as connection:
+        row = connection.execute(
+            "SELECT page_count FROM documents WHERE pdf_hash = ? AND settings = ?",
+            (pdf_hash, settings),
+        ).fetchone()
+    return row[0] if row else None
+
+
+def load_cached_pages(
+    pdf_hash: str, settings: str, start: int, stop: int, path: Union[str, Path, None] = None
+) -> Dict[int, str]:
+    """Load the cached texts of a range of pages of a PDF.
+
+    Only the requested range is read, so callers streaming a large PDF load
+    it in small windows.
+
+    Args:
+        pdf_hash: Content hash of the PDF file.
+        settings: Identifier of the extractor and its settings.
+        start: First 0-based page index to load.
+        stop: Page index after the last one to load.
+        path: Optional cache database path. If not provided, uses
+              PAGE_CACHE_PATH from settings.
+
+    Returns:
+        Dictionary mapping 0-based page indices in the range to cached page
+        text; pages that are not cached are missing.
+    """
+    with closing(_connect(path)) as connection:
+        rows = connection.execute(
+            "SELECT page_index, text FROM pages WHERE pdf_hash = ? AND settings = ? "
+            "AND page_index >= ? AND page_index < ?",
+            (pdf_hash, settings, start, stop),
+        ).fetchall()
+    return {page_index: zlib.decompress(text).decode("utf-8") for page_index, text in rows}
+
+
+def save_cached_pages(
+    pdf_hash: str,
+    settings: str,
+    page_count: int,
+    pages: Dict[int, str],
+    path: Union[str, Path, None] = None,
+) -> None:
+    """Store extracted page texts of a PDF in the cache.
+
+    Args:
+        pdf_hash: Content hash of the PDF file.
+        settings: Identifier of the extractor and its settings.
+        page_count: Total number of pages of the PDF.
+        pages: Dictionary mapping 0-based page indices to extracted text.
+        path: Optional cache database path. If not provided, uses
+              PAGE_CACHE_PATH from settings.
+    """
+    with closing(_connect(path)) as connection, connection:
+        connection.execute(
+            "INSERT OR REPLACE INTO documents VALUES (?, ?, ?)", (pdf_hash, settings, page_count)
+        )
+        connection.executemany(
+            "INSERT OR REPLACE INTO pages VALUES (?, ?, ?, ?)",
+            [
+                (pdf_hash, settings, page_index, zlib.compress(text.encode("utf-8")))
+                for page_index, text in pages.items()
+            ],
+        )
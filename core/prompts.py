@@ -4,38 +4,60 @@ This module contains all prompt definitions used throughout the application.
 Prompts are defined as string constants to keep them separate from business logic.
 """
 
-from typing import Any, Dict, List, Optional
+import hashlib
+import json
+import threading
+from collections import OrderedDict
+from typing import TYPE_CHECKING, Any, Dict, List, Optional, Sequence, Tuple
 
-# QA prompt for Retrieval-Augmented Generation (RAG)
-QA_PROMPT: str = """You are a legal contract assistant. Your task is to answer questions about a contract based solely on the provided context.
+from config.settings import PROMPT_CACHE_SIZE
 
-Context from the contract:
-{context}
+if TYPE_CHECKING:
+    from langchain_core.prompts import ChatPromptTemplate
 
-Question: {input}
+# Prompts are laid out as a static instruction prefix followed by the
+# per-request text, so that providers with automatic prompt caching can reuse
+# the shared prefix across calls. Keep request-specific text out of the prefix.
+# OpenAI only caches prefixes of at least 1024 tokens: the QA instructions are
+# about 150 tokens and the retrieved context differs between questions, so QA
+# calls are not cached. NER calls for one contract share instructions and text.
+
+# Static instructions of the QA prompt for Retrieval-Augmented Generation (RAG)
+QA_PROMPT_PREFIX: str = """You are a legal contract assistant. Your task is to answer questions about a contract based solely on the provided context.
 
 Instructions:
-1. Answer the question using ONLY the information provided in the context above.
+1. Answer the question using ONLY the information provided in the context below.
 2. Do not use any knowledge outside of the provided context.
 3. Do not make up or infer information that is not explicitly stated in the context.
 4. If the answer to the question cannot be found in the provided context, respond with exactly: "Not found in the contract"
-5. When referencing information from the contract, include the page number(s) from the source documents in your answer (e.g., "According to page 3..." or "As stated on pages 5-6...").
+5. When referencing information from the contract, include the page number(s) from the source documents in your answer (e.g., "According to page 3..." or "As stated on pages 5-6...")."""
 
-Answer:"""
+# Per-request part of the QA prompt
+QA_PROMPT_SUFFIX: str = """
 
-# NER prompt for extracting key contract entities
-NER_PROMPT: str = """You are a legal contract analysis assistant. Extract key entities from the following contract text.
+Context from the contract:
+{context}
 
-Contract text:
-{contract_text}
+Question: {input}
 
-Extract the following entities and return them as a JSON object with these exact keys:
-- parties: List of party names (e.g., ["Company A", "Company B"])
-- effective_date: The date when the contract becomes effective (format: YYYY-MM-DD or null if not found)
-- termination_date: The date when the contract terminates or expires (format: YYYY-MM-DD or null if not found)
-- payment_terms: Payment terms, amounts, and schedules (string or null if not found)
-- ip_owner: Who owns the intellectual property (string or null if not found)
-- governing_law: Which jurisdiction's law governs the contract (string or null if not found)
+Answer:"""
+
+# QA prompt for Retrieval-Augmented Generation (RAG)
+QA_PROMPT: str = QA_PROMPT_PREFIX + QA_PROMPT_SUFFIX
+
+# Entities extracted by the NER prompt and their descriptions
+NER_FIELD_DESCRIPTIONS: Dict[str, str] = {
+    "parties": 'List of party names (e.g., ["Company A", "Company B"])',
+    "effective_date": "The date when the contract becomes effective (format: YYYY-MM-DD or null if not found)",
+    "termination_date": "The date when the contract terminates or expires (format: YYYY-MM-DD or null if not found)",
+    "payment_terms": "Payment terms, amounts, and schedules (string or null if not found)",
+    "ip_owner": "Who owns the intellectual property (string or null if not found)",
+    "governing_law": "Which jurisdiction's law governs the contract (string or null if not found)",
+}
+
+# Static instructions and contract text of the NER prompt, shared by the
+# initial request and the targeted requests for missing or invalid fields
+NER_PROMPT_PREFIX: str = """You are a legal contract analysis assistant. Extract key entities from the contract text below.
 
 Instructions:
 1. Extract information ONLY from the provided contract text.
@@ -44,52 +66,179 @@ Instructions:
 4. Return ONLY valid JSON, no additional text or explanation.
 5. Dates should be in YYYY-MM-DD format if found, otherwise null.
 
-Return the JSON object:"""
+Contract text:
+{contract_text}"""
 
-# Constants for feedback prompt enhancement
-MAX_FEEDBACK_EXAMPLES = 2
-EXAMPLE_ANSWER_PREVIEW_LENGTH = 200
+# Per-request part of the NER prompt, around the list of requested entities
+NER_PROMPT_FIELDS_INTRO: str = """
+
+Extract the following entities and return them as a JSON object with these exact keys:
+"""
 
+NER_PROMPT_SUFFIX: str = """
 
-def get_enhanced_qa_prompt(feedback_examples: Optional[List[Dict[str, Any]]] = None) -> str:
-    """Get an enhanced QA prompt that incorporates feedback to improve answers.
+Return the JSON object:"""
+
+
+def get_ner_prompt(fields: Optional[Sequence[str]] = None) -> str:
+    """Get the NER prompt for extracting a subset of the contract entities.
 
     Args:
-        feedback_examples: List of feedback dictionaries with previous interactions.
+        fields: Entity fields to extract, a subset of NER_FIELD_DESCRIPTIONS.
+                If not provided, all entities are requested.
 
     Returns:
-        Enhanced prompt string that includes feedback guidance.
+        NER prompt string with a {contract_text} placeholder.
     """
-    if not feedback_examples:
-        return QA_PROMPT
+    fields = fields or list(NER_FIELD_DESCRIPTIONS)
+    field_lines = "\n".join(f"- {field}: {NER_FIELD_DESCRIPTIONS[field]}" for field in fields)
+    # The field list follows the contract text, so every request for the same
+    # contract shares the long prefix and can be served from the prompt cache
+    return NER_PROMPT_PREFIX + NER_PROMPT_FIELDS_INTRO + field_lines + NER_PROMPT_SUFFIX
+
 
+# NER prompt for extracting key contract entities
+NER_PROMPT: str = get_ner_prompt()
+
+# Constants for feedback prompt enhancement
+MAX_FEEDBACK_EXAMPLES = 2
+EXAMPLE_ANSWER_PREVIEW_LENGTH = 200
+
+# Enhanced prompts by feedback prompt key, most recently used last
+_prompt_cache: "OrderedDict[Tuple[str, ...], Tuple[str, ChatPromptTemplate]]" = OrderedDict()
+_prompt_cache_lock = threading.Lock()
+
+
+def _select_examples(
+    feedback_examples: List[Dict[str, Any]],
+) -> Tuple[List[Dict[str, Any]], List[Dict[str, Any]]]:
+    """Select the positive and negative feedback examples used in the prompt."""
     positive_examples = [f for f in feedback_examples if f.get("rating") == "up"][
         :MAX_FEEDBACK_EXAMPLES
     ]
     negative_examples = [f for f in feedback_examples if f.get("rating") == "down"][
         :MAX_FEEDBACK_EXAMPLES
     ]
+    return positive_examples, negative_examples
+
 
-    feedback_guidance = "\n\n## Learning from Previous Interactions:\n"
+def _example_id(example: Dict[str, Any]) -> str:
+    """Get a stable identifier for a feedback example.
+
+    Entries saved before feedback IDs were introduced are identified by a
+    hash of their content.
+    """
+    if example.get("id"):
+        return str(example["id"])
+    content = json.dumps(example, sort_keys=True, ensure_ascii=False)
+    return hashlib.sha256(content.encode("utf-8")).hexdigest()
+
+
+def get_feedback_prompt_key(
+    feedback_examples: Optional[List[Dict[str, Any]]] = None,
+) -> Tuple[str, ...]:
+    """Get the key identifying the prompt variant built from feedback examples.
+
+    Args:
+        feedback_examples: List of feedback dictionaries with previous interactions.
+
+    Returns:
+        Tuple of the IDs of the feedback examples included in the prompt;
+        empty for the base QA prompt.
+    """
+    if not feedback_examples:
+        return ()
+    positive_examples, negative_examples = _select_examples(feedback_examples)
+    return tuple(_example_id(example) for example in positive_examples + negative_examples)
+
+
+def _build_enhanced_qa_prompt(feedback_examples: List[Dict[str, Any]]) -> str:
+    """Build the QA prompt text with feedback guidance inserted."""
+    positive_examples, negative_examples = _select_examples(feedback_examples)
+
+    parts = ["\n\n## Learning from Previous Interactions:\n"]
 
     if positive_examples:
-        feedback_guidance += "\n**Examples of helpful answers:**\n"
+        parts.append("\n**Examples of helpful answers:**\n")
         for i, example in enumerate(positive_examples, 1):
-            feedback_guidance += f"{i}. Question: {example.get('question', '')}\n"
             answer_preview = example.get("answer", "")[:EXAMPLE_ANSWER_PREVIEW_LENGTH]
-            feedback_guidance += f"   Answer: {answer_preview}...\n"
-        feedback_guidance += (
-            "\nThese answers were rated as helpful. Use similar style and completeness.\n"
-        )
+            parts.append(f"{i}. Question: {example.get('question', '')}\n")
+            parts.append(f"   Answer: {answer_preview}...\n")
+        parts.append("\nThese answers were rated as helpful. Use similar style and completeness.\n")
 
     if negative_examples:
-        feedback_guidance += "\n**Examples to avoid (these were rated as not helpful):**\n"
+        parts.append("\n**Examples to avoid (these were rated as not helpful):**\n")
         for i, example in enumerate(negative_examples, 1):
-            feedback_guidance += f"{i}. Question: {example.get('question', '')}\n"
             answer_preview = example.get("answer", "")[:EXAMPLE_ANSWER_PREVIEW_LENGTH]
-            feedback_guidance += f"   Previous answer: {answer_preview}...\n"
+            parts.append(f"{i}. Question: {example.get('question', '')}\n")
+            parts.append(f"   Previous answer: {answer_preview}...\n")
             if example.get("comment"):
-                feedback_guidance += f"   Issue: {example.get('comment')}\n"
-        feedback_guidance += "\nAvoid these issues. Provide more complete and accurate answers.\n"
+                parts.append(f"   Issue: {example.get('comment')}\n")
+        parts.append("\nAvoid these issues. Provide more complete and accurate answers.\n")
+
+    # Guidance goes after the static instructions so the shared prefix stays cacheable
+    return QA_PROMPT_PREFIX + "".join(parts).rstrip("\n") + QA_PROMPT_SUFFIX
+
+
+def _get_cached_prompt(
+    feedback_examples: Optional[List[Dict[str, Any]]],
+) -> Tuple[str, "ChatPromptTemplate"]:
+    """Get the enhanced prompt text and parsed template, building them on a cache miss."""
+    key = get_feedback_prompt_key(feedback_examples)
+
+    with _prompt_cache_lock:
+        cached = _prompt_cache.get(key)
+        if cached is not None:
+            _prompt_cache.move_to_end(key)
+            return cached
+
+    from langchain_core.prompts import ChatPromptTemplate
+
+    prompt_text = _build_enhanced_qa_prompt(feedback_examples) if key else QA_PROMPT
+    cached = (prompt_text, ChatPromptTemplate.from_template(prompt_text))
+
+    with _prompt_cache_lock:
+        _prompt_cache[key] = cached
+        _prompt_cache.move_to_end(key)
+        while len(_prompt_cache) > PROMPT_CACHE_SIZE:
+            _prompt_cache.popitem(last=False)
+    return cached
+
+
+def get_enhanced_qa_prompt(feedback_examples: Optional[List[Dict[str, Any]]] = None) -> str:
+    """Get an enhanced QA prompt that incorporates feedback to improve answers.
+
+    Prompts are memoized by the IDs of the feedback examples they include.
+
+    Args:
+        feedback_examples: List of feedback dictionaries with previous interactions.
+
+    Returns:
+        Enhanced prompt string that includes feedback guidance.
+    """
+    if not feedback_examples:
+        return QA_PROMPT
+    return _get_cached_prompt(feedback_examples)[0]
+
+
+def get_qa_prompt_template(
+    feedback_examples: Optional[List[Dict[str, Any]]] = None,
+) -> "ChatPromptTemplate":
+    """Get the parsed QA prompt template, enhanced with feedback examples.
+
+    Templates are memoized by the IDs of the feedback examples they include,
+    so repeated questions skip prompt assembly and template parsing.
+
+    Args:
+        feedback_examples: List of feedback dictionaries with previous interactions.
+
+    Returns:
+        ChatPromptTemplate for the (enhanced) QA prompt.
+    """
+    return _get_cached_prompt(feedback_examples)[1]
+
 
-    return QA_PROMPT.replace("\nAnswer:", feedback_guidance + "\nAnswer:")
+def clear_prompt_cache() -> None:
+    """Clear all memoized enhanced prompts, e.g. after feedback has changed."""
+    with _prompt_cache_lock:
+        _prompt_cache.clear()
@@ -1,28 +1,111 @@
 """Question answering module for the contract QA system."""
 
-from typing import Dict, List, Tuple
+import asyncio
+import time
+import weakref
+from concurrent.futures import ThreadPoolExecutor
+from typing import TYPE_CHECKING, Any, Dict, Hashable, List, Optional, Tuple
 
-from langchain_classic.chains.combine_documents import create_stuff_documents_chain
-from langchain_classic.chains.retrieval import create_retrieval_chain
-from langchain_core.prompts import ChatPromptTemplate
-from langchain_community.vectorstores import FAISS
-from langchain_openai import ChatOpenAI
+from langchain_core.documents import Document
 
-from config.settings import LLM_MODEL, MAX_SOURCES, OPENAI_API_KEY
+from config.settings import (
+    LLM_MAX_CONCURRENCY,
+    OPENAI_API_KEY,
+    QA_BATCH_CONCURRENCY,
+)
+from core.context import build_context
 from core.feedback import get_feedback_for_question
-from core.prompts import get_enhanced_qa_prompt
+from core.feedback_store import normalize_question
+from core.llm import create_chat_model
+from core.prompts import get_feedback_prompt_key, get_qa_prompt_template
+from core.rerank import aretrieve_documents, retrieve_documents, retrieve_documents_batch
+from core.usage import record_llm_usage
 
+if TYPE_CHECKING:
+    from langchain_community.vectorstores import FAISS
+    from langchain_core.prompts import ChatPromptTemplate
+    from langchain_openai import ChatOpenAI
 
-def answer_question(vectorstore: FAISS, question: str) -> Tuple[str, List[Dict[str, str]]]:
+# In-flight answer tasks by request key and the LLM concurrency limiter, per event loop
+_async_state: weakref.WeakKeyDictionary = weakref.WeakKeyDictionary()
+
+
+def _build_prompt(
+    question: str, doc_hash: Optional[str] = None
+) -> Tuple[Tuple[str, ...], "ChatPromptTemplate"]:
+    """Get the QA prompt for a question, enhanced with related feedback.
+
+    Args:
+        question: User's question about the contract.
+        doc_hash: Content hash of the active document; if provided, only
+                  feedback given on that document is used.
+
+    Returns:
+        Tuple of (prompt variant key, parsed prompt template).
+    """
+    related_feedback = get_feedback_for_question(question, doc_hash=doc_hash)
+    return get_feedback_prompt_key(related_feedback), get_qa_prompt_template(related_feedback)
+
+
+def _format_sources(context: List[Document]) -> List[Dict[str, str]]:
+    """Convert context documents to source dictionaries with page numbers."""
+    return [
+        {
+            "content": doc.page_content,
+            "page": doc.metadata.get("page", "Unknown"),
+        }
+        for doc in context
+    ]
+
+
+def _format_context(context: List[Document]) -> str:
+    """Join context chunks into the text substituted for {context} in the prompt."""
+    return "\n\n".join(doc.page_content for doc in context)
+
+
+def _generate_answer(
+    llm: "ChatOpenAI", question: str, candidates: List[Document], doc_hash: Optional[str] = None
+) -> Tuple[str, List[Dict[str, str]]]:
+    """Generate an answer from retrieved candidate chunks.
+
+    Args:
+        llm: Chat model used to generate the answer.
+        question: User's question about the contract.
+        candidates: Retrieved chunks, most relevant first.
+        doc_hash: Content hash of the active document, used to select feedback.
+
+    Returns:
+        Tuple of (answer, sources).
+    """
+    _, prompt = _build_prompt(question, doc_hash)
+    context = build_context(candidates)
+
+    start = time.perf_counter()
+    response = (prompt | llm).invoke({"input": question, "context": _format_context(context)})
+    record_llm_usage("qa", response, time.perf_counter() - start)
+    return response.content, _format_sources(context)
+
+
+def answer_question(
+    vectorstore: "FAISS",
+    question: str,
+    doc_hash: Optional[str] = None,
+    llm: Optional["ChatOpenAI"] = None,
+) -> Tuple[str, List[Dict[str, str]]]:
     """Answer a question about a contract using Retrieval-Augmented Generation.
 
-    Uses the provided vector store to retrieve relevant context and generates
-    an answer using the LLM with the custom QA prompt. Returns both the answer
-    and source documents with page numbers.
+    Uses the provided vector store to retrieve and rerank candidate chunks,
+    assembles them into a deduplicated context that fits the configured token
+    budget and generates an answer using the LLM with the custom QA prompt.
+    Returns both the answer and source documents with page numbers.
 
     Args:
         vectorstore: FAISS vector store containing the contract documents.
         question: User's question about the contract.
+        doc_hash: Content hash of the indexed document; if provided, only
+                  feedback given on that document enhances the prompt.
+        llm: Optional chat model to reuse across questions. If not provided,
+             a client for LLM_MODEL is created.
 
     Returns:
         Tuple containing:
@@ -40,23 +123,157 @@ def answer_question(vectorstore: FAISS, question: str) -> Tuple[str, List[Dict[s
     if not OPENAI_API_KEY:
         raise RuntimeError("OPENAI_API_KEY is required for question answering")
 
-    llm = ChatOpenAI(model=LLM_MODEL, temperature=0)
-    related_feedback = get_feedback_for_question(question)
-    enhanced_prompt = get_enhanced_qa_prompt(related_feedback)
-    prompt = ChatPromptTemplate.from_template(enhanced_prompt)
+    llm = llm or create_chat_model()
+    candidates = retrieve_documents(vectorstore, question)
+    return _generate_answer(llm, question, candidates, doc_hash)
 
-    document_chain = create_stuff_documents_chain(llm, prompt)
-    retriever = vectorstore.as_retriever(search_kwargs={"k": MAX_SOURCES})
-    retrieval_chain = create_retrieval_chain(retriever, document_chain)
 
-    result = retrieval_chain.invoke({"input": question})
+def answer_questions(
+    vectorstore: "FAISS",
+    questions: List[str],
+    max_concurrency: Optional[int] = None,
+    doc_hash: Optional[str] = None,
+) -> List[Dict[str, Any]]:
+    """Answer a batch of questions about a contract.
 
-    sources = [
-        {
-            "content": doc.page_content,
-            "page": doc.metadata.get("page", "Unknown"),
-        }
-        for doc in result["context"]
-    ]
+    Embeds all questions in one request and retrieves their context with a
+    single batched FAISS search, then generates the answers concurrently.
+    A failure while answering one question is reported in its result and
+    does not abort the rest of the batch.
+
+    Args:
+        vectorstore: FAISS vector store containing the contract documents.
+        questions: User questions about the contract.
+        max_concurrency: Maximum number of concurrent LLM calls. If not
+                         provided, uses QA_BATCH_CONCURRENCY from settings.
+        doc_hash: Content hash of the indexed document; if provided, only
+                  feedback given on that document enhances the prompts.
+
+    Returns:
+        List of result dictionaries in the order of the questions, each with
+        'question', 'answer', 'sources' and 'error' (None on success) keys.
+
+    Raises:
+        ValueError: If any question is empty.
+        RuntimeError: If OPENAI_API_KEY is not set (LLM requires API key).
+    """
+    questions = [question.strip() if question else "" for question in questions]
+    if not all(questions):
+        raise ValueError("Question cannot be empty")
+
+    if not OPENAI_API_KEY:
+        raise RuntimeError("OPENAI_API_KEY is required for question answering")
+
+    if not questions:
+        return []
+
+    llm = create_chat_model()
+    all_candidates = retrieve_documents_batch(vectorstore, questions)
+
+    def answer_one(question: str, candidates: List[Document]) -> Dict[str, Any]:
+        try:
+            answer, sources = _generate_answer(llm, question, candidates, doc_hash)
+            return {"question": question, "answer": answer, "sources": sources, "error": None}
+        except Exception as e:
+            return {"question": question, "answer": None, "sources": [], "error": str(e)}
+
+    with ThreadPoolExecutor(max_workers=max_concurrency or QA_BATCH_CONCURRENCY) as executor:
+        return list(executor.map(answer_one, questions, all_candidates))
+
+
+def _get_async_state() -> Tuple[Dict[Hashable, asyncio.Task], asyncio.Semaphore]:
+    """Get the in-flight request map and LLM limiter of the running event loop."""
+    loop = asyncio.get_running_loop()
+    if loop not in _async_state:
+        _async_state[loop] = ({}, asyncio.Semaphore(LLM_MAX_CONCURRENCY))
+    return _async_state[loop]
+
+
+async def _agenerate_answer(
+    llm: "ChatOpenAI", question: str, candidates: List[Document], prompt: "ChatPromptTemplate"
+) -> Tuple[str, List[Dict[str, str]]]:
+    """Asynchronously generate an answer from retrieved candidate chunks.
+
+    Args:
+        llm: Chat model used to generate the answer.
+        question: User's question about the contract.
+        candidates: Retrieved chunks, most relevant first.
+        prompt: QA prompt template.
+
+    Returns:
+        Tuple of (answer, sources).
+    """
+    context = build_context(candidates)
+    chain = prompt | llm
+
+    _, limiter = _get_async_state()
+    async with limiter:
+        start = time.perf_counter()
+        response = await chain.ainvoke({"input": question, "context": _format_context(context)})
+    record_llm_usage("qa", response, time.perf_counter() - start)
+    return response.content, _format_sources(context)
+
+
+async def _aanswer(
+    vectorstore: "FAISS", question: str, prompt: "ChatPromptTemplate"
+) -> Tuple[str, List[Dict[str, str]]]:
+    """Run retrieval and answer generation for a single async request."""
+    llm = create_chat_model()
+    candidates = await aretrieve_documents(vectorstore, question)
+    return await _agenerate_answer(llm, question, candidates, prompt)
+
+
+async def aanswer_question(
+    vectorstore: "FAISS",
+    question: str,
+    document_version: Optional[Hashable] = None,
+    doc_hash: Optional[str] = None,
+) -> Tuple[str, List[Dict[str, str]]]:
+    """Asynchronously answer a question about a contract, coalescing duplicates.
+
+    Concurrent requests for the same document version, normalized question and
+    prompt variant (the feedback-enhanced prompt) share a single retrieval and
+    LLM call. LLM calls from all requests on the event loop are limited to
+    LLM_MAX_CONCURRENCY at a time.
+
+    Args:
+        vectorstore: FAISS vector store containing the contract documents.
+        question: User's question about the contract.
+        document_version: Identifier of the indexed document version. If not
+                          provided, the content hash or else the vector
+                          store instance identifies it.
+        doc_hash: Content hash of the indexed document; if provided, only
+                  feedback given on that document enhances the prompt.
+
+    Returns:
+        Tuple of (answer, sources) as returned by answer_question.
+
+    Raises:
+        ValueError: If question is empty.
+        RuntimeError: If OPENAI_API_KEY is not set (LLM requires API key).
+    """
+    if not question or not question.strip():
+        raise ValueError("Question cannot be empty")
+
+    if not OPENAI_API_KEY:
+        raise RuntimeError("OPENAI_API_KEY is required for question answering")
+
+    question = question.strip()
+    prompt_key, prompt = await asyncio.to_thread(_build_prompt, question, doc_hash)
+    if document_version is None:
+        document_version = doc_hash if doc_hash is not None else id(vectorstore)
+    key = (
+        document_version,
+        normalize_question(question),
+        prompt_key,
+    )
+
+    in_flight, _ = _get_async_state()
+    task = in_flight.get(key)
+    if task is None:
+        task = asyncio.ensure_future(_aanswer(vectorstore, question, prompt))
+        in_flight[key] = task
+        task.add_done_callback(lambda _: in_flight.pop(key, None))
 
-    return result["answer"], sources
+    # Shield the shared task so a cancelled caller does not cancel the others
+    return await asyncio.shield(task)
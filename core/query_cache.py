@@ -0,0 +1,196 @@
+"""Cache of question embeddings.
+
+The same questions are asked again and again: the quick questions, checklist
+runs and the same question in several sessions. Question embeddings are
+cached by embedding model and normalized question text (normalized as
+feedback questions are), in a process-wide LRU
+of QUERY_CACHE_SIZE entries and in a SQLite database at QUERY_CACHE_PATH
+shared by sessions and processes, so a repeated question needs no embeddings
+request. Questions missing from both caches are embedded together in a single
+request.
+"""
+
+import sqlite3
+import threading
+from collections import OrderedDict
+from contextlib import closing
+from pathlib import Path
+from typing import Dict, List, Tuple
+
+import numpy as np
+from langchain_core.embeddings import Embeddings
+
+from config.settings import QUERY_CACHE_PATH, QUERY_CACHE_SIZE
+from core.embeddings import embed_texts
+from core.feedback_store import normalize_question
+
+# Seconds to wait for a database lock held by another process
+_BUSY_TIMEOUT = 30.0
+
+# Questions looked up per query, below SQLite's limit on query parameters
+_MAX_LOOKUP_PARAMETERS = 500
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS query_embeddings (
+    model TEXT NOT NULL,
+    question TEXT NOT NULL,
+    vector BLOB NOT NULL,
+    PRIMARY KEY (model, question)
+) WITHOUT ROWID;
+"""
+
+# Cached embeddings by (model key, normalized question), least recently used first
+_memory_cache: "OrderedDict[Tuple[str, str], np.ndarray]" = OrderedDict()
+_memory_cache_lock = threading.Lock()
+
+
+def embedding_model_key(embeddings: Embeddings) -> str:
+    """Identify the model of an embeddings instance for cache keys.
+
+    Args:
+        embeddings: Embeddings instance.
+
+    Returns:
+        Model name (or class name for embeddings without one) and dimension.
+    """
+    model = getattr(embeddings, "model", None) or type(embeddings).__name__
+    dimension = getattr(embeddings, "dimensions", None) or getattr(embeddings, "dimension", None)
+    return f"{model}:{dimension}"
+
+
+def _connect() -> sqlite3.Connection:
+    """Open the cache database, creating it if needed."""
+    path = Path(QUERY_CACHE_PATH)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    connection = sqlite3.connect(path, timeout=_BUSY_TIMEOUT)
+    connection.executescript(_SCHEMA)
+    return connection
+
+
+def _remember(model: str, vectors: Dict[str, np.ndarray]) -> None:
+    """Put embeddings in the in-process LRU."""
+    with _memory_cache_lock:
+        for question, vector in vectors.items():
+            _memory_cache[(model, question)] = vector
+            _memory_cache.move_to_end((model, question))
+        while len(_memory_cache) > QUERY_CACHE_SIZE:
+            _memory_cache.popitem(last=False)
+
+
+def _load_cached(model: str, keys: List[str]) -> Dict[str, np.ndarray]:
+    """Look up normalized questions in the in-process LRU, then the database."""
+    cached: Dict[str, np.ndarray] = {}
+    with _memory_cache_lock:
+        for key in keys:
+            vector = _memory_cache.get((model, key))
+            if vector is not None:
+                _memory_cache.move_to_end((model, key))
+                cached[key] = vector
+
+    missing = list(dict.fromkeys(key for key in keys if key not in cached))
+    if missing and QUERY_CACHE_PATH:
+        rows = []
+        with closing(_connect()) as connection:
+            for start in range(0, len(missing), _MAX_LOOKUP_PARAMETERS):
+                batch = missing[start : start + _MAX_LOOKUP_PARAMETERS]
+                rows += connection.execute(
+                    "SELECT question, vector FROM query_embeddings WHERE model = ? "
+                    f"AND question IN ({', '.join('?' * len(batch))})",
+                    (model, *batch),
+                ).fetchall()
+        stored = {question: np.frombuffer(vector, dtype=np.float32) for question, vector in rows}
+        _remember(model, stored)
+        cached.update(stored)
+    return cached
+
+
+def _store(model: str, vectors: Dict[str, np.ndarray]) -> None:
+    """Put new embeddings in the in-process LRU and the database."""
+    vectors = {key: np.array(vector, dtype=np.float32) for key, vector in vectors.items()}
+    for vector in vectors.values():
+        vector.flags.writeable = False
+    _remember(model, vectors)
+    if QUERY_CACHE_PATH:
+        with closing(_connect()) as connection, connection:
+            connection.executemany(
+                "INSERT OR REPLACE INTO query_embeddings VALUES (?, ?, ?)",
+                [(model, key, vector.tobytes()) for key, vector in vectors.items()],
+            )
+
+
+def _split_cached(
+    embeddings: Embeddings, questions: List[str]
+) -> Tuple[str, List[str], Dict[str, np.ndarray], Dict[str, str]]:
+    """Get the cached embeddings of questions and the questions left to embed.
+
+    Returns:
+        Tuple of (model key, normalized questions, cached embeddings by
+        normalized question, first question text by normalized question for
+        the questions to embed).
+    """
+    model = embedding_model_key(embeddings)
+    keys = [normalize_question(question) for question in questions]
+    cached = _load_cached(model, keys)
+    missing: Dict[str, str] = {}
+    for key, question in zip(keys, questions):
+        if key not in cached:
+            missing.setdefault(key, question)
+    return model, keys, cached, missing
+
+
+def _stack(vectors: Dict[str, np.ndarray], keys: List[str]) -> np.ndarray:
+    """Stack the embeddings of normalized questions into a new float32 matrix."""
+    if not keys:
+        return np.empty((0, 0), dtype=np.float32)
+    return np.stack([vectors[key] for key in keys]).astype(np.float32, copy=False)
+
+
+def embed_queries(embeddings: Embeddings, questions: List[str]) -> np.ndarray:
+    """Embed questions, reusing cached embeddings of repeated questions.
+
+    Questions are matched by normalized text. Questions missing from the
+    caches are embedded in a single embeddings request, each once however
+    often it is repeated.
+
+    Args:
+        embeddings: Embeddings instance used to embed uncached questions.
+        questions: Questions to embed.
+
+    Returns:
+        Float32 matrix with one row per question.
+    """
+    model, keys, vectors, missing = _split_cached(embeddings, questions)
+    if missing:
+        embedded = embed_texts(embeddings, list(missing.values()))
+        new = dict(zip(missing, embedded))
+        _store(model, new)
+        vectors.update(new)
+    return _stack(vectors, keys)
+
+
+async def aembed_queries(embeddings: Embeddings, questions: List[str]) -> np.ndarray:
+    """Asynchronously embed questions, reusing cached embeddings.
+
+    Same as embed_queries, but requests uncached embeddings without blocking
+    the event loop.
+
+    Args:
+        embeddings: Embeddings instance used to embed uncached questions.
+        questions: Questions to embed.
+
+    Returns:
+        Float32 matrix with one row per question.
+    """
+    model, keys, vectors, missing = _split_cached(embeddings, questions)
+    if missing:
+        embedded = await embeddings.aembed_documents(list(missing.values()))
+        new = dict(zip(missing, np.asarray(embedded, dtype=np.float32)))
+        _store(model, new)
+        vectors.update(new)
+    return _stack(vectors, keys)
+
+
+def clear_query_cache() -> None:
+    """Clear the in-process query embedding cache (the database is kept)."""
+    with _memory_cache_lock:
+        _memory_cache.clear()
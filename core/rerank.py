@@ -0,0 +1,309 @@
+"""Reranking module for reordering retrieved chunks before answer generation.
+
+Retrieval fetches a wide candidate set from the FAISS index and a cheap,
+CPU-only reranker reorders it using the vectors already stored in the index.
+Reranking runs within a time budget; candidates not reached before the
+deadline keep their original vector-similarity order.
+"""
+
+import re
+import time
+from typing import TYPE_CHECKING, Callable, Dict, List, Optional, Set, Tuple
+
+import numpy as np
+from langchain_core.documents import Document
+
+from config.settings import (
+    LEXICAL_WEIGHT,
+    MMR_LAMBDA,
+    RERANK_CANDIDATES,
+    RERANK_TIME_BUDGET_MS,
+    RERANKER,
+    RETRIEVAL_CANDIDATES,
+    VECTOR_RESCORE_CANDIDATES,
+)
+from core.query_cache import aembed_queries, embed_queries
+
+if TYPE_CHECKING:
+    from langchain_community.vectorstores import FAISS
+
+# Reranker signature: (question, similarities, documents, vectors, deadline) -> order
+Reranker = Callable[[str, np.ndarray, List[Document], np.ndarray, float], List[int]]
+
+_WORD_PATTERN = re.compile(r"[a-z0-9]+")
+
+_STOPWORDS = frozenset(
+    {
+        "the", "and", "for", "are", "was", "were", "what", "which", "who", "whom",
+        "when", "where", "why", "how", "does", "did", "this", "that", "these", "those",
+        "with", "from", "into", "under", "over", "any", "all", "its", "their", "there",
+        "contract", "agreement",
+    }
+)  # fmt: skip
+
+
+def _terms(text: str) -> Set[str]:
+    """Extract lowercase content terms from a text."""
+    return {
+        term
+        for term in _WORD_PATTERN.findall(text.lower())
+        if len(term) > 2 and term not in _STOPWORDS
+    }
+
+
+def _cosine_similarities(query_vector: np.ndarray, vectors: np.ndarray) -> np.ndarray:
+    """Compute cosine similarities between a query and candidate vectors."""
+    norms = np.linalg.norm(vectors, axis=1) * np.linalg.norm(query_vector)
+    dots = vectors @ query_vector
+    return np.divide(dots, norms, out=np.zeros_like(dots), where=norms > 0)
+
+
+def _append_remaining(order: List[int], count: int) -> List[int]:
+    """Append candidates missing from a partial order in their original order."""
+    picked = set(order)
+    return order + [i for i in range(count) if i not in picked]
+
+
+def lexical_rerank(
+    question: str,
+    similarities: np.ndarray,
+    documents: List[Document],
+    vectors: np.ndarray,
+    deadline: float,
+) -> List[int]:
+    """Rerank candidates by a blend of vector similarity and term overlap.
+
+    Args:
+        question: User's question.
+        similarities: Cosine similarity of each candidate to the question.
+        documents: Candidate chunks in vector-similarity order.
+        vectors: Stored embedding vectors of the candidates.
+        deadline: time.perf_counter() value after which reranking stops.
+
+    Returns:
+        Candidate indices, best first.
+    """
+    question_terms = _terms(question)
+    if not question_terms:
+        return list(range(len(documents)))
+
+    scores: List[Tuple[float, int]] = []
+    for i, document in enumerate(documents):
+        if time.perf_counter() > deadline:
+            break
+        overlap = len(question_terms & _terms(document.page_content)) / len(question_terms)
+        score = (1 - LEXICAL_WEIGHT) * float(similarities[i]) + LEXICAL_WEIGHT * overlap
+        scores.append((-score, i))
+
+    scores.sort()
+    return _append_remaining([i for _, i in scores], len(documents))
+
+
+def mmr_rerank(
+    question: str,
+    similarities: np.ndarray,
+    documents: List[Document],
+    vectors: np.ndarray,
+    deadline: float,
+) -> List[int]:
+    """Rerank candidates with Maximal Marginal Relevance for diversity.
+
+    Args:
+        question: User's question.
+        similarities: Cosine similarity of each candidate to the question.
+        documents: Candidate chunks in vector-similarity order.
+        vectors: Stored embedding vectors of the candidates.
+        deadline: time.perf_counter() value after which reranking stops.
+
+    Returns:
+        Candidate indices, best first.
+    """
+    count = len(documents)
+    if count == 0:
+        return []
+
+    norms = np.linalg.norm(vectors, axis=1, keepdims=True)
+    unit_vectors = np.divide(vectors, norms, out=np.zeros_like(vectors), where=norms > 0)
+    pairwise = unit_vectors @ unit_vectors.T
+
+    order = [int(np.argmax(similarities))]
+    max_redundancy = pairwise[order[0]].copy()
+    remaining = np.ones(count, dtype=bool)
+    remaining[order[0]] = False
+
+    while remaining.any() and time.perf_counter() <= deadline:
+        mmr_scores = MMR_LAMBDA * similarities - (1 - MMR_LAMBDA) * max_redundancy
+        mmr_scores[~remaining] = -np.inf
+        best = int(np.argmax(mmr_scores))
+        order.append(best)
+        remaining[best] = False
+        np.maximum(max_redundancy, pairwise[best], out=max_redundancy)
+
+    return _append_remaining(order, count)
+
+
+RERANKERS: Dict[str, Reranker] = {
+    "lexical": lexical_rerank,
+    "mmr": mmr_rerank,
+}
+
+
+def search_candidates(
+    vectorstore: "FAISS",
+    query_vectors: np.ndarray,
+    k: int,
+    rescore_candidates: Optional[int] = None,
+) -> List[Tuple[List[Document], np.ndarray]]:
+    """Search the FAISS index and return candidates with their stored vectors.
+
+    All queries are searched in a single batched FAISS call. When the vector
+    store keeps full-precision vectors next to a compact (float16/int8) index,
+    the top candidates of the compact search are rescored with exact L2
+    distances before the best k are returned.
+
+    Args:
+        vectorstore: FAISS vector store containing the contract documents.
+        query_vectors: Question embeddings, one row per question.
+        k: Number of candidates to fetch per question.
+        rescore_candidates: Number of compact-index candidates to rescore. If
+                            not provided, uses VECTOR_RESCORE_CANDIDATES.
+
+    Returns:
+        List with one (candidate documents in similarity order, their vectors)
+        tuple per question.
+    """
+    full_vectors = getattr(vectorstore, "full_vectors", None)
+    if rescore_candidates is None:
+        rescore_candidates = VECTOR_RESCORE_CANDIDATES
+    fetch_k = max(k, rescore_candidates) if full_vectors is not None else k
+
+    queries = np.asarray(query_vectors, dtype=np.float32).reshape(-1, vectorstore.index.d)
+    _, indices = vectorstore.index.search(queries, min(fetch_k, vectorstore.index.ntotal))
+
+    results = []
+    for query, row in zip(queries, indices):
+        ids = [int(i) for i in row if i != -1]
+        if not ids:
+            vectors = np.empty((0, vectorstore.index.d), dtype=np.float32)
+        elif full_vectors is not None:
+            vectors = np.asarray(full_vectors[ids], dtype=np.float32)
+            order = np.argsort(((vectors - query) ** 2).sum(axis=1), kind="stable")[:k]
+            ids = [ids[i] for i in order]
+            vectors = vectors[order]
+        else:
+            vectors = vectorstore.index.reconstruct_batch(np.asarray(ids, dtype=np.int64))
+
+        documents = [vectorstore.docstore.search(vectorstore.index_to_docstore_id[i]) for i in ids]
+        results.append((documents, vectors))
+    return results
+
+
+def _retrieve(
+    vectorstore: "FAISS",
+    questions: List[str],
+    query_vectors: np.ndarray,
+    k: Optional[int],
+    method: Optional[str],
+) -> List[List[Document]]:
+    """Retrieve and rerank chunks for already embedded questions."""
+    k = k or RETRIEVAL_CANDIDATES
+    method = method or RERANKER
+
+    if method == "none":
+        return [documents for documents, _ in search_candidates(vectorstore, query_vectors, k)]
+    if method not in RERANKERS:
+        raise ValueError(f"Unknown reranker: {method}")
+
+    candidates = search_candidates(vectorstore, query_vectors, max(k, RERANK_CANDIDATES))
+
+    results = []
+    for question, query_vector, (documents, vectors) in zip(questions, query_vectors, candidates):
+        deadline = time.perf_counter() + RERANK_TIME_BUDGET_MS / 1000
+        similarities = _cosine_similarities(query_vector, vectors)
+        order = RERANKERS[method](question, similarities, documents, vectors, deadline)
+        results.append([documents[i] for i in order[:k]])
+    return results
+
+
+def retrieve_documents(
+    vectorstore: "FAISS",
+    question: str,
+    k: Optional[int] = None,
+    method: Optional[str] = None,
+) -> List[Document]:
+    """Retrieve the most relevant chunks for a question, reranking if enabled.
+
+    Args:
+        vectorstore: FAISS vector store containing the contract documents.
+        question: User's question.
+        k: Number of chunks to return. If not provided, uses RETRIEVAL_CANDIDATES.
+        method: Reranker name ("none", "lexical" or "mmr"). If not provided,
+                uses RERANKER from settings.
+
+    Returns:
+        List of retrieved chunks, most relevant first.
+
+    Raises:
+        ValueError: If the reranker name is unknown.
+    """
+    query_vectors = embed_queries(vectorstore.embeddings, [question])
+    return _retrieve(vectorstore, [question], query_vectors, k, method)[0]
+
+
+async def aretrieve_documents(
+    vectorstore: "FAISS",
+    question: str,
+    k: Optional[int] = None,
+    method: Optional[str] = None,
+) -> List[Document]:
+    """Asynchronously retrieve the most relevant chunks for a question.
+
+    Same as retrieve_documents, but embeds the question without blocking
+    the event loop.
+
+    Args:
+        vectorstore: FAISS vector store containing the contract documents.
+        question: User's question.
+        k: Number of chunks to return. If not provided, uses RETRIEVAL_CANDIDATES.
+        method: Reranker name ("none", "lexical" or "mmr"). If not provided,
+                uses RERANKER from settings.
+
+    Returns:
+        List of retrieved chunks, most relevant first.
+
+    Raises:
+        ValueError: If the reranker name is unknown.
+    """
+    query_vectors = await aembed_queries(vectorstore.embeddings, [question])
+    return _retrieve(vectorstore, [question], query_vectors, k, method)[0]
+
+
+def retrieve_documents_batch(
+    vectorstore: "FAISS",
+    questions: List[str],
+    k: Optional[int] = None,
+    method: Optional[str] = None,
+) -> List[List[Document]]:
+    """Retrieve the most relevant chunks for several questions at once.
+
+    Embeds all questions in a single embeddings request and searches the
+    FAISS index with one batched call before reranking each result list.
+
+    Args:
+        vectorstore: FAISS vector store containing the contract documents.
+        questions: User questions.
+        k: Number of chunks to return per question. If not provided, uses
+           RETRIEVAL_CANDIDATES.
+        method: Reranker name ("none", "lexical" or "mmr"). If not provided,
+                uses RERANKER from settings.
+
+    Returns:
+        List with the retrieved chunks for each question, most relevant first.
+
+    Raises:
+        ValueError: If the reranker name is unknown.
+    """
+    if not questions:
+        return []
+    query_vectors = embed_queries(vectorstore.embeddings, questions)
+    return _retrieve(vectorstore, questions, query_vectors, k, method)
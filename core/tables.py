@@ -0,0 +1,129 @@
+"""Table extraction and table-aware chunking helpers.
+
+Payment schedules and fee tables lose their structure when a page is
+flattened into plain text: cells of a row end up in unreadable runs. Tables
+detected on a page are therefore rendered as Markdown and appended to the
+page text after the surrounding prose, and chunking keeps each Markdown table
+together in chunks of its own.
+"""
+
+import re
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+from langchain_core.documents import Document
+
+# A Markdown table: a header row, a delimiter row and any number of body rows
+MARKDOWN_TABLE_PATTERN = re.compile(
+    r"^\|.*\|[ \t]*\n\|(?:[ \t]*:?-{3,}:?[ \t]*\|)+[ \t]*(?:\n\|.*\|[ \t]*)*$", re.MULTILINE
+)
+
+
+def _clean_cell(cell: Optional[str]) -> str:
+    """Flatten a table cell to a single Markdown-safe line."""
+    return " ".join((cell or "").split()).replace("|", "\\|")
+
+
+def table_to_markdown(rows: Sequence[Sequence[Optional[str]]]) -> str:
+    """Render table rows as a Markdown table.
+
+    Args:
+        rows: Table rows as lists of cell texts; the first row is used as the
+              header. Missing cells may be None.
+
+    Returns:
+        Markdown table, or an empty string if the table has no text.
+    """
+    cleaned = [[_clean_cell(cell) for cell in row] for row in rows]
+    cleaned = [row for row in cleaned if any(row)]
+    if not cleaned:
+        return ""
+
+    width = max(len(row) for row in cleaned)
+    cleaned = [row + [""] * (width - len(row)) for row in cleaned]
+    lines = ["| " + " | ".join(row) + " |" for row in cleaned]
+    lines.insert(1, "|" + "---|" * width)
+    return "\n".join(lines)
+
+
+def extract_text_with_tables(page: Any) -> str:
+    """Extract the text of a pdfplumber page with its tables as Markdown.
+
+    Characters inside detected tables are left out of the plain text, and
+    each table is appended after it as a Markdown table.
+
+    Args:
+        page: pdfplumber page.
+
+    Returns:
+        Page text followed by its tables, separated by blank lines.
+    """
+    tables = page.find_tables()
+    if not tables:
+        return page.extract_text() or ""
+
+    bboxes = [table.bbox for table in tables]
+
+    def outside_tables(obj: Dict[str, Any]) -> bool:
+        return not any(
+            x0 <= obj.get("x0", -1)
+            and obj.get("x1", -1) <= x1
+            and top <= obj.get("top", -1)
+            and obj.get("bottom", -1) <= bottom
+            for x0, top, x1, bottom in bboxes
+        )
+
+    prose = (page.filter(outside_tables).extract_text() or "").strip()
+    markdown = [table_to_markdown(table.extract()) for table in tables]
+    return "\n\n".join(part for part in [prose, *markdown] if part)
+
+
+def _split_table(table: str, chunk_size: int) -> List[Tuple[int, str]]:
+    """Split a Markdown table into (offset, text) parts of whole rows.
+
+    Every part after the first repeats the header and delimiter rows so it
+    can be read on its own.
+    """
+    lines = table.split("\n")
+    header = "\n".join(lines[:2])
+    parts: List[Tuple[int, str]] = []
+    part_start, part_text = 0, header
+    offset = len(header) + 1
+    for row in lines[2:]:
+        if part_text != header and len(part_text) + len(row) + 1 > chunk_size:
+            parts.append((part_start, part_text))
+            part_start, part_text = offset, header
+        part_text += "\n" + row
+        offset += len(row) + 1
+    parts.append((part_start, part_text))
+    return parts
+
+
+def split_table_chunks(document: Document, chunk_size: int) -> Tuple[Document, List[Document]]:
+    """Separate the Markdown tables of a page document from its prose.
+
+    Args:
+        document: Page document whose text may contain Markdown tables.
+        chunk_size: Maximum chunk size in characters; larger tables are split
+                    between rows.
+
+    Returns:
+        Tuple of (prose document with the tables blanked out so character
+        offsets are preserved, list of table chunks). Table chunks keep the
+        page metadata and add 'start_index' and 'content_type' ("table").
+    """
+    text = document.page_content
+    table_chunks = []
+    for match in MARKDOWN_TABLE_PATTERN.finditer(text):
+        for offset, part in _split_table(match.group(), chunk_size):
+            metadata = {
+                **document.metadata,
+                "start_index": match.start() + offset,
+                "content_type": "table",
+            }
+            table_chunks.append(Document(page_content=part, metadata=metadata))
+
+    if not table_chunks:
+        return document, []
+
+    prose = MARKDOWN_TABLE_PATTERN.sub(lambda match: "\n" * len(match.group()), text)
+    return Document(page_content=prose, metadata=document.metadata), table_chunks
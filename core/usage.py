@@ -0,0 +1,105 @@
+"""LLM usage reporting module.
+
+Records the token usage and latency of every LLM call, including the number
+of input tokens served from the provider's prompt cache, so that the effect
+of prompt layout changes on input-token cost and latency can be measured.
+"""
+
+import logging
+import threading
+from typing import Any, Dict, List
+
+logger = logging.getLogger(__name__)
+
+# Accumulated usage by call name
+_usage_totals: Dict[str, Dict[str, float]] = {}
+_usage_lock = threading.Lock()
+
+
+def get_cached_tokens(response: Any) -> int:
+    """Get the number of input tokens of an LLM response read from the prompt cache.
+
+    Args:
+        response: Chat model response message.
+
+    Returns:
+        Number of cached input tokens, or 0 if the provider did not report any.
+    """
+    usage = getattr(response, "usage_metadata", None) or {}
+    return int((usage.get("input_token_details") or {}).get("cache_read") or 0)
+
+
+def record_llm_usage(call: str, response: Any, seconds: float) -> Dict[str, float]:
+    """Record the token usage and latency of an LLM call.
+
+    Args:
+        call: Name of the calling feature (e.g. "qa" or "ner").
+        response: Chat model response message.
+        seconds: Wall-clock duration of the call.
+
+    Returns:
+        Dictionary with 'input_tokens', 'cached_input_tokens', 'output_tokens'
+        and 'seconds' of this call.
+    """
+    usage = getattr(response, "usage_metadata", None) or {}
+    record = {
+        "input_tokens": int(usage.get("input_tokens") or 0),
+        "cached_input_tokens": get_cached_tokens(response),
+        "output_tokens": int(usage.get("output_tokens") or 0),
+        "seconds": seconds,
+    }
+    logger.info(
+        "%s call: %d input tokens (%d cached), %d output tokens, %.2fs",
+        call,
+        record["input_tokens"],
+        record["cached_input_tokens"],
+        record["output_tokens"],
+        seconds,
+    )
+
+    with _usage_lock:
+        totals = _usage_totals.setdefault(call, dict.fromkeys(["calls", *record], 0))
+        totals["calls"] += 1
+        for key, value in record.items():
+            totals[key] += value
+    return record
+
+
+def get_llm_usage() -> Dict[str, Dict[str, float]]:
+    """Get the usage accumulated since start-up or the last reset.
+
+    Returns:
+        Dictionary mapping call names to totals of 'calls', 'input_tokens',
+        'cached_input_tokens', 'output_tokens' and 'seconds'.
+    """
+    with _usage_lock:
+        return {call: dict(totals) for call, totals in _usage_totals.items()}
+
+
+def format_llm_usage(usage: Dict[str, Dict[str, float]]) -> List[str]:
+    """Format accumulated usage as one summary line per call name.
+
+    Args:
+        usage: Usage totals as returned by get_llm_usage.
+
+    Returns:
+        Lines such as "qa: 3 calls, 2,400 input tokens (1,024 cached, 43%),
+        150 output tokens, 4.2s".
+    """
+    lines = []
+    for call, totals in sorted(usage.items()):
+        input_tokens = int(totals["input_tokens"])
+        cached = int(totals["cached_input_tokens"])
+        share = cached / input_tokens if input_tokens else 0.0
+        lines.append(
+            f"{call}: {int(totals['calls'])} calls, {input_tokens:,} input tokens "
+            f"({cached:,} cached, {share:.0%}), {int(totals['output_tokens']):,} output tokens, "
+            f"{totals['seconds']:.1f}s"
+        )
+    return lines
+
+
+def reset_llm_usage() -> None:
+    """Reset the accumulated usage totals."""
+    with _usage_lock:
+        _usage_totals.clear()
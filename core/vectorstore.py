@@ -1,23 +1,223 @@
 """Vector store module for building and managing FAISS vector stores."""
 
+import logging
+import os
+import sqlite3
+import uuid
 from pathlib import Path
-from typing import List, Union
+from typing import Any, Callable, Dict, List, Optional, Union
 
+import faiss
+import numpy as np
 from langchain_core.documents import Document
+from langchain_core.embeddings import Embeddings
+from langchain_community.docstore.in_memory import InMemoryDocstore
 from langchain_community.vectorstores import FAISS
 
-from config.settings import FAISS_INDEX_PATH
-from core.embeddings import get_embeddings
+from config.settings import (
+    EMBEDDING_DIMENSIONS,
+    FAISS_INDEX_PATH,
+    VECTOR_INDEX_MMAP,
+    VECTOR_RESCORE_CANDIDATES,
+    VECTOR_STORAGE,
+)
+from core.chunk_store import ChunkStore, write_chunk_store
+from core.embeddings import embed_texts, get_embeddings, truncate_embeddings
 
+logger = logging.getLogger(__name__)
 
-def build_vectorstore(documents: List[Document]) -> FAISS:
+# Files of a persisted vector store: FAISS index, chunk store and rescoring vectors
+INDEX_FILE_NAME = "index.faiss"
+CHUNKS_FILE_NAME = "chunks.sqlite"
+FULL_VECTORS_FILE_NAME = "vectors.npy"
+
+# Files indexed by bulk ingestion (see core.bulk_ingest), only valid for the index it extended
+MANIFEST_FILE_NAME = "manifest.json"
+
+# Pickled docstore written by FAISS.save_local, loaded for indexes saved before the chunk store
+LEGACY_DOCSTORE_FILE_NAME = "index.pkl"
+
+# Read flags memory-mapping a saved index; IO_FLAG_MMAP_IFC maps flat and
+# scalar-quantized indexes, which IO_FLAG_MMAP alone still reads into memory
+_MMAP_IO_FLAGS = faiss.IO_FLAG_MMAP | getattr(faiss, "IO_FLAG_MMAP_IFC", 0)
+
+# FAISS scalar quantizer types for compact vector storage
+_QUANTIZER_TYPES = {
+    "float16": faiss.ScalarQuantizer.QT_fp16,
+    "int8": faiss.ScalarQuantizer.QT_8bit,
+}
+
+
+def _create_index(vectors: np.ndarray, storage: str) -> faiss.Index:
+    """Create an empty FAISS index for the given vector storage format.
+
+    Args:
+        vectors: Vectors the index will hold, used to train quantizers.
+        storage: Vector storage format ("float32", "float16" or "int8").
+
+    Returns:
+        FAISS index ready for adding vectors.
+
+    Raises:
+        ValueError: If the storage format is unknown.
+    """
+    dimension = vectors.shape[1]
+    if storage == "float32":
+        return faiss.IndexFlatL2(dimension)
+    if storage not in _QUANTIZER_TYPES:
+        raise ValueError(f"Unknown vector storage format: {storage}")
+
+    index = faiss.IndexScalarQuantizer(dimension, _QUANTIZER_TYPES[storage], faiss.METRIC_L2)
+    index.train(vectors)
+    return index
+
+
+def create_vectorstore(
+    texts: List[str],
+    vectors: np.ndarray,
+    metadatas: List[Dict[str, Any]],
+    embeddings: Embeddings,
+    storage: Optional[str] = None,
+) -> FAISS:
+    """Create a FAISS vector store from precomputed embedding vectors.
+
+    With compact storage ("float16" or "int8") the index keeps scalar-quantized
+    codes that are dequantized on search. If VECTOR_RESCORE_CANDIDATES is set,
+    the full-precision vectors are also kept alongside the index so the top
+    candidates of a search can be rescored exactly, at the cost of a float32
+    copy of every vector.
+
+    Args:
+        texts: Chunk texts.
+        vectors: Embedding vectors of the texts, one row per text.
+        metadatas: Chunk metadata dictionaries.
+        embeddings: Embeddings instance used to embed queries.
+        storage: Vector storage format ("float32", "float16" or "int8").
+                 If not provided, uses VECTOR_STORAGE from settings.
+
+    Returns:
+        FAISS vector store instance.
+
+    Raises:
+        ValueError: If the storage format is unknown.
+    """
+    storage = storage or VECTOR_STORAGE
+    vectors = np.asarray(vectors, dtype=np.float32)
+
+    vectorstore = FAISS(
+        embedding_function=embeddings,
+        index=_create_index(vectors, storage),
+        docstore=InMemoryDocstore(),
+        index_to_docstore_id={},
+    )
+    if storage != "float32" and VECTOR_RESCORE_CANDIDATES > 0:
+        vectorstore.full_vectors = np.empty((0, vectors.shape[1]), dtype=np.float32)
+
+    add_vectors(vectorstore, texts, vectors, metadatas)
+    return vectorstore
+
+
+def add_vectors(
+    vectorstore: FAISS,
+    texts: List[str],
+    vectors: np.ndarray,
+    metadatas: List[Dict[str, Any]],
+) -> None:
+    """Add precomputed embedding vectors to an existing vector store.
+
+    The vectors are added to the FAISS index as a float32 array, without the
+    round trip through Python lists of FAISS.add_embeddings.
+
+    Args:
+        vectorstore: FAISS vector store to extend.
+        texts: Chunk texts.
+        vectors: Embedding vectors of the texts, one row per text.
+        metadatas: Chunk metadata dictionaries.
+
+    Raises:
+        ValueError: If the numbers of texts, vectors and metadatas differ, or
+                    if the index is memory-mapped.
+    """
+    if getattr(vectorstore, "index_mmapped", False):
+        raise ValueError("Cannot add vectors to a memory-mapped index; load it with mmap=False")
+    vectors = np.ascontiguousarray(vectors, dtype=np.float32)
+    if not len(texts) == len(vectors) == len(metadatas):
+        raise ValueError(
+            f"Got {len(texts)} texts, {len(vectors)} vectors and {len(metadatas)} metadatas"
+        )
+
+    if vectorstore._normalize_L2:
+        vectors = vectors.copy()
+        faiss.normalize_L2(vectors)
+    vectorstore.index.add(vectors)
+
+    ids = [str(uuid.uuid4()) for _ in texts]
+    vectorstore.docstore.add(
+        {
+            id_: Document(id=id_, page_content=text, metadata=metadata)
+            for id_, text, metadata in zip(ids, texts, metadatas)
+        }
+    )
+    start = len(vectorstore.index_to_docstore_id)
+    vectorstore.index_to_docstore_id.update({start + i: id_ for i, id_ in enumerate(ids)})
+
+    full_vectors = getattr(vectorstore, "full_vectors", None)
+    if full_vectors is not None:
+        vectorstore.full_vectors = (
+            vectors if len(full_vectors) == 0 else np.concatenate([full_vectors, vectors])
+        )
+
+
+def resize_vectorstore(vectorstore: FAISS, dimension: int, storage: Optional[str] = None) -> FAISS:
+    """Shorten the vectors of a vector store to a smaller embedding dimension.
+
+    Uses the full-precision vectors kept for rescoring when available, and
+    otherwise the vectors reconstructed from the index. Vectors are truncated
+    and re-normalized, so an index built from full-size text-embedding-3
+    vectors can be searched at a reduced dimension without re-embedding.
+
+    Args:
+        vectorstore: FAISS vector store to resize.
+        dimension: Target embedding dimension.
+        storage: Vector storage format of the new index. If not provided,
+                 uses VECTOR_STORAGE from settings.
+
+    Returns:
+        New FAISS vector store sharing the original docstore.
+
+    Raises:
+        ValueError: If the target dimension exceeds the current dimension.
+    """
+    full_vectors = getattr(vectorstore, "full_vectors", None)
+    if full_vectors is not None:
+        vectors = np.asarray(full_vectors, dtype=np.float32)
+    else:
+        vectors = vectorstore.index.reconstruct_n(0, vectorstore.index.ntotal)
+    vectors = truncate_embeddings(vectors, dimension)
+
+    index = _create_index(vectors, storage or VECTOR_STORAGE)
+    index.add(vectors)
+    resized = FAISS(
+        embedding_function=vectorstore.embedding_function,
+        index=index,
+        docstore=vectorstore.docstore,
+        index_to_docstore_id=vectorstore.index_to_docstore_id,
+    )
+    if full_vectors is not None:
+        resized.full_vectors = vectors
+    return resized
+
+
+def build_vectorstore(documents: List[Document], embeddings: Optional[Embeddings] = None) -> FAISS:
     """Build a FAISS vector store from a list of chunked Document objects.
 
     Creates embeddings for the documents and builds a FAISS index for
-    efficient similarity search.
+    efficient similarity search, stored in the VECTOR_STORAGE format.
 
     Args:
         documents: List of chunked LangChain Document objects.
+        embeddings: Optional embeddings instance to reuse. If not provided,
+                    uses get_embeddings().
 
     Returns:
         FAISS vector store instance.
@@ -28,15 +228,40 @@ def build_vectorstore(documents: List[Document]) -> FAISS:
     if not documents:
         raise ValueError("Cannot build vector store from an empty list of documents")
 
-    embeddings = get_embeddings()
-    return FAISS.from_documents(documents=documents, embedding=embeddings)
+    embeddings = embeddings or get_embeddings()
+    texts = [document.page_content for document in documents]
+    vectors = embed_texts(embeddings, texts)
+    return create_vectorstore(
+        texts, vectors, [document.metadata for document in documents], embeddings
+    )
+
+
+def _replace_file(path: Path, write: Callable[[Path], None]) -> None:
+    """Write a file through a temporary file moved into place.
+
+    Processes that memory-mapped the previous file keep reading it unchanged.
+    """
+    tmp_path = path.with_name(f".{path.name}.tmp")
+    try:
+        write(tmp_path)
+        os.replace(tmp_path, path)
+    except BaseException:
+        tmp_path.unlink(missing_ok=True)
+        raise
 
 
 def save_vectorstore(vectorstore: FAISS, path: Union[str, Path, None] = None) -> None:
     """Save a FAISS vector store to disk.
 
+    The index is written with faiss.write_index and the chunks to a SQLite
+    chunk store (see core.chunk_store); nothing is pickled. A vector store
+    loaded from the same path only appends the chunks added since loading.
+    Saving any other vector store replaces the index at the path, so the
+    bulk ingestion manifest recorded for the previous index is removed.
+
     Args:
-        vectorstore: FAISS vector store instance to save.
+        vectorstore: FAISS vector store instance to save. Chunk metadata must
+                     be JSON-serializable.
         path: Optional path to save the vector store. If not provided,
               uses FAISS_INDEX_PATH from settings.
     """
@@ -44,5 +269,134 @@ def save_vectorstore(vectorstore: FAISS, path: Union[str, Path, None] = None) ->
         path = FAISS_INDEX_PATH
 
     path = Path(path)
-    path.parent.mkdir(parents=True, exist_ok=True)
-    vectorstore.save_local(str(path))
+    path.mkdir(parents=True, exist_ok=True)
+
+    # Full-precision vectors of a previous index must not outlive it
+    full_vectors = getattr(vectorstore, "full_vectors", None)
+    if full_vectors is None:
+        (path / FULL_VECTORS_FILE_NAME).unlink(missing_ok=True)
+
+    # Chunks are written first: rows past the end of the index are ignored on load
+    chunks_path = path / CHUNKS_FILE_NAME
+    docstore = vectorstore.docstore
+    if isinstance(docstore, ChunkStore) and docstore.path.resolve() == chunks_path.resolve():
+        docstore.append(vectorstore.index_to_docstore_id)
+    else:
+        write_chunk_store(chunks_path, vectorstore.index_to_docstore_id, docstore)
+        (path / MANIFEST_FILE_NAME).unlink(missing_ok=True)
+
+    _replace_file(
+        path / INDEX_FILE_NAME, lambda tmp_path: faiss.write_index(vectorstore.index, str(tmp_path))
+    )
+    (path / LEGACY_DOCSTORE_FILE_NAME).unlink(missing_ok=True)
+
+    if full_vectors is not None:
+
+        def write_vectors(tmp_path: Path) -> None:
+            with open(tmp_path, "wb") as f:
+                np.save(f, full_vectors)
+
+        _replace_file(path / FULL_VECTORS_FILE_NAME, write_vectors)
+
+
+def _migrate_legacy_vectorstore(path: Path) -> Optional[FAISS]:
+    """Convert an index saved with a pickled docstore to the chunk store format.
+
+    The pickle is unpickled once, its chunks are written to a chunk store and
+    it is deleted, so later loads never unpickle it again.
+
+    Returns:
+        None once migrated, or the loaded vector store if its chunks could
+        not be written to a chunk store.
+    """
+    logger.warning(
+        "Loading pickled docstore %s; converting it to %s",
+        path / LEGACY_DOCSTORE_FILE_NAME,
+        CHUNKS_FILE_NAME,
+    )
+    # The legacy index is written by this application, so its pickled docstore is trusted
+    vectorstore = FAISS.load_local(
+        str(path), get_embeddings(), allow_dangerous_deserialization=True
+    )
+    try:
+        write_chunk_store(
+            path / CHUNKS_FILE_NAME, vectorstore.index_to_docstore_id, vectorstore.docstore
+        )
+    except (TypeError, ValueError, OSError, sqlite3.Error) as e:
+        logger.warning("Could not convert %s to a chunk store: %s", path, e)
+        return vectorstore
+    (path / LEGACY_DOCSTORE_FILE_NAME).unlink(missing_ok=True)
+    return None
+
+
+def load_vectorstore(path: Union[str, Path, None] = None, mmap: Optional[bool] = None) -> FAISS:
+    """Load a FAISS vector store previously saved with save_vectorstore.
+
+    The index is memory-mapped and only chunk ids are read up front; chunk
+    texts and metadata are read from the chunk store when a search returns
+    them. Full-precision rescoring vectors, if present, are memory-mapped so
+    only the rows of rescored candidates are read from disk. An index saved
+    with a larger embedding dimension than EMBEDDING_DIMENSIONS is shortened
+    on load. Indexes saved in the older pickled format are converted to the
+    chunk store format on their first load, with a warning.
+
+    Args:
+        path: Optional path to load the vector store from. If not provided,
+              uses FAISS_INDEX_PATH from settings.
+        mmap: Whether to memory-map the index. A memory-mapped index cannot
+              be extended with add_vectors. If not provided, uses
+              VECTOR_INDEX_MMAP from settings.
+
+    Returns:
+        FAISS vector store instance.
+
+    Raises:
+        FileNotFoundError: If no vector store exists at the path.
+        ValueError: If the saved index has fewer dimensions than EMBEDDING_DIMENSIONS.
+    """
+    if path is None:
+        path = FAISS_INDEX_PATH
+    mmap = VECTOR_INDEX_MMAP if mmap is None else mmap
+
+    path = Path(path)
+    if not (path / INDEX_FILE_NAME).exists():
+        raise FileNotFoundError(f"Vector store not found: {path}")
+
+    chunks_path = path / CHUNKS_FILE_NAME
+    if chunks_path.exists():
+        index = faiss.read_index(str(path / INDEX_FILE_NAME), _MMAP_IO_FLAGS if mmap else 0)
+        docstore = ChunkStore(chunks_path)
+        positions = docstore.positions()
+        vectorstore = FAISS(
+            embedding_function=get_embeddings(),
+            index=index,
+            docstore=docstore,
+            index_to_docstore_id={i: positions[i] for i in range(index.ntotal)},
+        )
+        vectorstore.index_mmapped = mmap
+    else:
+        vectorstore = _migrate_legacy_vectorstore(path)
+        if vectorstore is None:
+            return load_vectorstore(path, mmap)
+
+    full_vectors_path = path / FULL_VECTORS_FILE_NAME
+    if full_vectors_path.exists():
+        full_vectors = np.load(full_vectors_path, mmap_mode="r")
+        if len(full_vectors) == vectorstore.index.ntotal:
+            vectorstore.full_vectors = full_vectors
+        else:
+            logger.warning(
+                "Ignoring %s: %d vectors for an index of %d",
+                full_vectors_path,
+                len(full_vectors),
+                vectorstore.index.ntotal,
+            )
+
+    if vectorstore.index.d < EMBEDDING_DIMENSIONS:
+        raise ValueError(
+            f"Vector store has {vectorstore.index.d} dimensions but "
+            f"EMBEDDING_DIMENSIONS is {EMBEDDING_DIMENSIONS}; rebuild the index"
+        )
+    if vectorstore.index.d > EMBEDDING_DIMENSIONS:
+        vectorstore = resize_vectorstore(vectorstore, EMBEDDING_DIMENSIONS)
+    return vectorstore
@@ -1,21 +1,28 @@
 """Service for processing PDF files."""
 
 from pathlib import Path
-from typing import Optional
+from typing import TYPE_CHECKING, Optional
 
 import streamlit as st
-from langchain_community.vectorstores import FAISS
 
 from config.settings import PDF_TEMP_PATH
 from core.chunking import chunk_documents
-from core.ingest import load_pdf
-from core.ner import extract_entities
+from core.entity_rules import extract_rule_entities
+from core.ingest import compute_file_hash, load_pdf
+from core.ner import ENTITY_FIELDS, extract_contract_entities
 from core.vectorstore import build_vectorstore, save_vectorstore
+from services.resources import get_chat_model, get_embedder
 
+if TYPE_CHECKING:
+    from langchain_community.vectorstores import FAISS
 
-def process_pdf(uploaded_file: st.runtime.uploaded_file_manager.UploadedFile) -> Optional[FAISS]:
+
+def process_pdf(uploaded_file: st.runtime.uploaded_file_manager.UploadedFile) -> Optional["FAISS"]:
     """Process an uploaded PDF file and create a vector store.
 
+    On success, the content hash and file name of the PDF are stored in the
+    session state as 'doc_hash' and 'doc_id', scoping feedback to the document.
+
     Args:
         uploaded_file: Streamlit uploaded file object.
 
@@ -46,17 +53,20 @@ def process_pdf(uploaded_file: st.runtime.uploaded_file_manager.UploadedFile) ->
             st.error("No text could be extracted from the PDF.")
             return None
 
-        # Extract entities
-        contract_text = "\n\n".join([doc.page_content for doc in documents])
+        # Extract entities; rule-based results are kept if the LLM step fails
+        rule_entities = extract_rule_entities(documents)
+        st.session_state.entities = (
+            {field: rule_entities.get(field) for field in ENTITY_FIELDS} if rule_entities else None
+        )
         try:
             with st.spinner("Extracting contract entities..."):
-                st.session_state.entities = extract_entities(contract_text)
+                st.session_state.entities = extract_contract_entities(
+                    documents, llm=get_chat_model()
+                )
         except RuntimeError:
-            st.warning("⚠️ Entity extraction skipped (OPENAI_API_KEY not set)")
-            st.session_state.entities = None
+            st.warning("⚠️ LLM entity extraction skipped (OPENAI_API_KEY not set)")
         except Exception as e:
             st.warning(f"⚠️ Entity extraction failed: {str(e)}")
-            st.session_state.entities = None
 
         # Chunk documents
         with st.spinner("Chunking documents..."):
@@ -64,9 +74,11 @@ def process_pdf(uploaded_file: st.runtime.uploaded_file_manager.UploadedFile) ->
 
         # Build vector store
         with st.spinner("Creating embeddings and building vector store..."):
-            vectorstore = build_vectorstore(chunks)
+            vectorstore = build_vectorstore(chunks, embeddings=get_embedder())
 
         save_vectorstore(vectorstore)
+        st.session_state.doc_hash = compute_file_hash(temp_path)
+        st.session_state.doc_id = uploaded_file.name
         return vectorstore
 
     except Exception as e:
@@ -1,25 +1,32 @@
 """Service for handling question answering."""
 
-from typing import Dict, List, Tuple
+from typing import TYPE_CHECKING, Dict, List, Optional, Tuple
 
 import streamlit as st
-from langchain_community.vectorstores import FAISS
 
 from core.feedback import get_feedback_for_question
 from core.qa import answer_question
+from services.resources import get_chat_model
 
+if TYPE_CHECKING:
+    from langchain_community.vectorstores import FAISS
 
-def process_question(vectorstore: FAISS, question: str) -> Tuple[str, List[Dict[str, str]], bool]:
+
+def process_question(
+    vectorstore: "FAISS", question: str, doc_hash: Optional[str] = None
+) -> Tuple[str, List[Dict[str, str]], bool]:
     """Process a question and return answer with sources.
 
     Args:
         vectorstore: FAISS vector store containing documents.
         question: User's question.
+        doc_hash: Content hash of the indexed document; only feedback given
+                  on this document is used.
 
     Returns:
         Tuple of (answer, sources, feedback_used).
     """
-    related_feedback = get_feedback_for_question(question)
+    related_feedback = get_feedback_for_question(question, doc_hash=doc_hash)
     feedback_used = len(related_feedback) > 0
 
     spinner_text = "Searching contract and generating answer..."
@@ -27,6 +34,8 @@ def process_question(vectorstore: FAISS, question: str) -> Tuple[str, List[Dict[
         spinner_text += " (Using feedback to improve answer...)"
 
     with st.spinner(spinner_text):
-        answer, sources = answer_question(vectorstore, question)
+        answer, sources = answer_question(
+            vectorstore, question, doc_hash=doc_hash, llm=get_chat_model()
+        )
 
     return answer, sources, feedback_used
@@ -0,0 +1,35 @@
+"""Process-wide clients shared by all Streamlit sessions and reruns."""
+
+from typing import TYPE_CHECKING, Optional
+
+import streamlit as st
+from langchain_core.embeddings import Embeddings
+
+from config.settings import OPENAI_API_KEY
+from core.embeddings import get_embeddings
+from core.llm import create_chat_model
+
+if TYPE_CHECKING:
+    from langchain_openai import ChatOpenAI
+
+
+@st.cache_resource(show_spinner=False)
+def get_chat_model() -> Optional["ChatOpenAI"]:
+    """Get the shared chat model client, reusing its HTTP connection pool.
+
+    Returns:
+        ChatOpenAI client for LLM_MODEL, or None if OPENAI_API_KEY is not set.
+    """
+    if not OPENAI_API_KEY:
+        return None
+    return create_chat_model()
+
+
+@st.cache_resource(show_spinner=False)
+def get_embedder() -> Embeddings:
+    """Get the shared embeddings client.
+
+    Returns:
+        Embeddings instance as returned by get_embeddings.
+    """
+    return get_embeddings()
@@ -64,3 +64,23 @@ def mock_embeddings():
     from core.embeddings import MockEmbeddings
 
     return MockEmbeddings()
+
+
+@pytest.fixture(autouse=True)
+def page_cache_path(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> Path:
+    """Point the PDF page text cache at a temporary database."""
+    cache_path = tmp_path / "page_cache.sqlite3"
+    monkeypatch.setattr("core.ingest.PAGE_CACHE_PATH", str(cache_path))
+    monkeypatch.setattr("core.page_cache.PAGE_CACHE_PATH", str(cache_path))
+    return cache_path
+
+
+@pytest.fixture(autouse=True)
+def query_cache_path(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> Path:
+    """Point the query embedding cache at a temporary database and start it empty."""
+    from core.query_cache import clear_query_cache
+
+    cache_path = tmp_path / "query_cache.sqlite3"
+    monkeypatch.setattr("core.query_cache.QUERY_CACHE_PATH", str(cache_path))
+    clear_query_cache()
+    return cache_path
@@ -0,0 +1,103 @@
+"""Tests for bulk ingestion module."""
+
+import shutil
+from pathlib import Path
+
+import pytest
+
+from core.bulk_ingest import ingest_directory, load_manifest
+from core.vectorstore import build_vectorstore, load_vectorstore, save_vectorstore
+
+SAMPLE_PDF = Path(__file__).parent.parent / "data" / "sample_contract.pdf"
+
+
+@pytest.fixture
+def corpus_dir(temp_dir: Path) -> Path:
+    """Create a directory containing the sample contract."""
+    corpus = temp_dir / "corpus"
+    corpus.mkdir()
+    shutil.copy(SAMPLE_PDF, corpus / "contract.pdf")
+    return corpus
+
+
+@pytest.fixture(autouse=True)
+def offline_embeddings(monkeypatch, mock_embeddings):
+    """Use mock embeddings for ingestion and index loading."""
+    monkeypatch.setattr("core.bulk_ingest.get_embeddings", lambda: mock_embeddings)
+    monkeypatch.setattr("core.vectorstore.get_embeddings", lambda: mock_embeddings)
+
+
+def test_ingest_directory_builds_index(corpus_dir, temp_dir):
+    """Test ingest_directory indexes PDFs and records them in the manifest."""
+    index_path = temp_dir / "index"
+
+    stats = ingest_directory(corpus_dir, index_path, workers=1)
+
+    assert stats["files"] == 1
+    assert stats["chunks"] > 0
+    assert load_vectorstore(index_path).index.ntotal == stats["chunks"]
+    assert len(load_manifest(index_path)) == 1
+
+
+def test_ingest_directory_skips_indexed_files(corpus_dir, temp_dir):
+    """Test ingest_directory skips files whose content is already indexed."""
+    index_path = temp_dir / "index"
+    first = ingest_directory(corpus_dir, index_path, workers=1)
+    shutil.copy(SAMPLE_PDF, corpus_dir / "copy.pdf")
+
+    second = ingest_directory(corpus_dir, index_path, workers=1)
+
+    assert second["files"] == 0
+    assert second["skipped"] == 2
+    assert load_vectorstore(index_path).index.ntotal == first["chunks"]
+
+
+def test_save_vectorstore_invalidates_manifest(corpus_dir, temp_dir, mock_embeddings):
+    """Test that saving another index to the path makes bulk ingestion start over."""
+    index_path = temp_dir / "index"
+    first = ingest_directory(corpus_dir, index_path, workers=1)
+
+    vectorstore = build_vectorstore(
+        load_vectorstore(index_path).similarity_search("a", k=1), mock_embeddings
+    )
+    save_vectorstore(vectorstore, index_path)
+    second = ingest_directory(corpus_dir, index_path, workers=1)
+
+    assert load_manifest(index_path)
+    assert second["files"] == 1
+    assert load_vectorstore(index_path).index.ntotal == 1 + first["chunks"]
+
+
+def test_ingest_directory_keeps_same_named_files_apart(temp_dir):
+    """Test that same-named PDFs in sibling folders get distinct sources."""
+    corpus = temp_dir / "corpus"
+    for folder, trailer in (("acme", b""), ("globex", b"\n% globex copy\n")):
+        (corpus / folder).mkdir(parents=True)
+        (corpus / folder / "contract.pdf").write_bytes(SAMPLE_PDF.read_bytes() + trailer)
+    index_path = temp_dir / "index"
+
+    stats = ingest_directory(corpus, index_path, workers=1)
+
+    vectorstore = load_vectorstore(index_path)
+    sources = {
+        vectorstore.docstore.search(doc_id).metadata["source"]
+        for doc_id in vectorstore.index_to_docstore_id.values()
+    }
+    assert stats["files"] == 2
+    assert sources == {"acme/contract.pdf", "globex/contract.pdf"}
+
+
+def test_ingest_directory_reports_failed_files(corpus_dir, temp_dir):
+    """Test ingest_directory counts invalid PDFs as failed without aborting."""
+    (corpus_dir / "broken.pdf").write_text("This is not a PDF file")
+
+    stats = ingest_directory(corpus_dir, temp_dir / "index", workers=1)
+
+    assert stats["files"] == 1
+    assert stats["failed"] == 1
+
+
+def test_ingest_directory_not_found(temp_dir):
+    """Test ingest_directory raises error for a missing directory."""
+    with pytest.raises(FileNotFoundError, match="Directory not found"):
+        ingest_directory(temp_dir / "missing", temp_dir / "index")
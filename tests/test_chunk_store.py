@@ -0,0 +1,55 @@
+"""Tests for the SQLite chunk store."""
+
+import pytest
+from langchain_core.documents import Document
+
+from core.chunk_store import ChunkStore, write_chunk_store
+
+
+def test_chunk_store_appends_added_documents(temp_dir):
+    """Test added documents are readable before and after append."""
+    store = ChunkStore(temp_dir / "chunks.sqlite")
+    store.add({"id-a": Document(page_content="Alpha", metadata={"page": 1})})
+
+    assert store.search("id-a").page_content == "Alpha"
+    assert store.positions() == {}
+
+    store.append({0: "id-a"})
+    reopened = ChunkStore(temp_dir / "chunks.sqlite")
+
+    assert reopened.positions() == {0: "id-a"}
+    assert reopened.search("id-a") == Document(
+        id="id-a", page_content="Alpha", metadata={"page": 1}
+    )
+
+
+def test_chunk_store_search_missing_id(temp_dir):
+    """Test searching an unknown id returns an error message like InMemoryDocstore."""
+    store = ChunkStore(temp_dir / "chunks.sqlite")
+
+    assert store.search("missing") == "ID missing not found."
+
+
+def test_chunk_store_is_append_only(temp_dir):
+    """Test deleting chunks is not supported."""
+    store = ChunkStore(temp_dir / "chunks.sqlite")
+
+    with pytest.raises(ValueError, match="append-only"):
+        store.delete(["id-a"])
+
+
+def test_write_chunk_store_replaces_existing_store(temp_dir):
+    """Test write_chunk_store writes a fresh store from another docstore."""
+    path = temp_dir / "chunks.sqlite"
+    old = ChunkStore(path)
+    old.add({"old": Document(page_content="Old")})
+    old.append({0: "old"})
+    source = ChunkStore(temp_dir / "source.sqlite")
+    source.add({"new": Document(page_content="New", metadata={"page": 2})})
+
+    write_chunk_store(path, {0: "new"}, source)
+    store = ChunkStore(path)
+
+    assert store.positions() == {0: "new"}
+    assert store.search("new").metadata == {"page": 2}
+    assert store.search("old") == "ID old not found."
@@ -1,6 +1,7 @@
 """Tests for chunking module."""
 
 import pytest
+from langchain_core.documents import Document
 
 from core.chunking import chunk_documents
 
@@ -18,3 +19,22 @@ def test_chunk_documents_empty_list():
     """Test chunking raises error for empty document list."""
     with pytest.raises(ValueError, match="Cannot chunk an empty list"):
         chunk_documents([])
+
+
+def test_chunk_documents_records_start_index(sample_documents):
+    """Test chunks carry their character offset within the source page."""
+    chunks = chunk_documents(sample_documents)
+
+    assert all("start_index" in chunk.metadata for chunk in chunks)
+
+
+def test_chunk_documents_separates_tables():
+    """Test Markdown tables are chunked apart from the surrounding prose."""
+    table = "| Milestone | Amount |\n|---|---|\n| Signing | $5,000 |"
+    document = Document(page_content=f"Payment schedule:\n\n{table}", metadata={"page": 2})
+
+    chunks = chunk_documents([document])
+
+    assert [chunk.page_content for chunk in chunks] == ["Payment schedule:", table]
+    assert chunks[1].metadata["content_type"] == "table"
+    assert chunks[1].metadata["page"] == 2
@@ -0,0 +1,87 @@
+"""Tests for command-line entry points."""
+
+import csv
+import json
+
+import cli.ask
+from cli.ask import main, read_questions, write_results
+
+
+def test_read_questions_skips_blank_and_comment_lines(temp_dir):
+    """Test read_questions ignores blank lines and comments."""
+    questions_file = temp_dir / "questions.txt"
+    questions_file.write_text("# Checklist\nWho are the parties?\n\nWhich law governs?\n")
+
+    assert read_questions(questions_file) == ["Who are the parties?", "Which law governs?"]
+
+
+def test_read_questions_skips_indented_comments(temp_dir):
+    """Test read_questions ignores comments preceded by whitespace."""
+    questions_file = temp_dir / "questions.txt"
+    questions_file.write_text("  # Parties\nWho are the parties?\n\t# Law\n")
+
+    assert read_questions(questions_file) == ["Who are the parties?"]
+
+
+def test_main_passes_pdf_hash(temp_dir, monkeypatch):
+    """Test that --pdf scopes feedback to the hash of the indexed PDF."""
+    questions_file = temp_dir / "questions.txt"
+    questions_file.write_text("Who are the parties?\n")
+    calls = []
+    monkeypatch.setattr(cli.ask, "_load_vectorstore", lambda pdf, index: ("store", "abc123"))
+    monkeypatch.setattr(
+        cli.ask,
+        "answer_questions",
+        lambda store, questions, max_concurrency=None, doc_hash=None: (
+            calls.append(doc_hash)
+            or [{"question": q, "answer": "A", "sources": [], "error": None} for q in questions]
+        ),
+    )
+
+    code = main(
+        [str(questions_file), "--pdf", "contract.pdf", "--output", str(temp_dir / "o.jsonl")]
+    )
+
+    assert code == 0
+    assert calls == ["abc123"]
+
+
+def test_main_reports_missing_api_key(temp_dir, monkeypatch, capsys):
+    """Test that a missing API key exits non-zero with a one-line error."""
+    questions_file = temp_dir / "questions.txt"
+    questions_file.write_text("Who are the parties?\n")
+    monkeypatch.setattr(cli.ask, "_load_vectorstore", lambda pdf, index: ("store", None))
+    monkeypatch.setattr("core.qa.OPENAI_API_KEY", "")
+
+    code = main([str(questions_file), "--index", str(temp_dir), "--output", str(temp_dir / "o")])
+
+    assert code == 1
+    assert capsys.readouterr().err.strip() == (
+        "Error: OPENAI_API_KEY is required for question answering"
+    )
+
+
+def test_write_results_jsonl(temp_dir):
+    """Test write_results writes one JSON object per line."""
+    results = [{"question": "Q1", "answer": "A1", "sources": [{"page": 2}], "error": None}]
+    output = temp_dir / "results.jsonl"
+
+    write_results(results, output)
+
+    assert json.loads(output.read_text().strip()) == results[0]
+
+
+def test_write_results_csv(temp_dir):
+    """Test write_results writes CSV rows with joined source pages."""
+    results = [
+        {"question": "Q1", "answer": "A1", "sources": [{"page": 2}, {"page": 5}], "error": None},
+        {"question": "Q2", "answer": None, "sources": [], "error": "failed"},
+    ]
+    output = temp_dir / "results.csv"
+
+    write_results(results, output)
+
+    with open(output, newline="") as f:
+        rows = list(csv.DictReader(f))
+    assert rows[0] == {"question": "Q1", "answer": "A1", "pages": "2;5", "error": ""}
+    assert rows[1]["error"] == "failed"
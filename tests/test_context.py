@@ -0,0 +1,83 @@
+"""Tests for context assembly module."""
+
+import pytest
+from langchain_core.documents import Document
+
+from core.context import build_context
+
+
+@pytest.fixture(autouse=True)
+def word_token_counter(monkeypatch):
+    """Count whitespace-separated words as tokens to avoid loading tiktoken encodings."""
+    monkeypatch.setattr("core.context.count_tokens", lambda text: len(text.split()))
+
+
+def test_build_context_empty():
+    """Test build_context returns empty list for no documents."""
+    assert build_context([], token_budget=100) == []
+
+
+def test_build_context_removes_duplicates():
+    """Test build_context drops chunks with identical text."""
+    docs = [
+        Document(page_content="Payment is due monthly.", metadata={"page": 1}),
+        Document(page_content="Payment is due monthly.", metadata={"page": 1}),
+    ]
+
+    context = build_context(docs, token_budget=100)
+
+    assert len(context) == 1
+
+
+def test_build_context_merges_overlapping_chunks_on_same_page():
+    """Test build_context merges overlapping chunks into a single span."""
+    first = "The agreement starts on January 1. The supplier shall deliver goods weekly."
+    second = "The supplier shall deliver goods weekly. Payment is due within 30 days."
+    docs = [
+        Document(page_content=second, metadata={"page": 2, "start_index": 35}),
+        Document(page_content=first, metadata={"page": 2, "start_index": 0}),
+    ]
+
+    context = build_context(docs, token_budget=100)
+
+    assert len(context) == 1
+    assert context[0].page_content == (
+        "The agreement starts on January 1. The supplier shall deliver goods weekly."
+        " Payment is due within 30 days."
+    )
+    assert context[0].metadata["page"] == 2
+
+
+def test_build_context_does_not_merge_across_pages():
+    """Test build_context keeps chunks from different pages separate."""
+    text = "The supplier shall deliver goods weekly to the customer warehouse."
+    docs = [
+        Document(page_content=text + " More on page one.", metadata={"page": 1}),
+        Document(page_content=text + " More on page two.", metadata={"page": 2}),
+    ]
+
+    context = build_context(docs, token_budget=100)
+
+    assert [doc.metadata["page"] for doc in context] == [1, 2]
+
+
+def test_build_context_respects_token_budget():
+    """Test build_context skips chunks that do not fit the budget."""
+    docs = [
+        Document(page_content="one two three four", metadata={"page": 1}),
+        Document(page_content="five six seven eight nine ten", metadata={"page": 2}),
+        Document(page_content="eleven twelve", metadata={"page": 3}),
+    ]
+
+    context = build_context(docs, token_budget=6)
+
+    assert [doc.metadata["page"] for doc in context] == [1, 3]
+
+
+def test_build_context_keeps_most_relevant_chunk_over_budget():
+    """Test build_context always keeps the top chunk even if it exceeds the budget."""
+    docs = [Document(page_content="one two three four five", metadata={"page": 1})]
+
+    context = build_context(docs, token_budget=2)
+
+    assert len(context) == 1
@@ -1,6 +1,13 @@
 """Tests for embeddings module."""
 
-from core.embeddings import MockEmbeddings, get_embeddings
+import base64
+from types import SimpleNamespace
+
+import numpy as np
+import pytest
+from langchain_core.embeddings import Embeddings
+
+from core.embeddings import MockEmbeddings, embed_texts, get_embeddings, truncate_embeddings
 
 
 def test_mock_embeddings_init():
@@ -41,3 +48,92 @@ def test_get_embeddings_without_api_key(monkeypatch):
     monkeypatch.setattr("core.embeddings.OPENAI_API_KEY", "")
     embeddings = get_embeddings()
     assert isinstance(embeddings, MockEmbeddings)
+
+
+def test_mock_embeddings_uses_configured_dimension(monkeypatch):
+    """Test MockEmbeddings defaults to EMBEDDING_DIMENSIONS."""
+    monkeypatch.setattr("core.embeddings.EMBEDDING_DIMENSIONS", 256)
+    assert MockEmbeddings().dimension == 256
+
+
+def test_get_embeddings_requests_configured_dimension(monkeypatch):
+    """Test get_embeddings requests shortened vectors from text-embedding-3 models."""
+    monkeypatch.setenv("OPENAI_API_KEY", "test-key")
+    monkeypatch.setattr("core.embeddings.OPENAI_API_KEY", "test-key")
+    monkeypatch.setattr("core.embeddings.EMBEDDING_DIMENSIONS", 512)
+    embeddings = get_embeddings()
+    assert embeddings.dimensions == 512
+
+
+def test_truncate_embeddings_renormalizes():
+    """Test truncate_embeddings keeps leading components with unit norm."""
+    vectors = np.array([[3.0, 4.0, 12.0], [0.0, 0.0, 1.0]], dtype=np.float32)
+
+    truncated = truncate_embeddings(vectors, 2)
+
+    np.testing.assert_allclose(truncated[0], [0.6, 0.8], rtol=1e-6)
+    np.testing.assert_array_equal(truncated[1], [0.0, 0.0])
+
+
+def test_truncate_embeddings_rejects_larger_dimension():
+    """Test truncate_embeddings raises error when growing vectors."""
+    with pytest.raises(ValueError, match="Cannot truncate"):
+        truncate_embeddings(np.ones((1, 4), dtype=np.float32), 8)
+
+
+def test_embed_texts_uses_array_fast_path():
+    """Test embed_texts returns a float32 matrix from embed_documents_array."""
+    vectors = embed_texts(MockEmbeddings(dimension=8), ["a", "b", "c"])
+
+    assert vectors.dtype == np.float32
+    assert vectors.shape == (3, 8)
+    assert vectors.flags["C_CONTIGUOUS"]
+
+
+def test_embed_texts_falls_back_to_embed_documents():
+    """Test embed_texts converts the lists of embeddings without an array method."""
+
+    class ListEmbeddings(Embeddings):
+        def embed_documents(self, texts):
+            return [[1.0, 0.0] for _ in texts]
+
+        def embed_query(self, text):
+            return [1.0, 0.0]
+
+    vectors = embed_texts(ListEmbeddings(), ["a", "b"])
+
+    assert vectors.dtype == np.float32
+    np.testing.assert_array_equal(vectors, [[1.0, 0.0], [1.0, 0.0]])
+
+
+def test_openai_embeddings_decode_base64_batches(monkeypatch):
+    """Test the OpenAI fast path requests base64 payloads and decodes them in order."""
+    monkeypatch.setenv("OPENAI_API_KEY", "test-key")
+    monkeypatch.setattr("core.embeddings.OPENAI_API_KEY", "test-key")
+    monkeypatch.setattr("core.embeddings.EMBEDDING_DIMENSIONS", 3)
+    embeddings = get_embeddings()
+    requests = []
+
+    def create(input, **kwargs):
+        requests.append((list(input), kwargs))
+        items = [
+            SimpleNamespace(
+                index=i,
+                embedding=base64.b64encode(
+                    np.full(3, float(text), dtype=np.float32).tobytes()
+                ).decode(),
+            )
+            for i, text in enumerate(input)
+        ]
+        return SimpleNamespace(data=items[::-1])
+
+    object.__setattr__(embeddings, "client", SimpleNamespace(create=create))
+    object.__setattr__(embeddings, "chunk_size", 2)
+
+    vectors = embed_texts(embeddings, ["1", "2", "3"])
+
+    np.testing.assert_array_equal(vectors, [[1, 1, 1], [2, 2, 2], [3, 3, 3]])
+    assert vectors.flags["WRITEABLE"]
+    assert [texts for texts, _ in requests] == [["1", "2"], ["3"]]
+    assert requests[0][1]["encoding_format"] == "base64"
+    assert requests[0][1]["dimensions"] == 3
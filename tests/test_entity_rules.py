@@ -0,0 +1,70 @@
+"""Tests for rule-based entity extraction module."""
+
+from langchain_core.documents import Document
+
+from core.entity_rules import extract_rule_entities, parse_date, select_relevant_pages
+
+
+def test_parse_date_formats():
+    """Test common contract date formats are normalized to YYYY-MM-DD."""
+    assert parse_date("January 15, 2024") == "2024-01-15"
+    assert parse_date("15th day of March, 2023") == "2023-03-15"
+    assert parse_date("Sept. 1, 2026") == "2026-09-01"
+    assert parse_date("2024-01-15") == "2024-01-15"
+    assert parse_date("12/31/2025") == "2025-12-31"
+    assert parse_date("February 30, 2024") is None
+
+
+def test_extract_rule_entities():
+    """Test regularly phrased entities are extracted from page text."""
+    documents = [
+        Document(
+            page_content=(
+                "This Agreement is made and entered into as of the 15th day of March, 2023\n"
+                'by and between Acme, Inc., a Delaware corporation ("Acme"), and\n'
+                "Globex LLC, a California limited liability company."
+            ),
+            metadata={"page": 1},
+        ),
+        Document(
+            page_content=(
+                "This Agreement shall expire on December 31, 2025. This Agreement is\n"
+                "governed by the laws of the State of New York."
+            ),
+            metadata={"page": 2},
+        ),
+    ]
+
+    assert extract_rule_entities(documents) == {
+        "parties": ["Acme, Inc.", "Globex LLC"],
+        "effective_date": "2023-03-15",
+        "termination_date": "2025-12-31",
+        "governing_law": "State of New York",
+    }
+
+
+def test_extract_rule_entities_skips_conflicting_matches():
+    """Test fields with disagreeing matches are left unresolved."""
+    documents = [
+        Document(page_content="This contract is governed by California law.", metadata={"page": 1}),
+        Document(page_content="It is governed by the laws of Delaware.", metadata={"page": 2}),
+    ]
+
+    assert "governing_law" not in extract_rule_entities(documents)
+
+
+def test_extract_rule_entities_sample_contract(sample_documents):
+    """Test only confidently resolved fields are returned."""
+    assert extract_rule_entities(sample_documents) == {
+        "parties": ["Company A", "Company B"],
+        "effective_date": "2024-01-15",
+        "governing_law": "California",
+    }
+
+
+def test_select_relevant_pages(sample_documents):
+    """Test only pages mentioning the requested fields are selected."""
+    pages = select_relevant_pages(sample_documents, ["payment_terms"])
+
+    assert [page.metadata["page"] for page in pages] == [2]
+    assert select_relevant_pages(sample_documents[:1], ["ip_owner"]) == sample_documents[:1]
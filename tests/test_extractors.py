@@ -0,0 +1,51 @@
+"""Tests for PDF text extraction backends."""
+
+from pathlib import Path
+
+import pytest
+
+from core.extractors import AutoBackend, PdfiumBackend, PdfplumberBackend, open_backend
+
+SAMPLE_PDF = Path(__file__).parent.parent / "data" / "sample_contract.pdf"
+
+
+def test_pdfium_backend_text_page_needs_no_layout():
+    """Test a plain text page is not flagged for layout analysis."""
+    with PdfiumBackend(SAMPLE_PDF) as document:
+        text, needs_layout = document.extract_page(0)
+
+    assert "NON-DISCLOSURE AGREEMENT" in text
+    assert needs_layout is False
+
+
+def test_auto_backend_uses_pdfplumber_for_flagged_pages(monkeypatch):
+    """Test the auto backend switches to pdfplumber for table-like pages."""
+    monkeypatch.setattr("core.extractors.TABLE_PATH_OBJECTS", 1)
+    monkeypatch.setattr(PdfplumberBackend, "extract_text", lambda self, index: "layout text")
+
+    with AutoBackend(SAMPLE_PDF) as document:
+        assert document.extract_text(0) == "layout text"
+
+
+def test_auto_backend_keeps_fast_text(monkeypatch):
+    """Test the auto backend does not open pdfplumber for plain text pages."""
+    monkeypatch.setattr(PdfplumberBackend, "__init__", lambda self, path: pytest.fail())
+
+    with AutoBackend(SAMPLE_PDF) as document:
+        assert "NON-DISCLOSURE AGREEMENT" in document.extract_text(0)
+
+
+def test_open_backend_unknown_name():
+    """Test open_backend rejects unknown backend names."""
+    with pytest.raises(ValueError, match="Unknown PDF extractor"):
+        open_backend(SAMPLE_PDF, "ocr")
+
+
+def test_cache_key_tracks_table_extraction(monkeypatch):
+    """Test toggling table extraction changes the page cache key."""
+    monkeypatch.setattr("core.extractors.TABLE_EXTRACTION", True)
+    with_tables = AutoBackend.cache_key()
+    monkeypatch.setattr("core.extractors.TABLE_EXTRACTION", False)
+
+    assert AutoBackend.cache_key() != with_tables
+    assert PdfiumBackend.cache_key() == f"pdfium:{PdfiumBackend.version}"
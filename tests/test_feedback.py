@@ -8,6 +8,7 @@ from core.feedback import (
     get_feedback_for_question,
     get_feedback_stats,
     load_feedback,
+    load_feedback_page,
     save_feedback,
 )
 
@@ -22,6 +23,7 @@ def test_save_feedback(mock_feedback_path):
         assert entry["question"] == "Test question?"
         assert entry["answer"] == "Test answer"
         assert entry["rating"] == "up"
+        assert entry["id"]
 
 
 def test_save_feedback_with_comment(mock_feedback_path):
@@ -171,3 +173,129 @@ def test_get_feedback_for_question(mock_feedback_path):
     feedback = get_feedback_for_question("Who are the parties?")
     assert len(feedback) == 2
     assert all(entry["question"] == "Who are the parties?" for entry in feedback)
+
+
+def test_get_feedback_for_question_ignores_empty_question(mock_feedback_path):
+    """Test a question that normalizes to nothing matches no feedback."""
+    save_feedback("Who are the parties?", "A1", "up")
+
+    assert get_feedback_for_question("?") == []
+    assert get_feedback_for_question("  ") == []
+
+
+def test_save_feedback_with_document(mock_feedback_path):
+    """Test saving feedback records the document it was given on."""
+    save_feedback(question="Q?", answer="A", rating="up", doc_hash="abc", doc_id="contract.pdf")
+
+    with open(mock_feedback_path) as f:
+        entry = json.loads(f.readline().strip())
+        assert entry["doc_hash"] == "abc"
+        assert entry["doc_id"] == "contract.pdf"
+
+
+def test_feedback_scoped_to_document(mock_feedback_path):
+    """Test lookups, history and stats only consider the given document."""
+    save_feedback(question="Who are the parties?", answer="A1", rating="up", doc_hash="doc-1")
+    save_feedback(question="who are the parties", answer="A2", rating="down", doc_hash="doc-2")
+    save_feedback(question="Who are the parties?", answer="A3", rating="up")
+
+    feedback = get_feedback_for_question("Who are the parties?", doc_hash="doc-1")
+    assert [entry["answer"] for entry in feedback] == ["A1"]
+    assert len(get_feedback_for_question("Who are the parties?")) == 3
+    assert get_feedback_for_question("Who are the parties?", doc_hash="doc-3") == []
+
+    assert [entry["answer"] for entry in load_feedback(doc_hash="doc-2")] == ["A2"]
+    assert get_feedback_stats(doc_hash="doc-2") == {"total": 1, "positive": 0, "negative": 1}
+
+
+def test_load_feedback_sees_external_writes(mock_feedback_path):
+    """Test the in-memory feedback index is refreshed when the log changes."""
+    save_feedback(question="Q1", answer="A1", rating="up")
+    assert len(load_feedback()) == 1
+
+    with open(mock_feedback_path, "a") as f:
+        f.write(json.dumps({"timestamp": "2099-01-01T00:00:00+00:00", "question": "Q2"}) + "\n")
+
+    assert [entry["question"] for entry in load_feedback()] == ["Q2", "Q1"]
+
+
+def test_load_feedback_page(mock_feedback_path):
+    """Test cursor pagination walks the history from newest to oldest."""
+    with open(mock_feedback_path, "w") as f:
+        for i in range(5):
+            entry = {"id": str(i), "timestamp": f"2024-01-{15 + i}T10:00:00+00:00"}
+            f.write(json.dumps(entry) + "\n")
+
+    pages, cursor = [], None
+    while True:
+        page, cursor = load_feedback_page(cursor=cursor, limit=2)
+        pages.append([entry["id"] for entry in page])
+        if cursor is None:
+            break
+
+    assert pages == [["4", "3"], ["2", "1"], ["0"]]
+
+
+def test_feedback_stats_follow_appends(mock_feedback_path, monkeypatch):
+    """Test statistics are updated from new entries without re-reading the log."""
+    save_feedback(question="Q1", answer="A", rating="up", doc_hash="doc-1")
+    assert get_feedback_stats() == {"total": 1, "positive": 1, "negative": 0}
+
+    read_archive_calls = []
+    monkeypatch.setattr(
+        "core.feedback.read_archive", lambda path: read_archive_calls.append(path) or []
+    )
+    save_feedback(question="Q2", answer="A", rating="down", doc_hash="doc-1")
+    save_feedback(question="Q3", answer="A", rating="up", doc_hash="doc-2")
+
+    assert get_feedback_stats() == {"total": 3, "positive": 2, "negative": 1}
+    assert get_feedback_stats(doc_hash="doc-1") == {"total": 2, "positive": 1, "negative": 1}
+    assert read_archive_calls == []
+
+
+def test_feedback_index_follows_rotation(mock_feedback_path, monkeypatch):
+    """Test rotating the active log does not rebuild the feedback index."""
+    monkeypatch.setattr("core.feedback_store.FEEDBACK_SEGMENT_BYTES", 1)
+    save_feedback(question="Q1", answer="A", rating="up")
+    save_feedback(question="Q2", answer="A", rating="up")
+    assert get_feedback_stats()["total"] == 2
+
+    read_archive_calls = []
+    monkeypatch.setattr(
+        "core.feedback.read_archive", lambda path: read_archive_calls.append(path) or []
+    )
+    save_feedback(question="Q3", answer="A", rating="down")
+
+    assert get_feedback_stats() == {"total": 3, "positive": 2, "negative": 1}
+    assert read_archive_calls == []
+
+
+def test_feedback_index_detects_replaced_log(mock_feedback_path):
+    """Test a log rewritten in place is re-read even though its file ID is unchanged."""
+    save_feedback(question="Q1", answer="A", rating="up")
+    assert get_feedback_stats()["total"] == 1
+
+    # Same inode, new content longer than the indexed offset
+    with open(mock_feedback_path, "w") as f:
+        for question in ("New 1", "New 2"):
+            entry = {
+                "timestamp": "2024-01-15T10:00:00+00:00",
+                "question": question,
+                "answer": "A" * 500,
+            }
+            f.write(json.dumps(entry) + "\n")
+
+    assert sorted(entry["question"] for entry in load_feedback()) == ["New 1", "New 2"]
+
+
+def test_clear_all_feedback_resets_index(mock_feedback_path):
+    """Test feedback saved after clearing is indexed from the start of the new log."""
+    save_feedback(question="Q1", answer="A", rating="up")
+    save_feedback(question="Q2", answer="A", rating="up")
+    assert get_feedback_stats()["total"] == 2
+
+    clear_all_feedback()
+    save_feedback(question="Q3", answer="A", rating="down")
+
+    assert [entry["question"] for entry in load_feedback()] == ["Q3"]
+    assert get_feedback_stats() == {"total": 1, "positive": 0, "negative": 1}
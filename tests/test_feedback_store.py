@@ -0,0 +1,113 @@
+"""Tests for feedback store module."""
+
+import json
+from datetime import datetime, timezone
+
+from core.feedback import compact_feedback, load_feedback, save_feedback
+from core.feedback_store import (
+    compact_entries,
+    read_entries,
+    read_snapshot,
+    rotate_segment,
+    segment_paths,
+    snapshot_path,
+    write_snapshot,
+)
+
+
+def _entry(question, day, rating="up"):
+    return {
+        "timestamp": f"2024-01-{day:02d}T10:00:00+00:00",
+        "question": question,
+        "answer": "A",
+        "rating": rating,
+    }
+
+
+def _write_log(path, entries):
+    with open(path, "a") as f:
+        for entry in entries:
+            f.write(json.dumps(entry) + "\n")
+
+
+def test_rotate_segment(mock_feedback_path):
+    """Test the active log is rotated to numbered segments once too large."""
+    _write_log(mock_feedback_path, [_entry("Q1", 1)])
+    assert not rotate_segment(mock_feedback_path, max_bytes=10_000)
+
+    assert rotate_segment(mock_feedback_path, max_bytes=10)
+    _write_log(mock_feedback_path, [_entry("Q2", 2)])
+    assert rotate_segment(mock_feedback_path, max_bytes=10)
+
+    assert [p.name for p in segment_paths(mock_feedback_path)] == [
+        "test_feedback.000001.jsonl",
+        "test_feedback.000002.jsonl",
+    ]
+    assert not mock_feedback_path.exists()
+    assert [e["question"] for e in read_entries(mock_feedback_path)] == ["Q1", "Q2"]
+
+
+def test_snapshot_round_trip(mock_feedback_path):
+    """Test snapshot entries keep their optional fields."""
+    entries = [_entry("Q1", 1), {**_entry("Q2", 2), "comment": "Too short"}]
+
+    write_snapshot(mock_feedback_path, entries)
+
+    assert read_snapshot(mock_feedback_path) == entries
+
+
+def test_compact_entries_keeps_latest_per_question():
+    """Test compaction keeps the latest entries per normalized question."""
+    entries = [_entry("What is the term?", 1), _entry("what is the  TERM", 2), _entry("Q", 3)]
+
+    kept = compact_entries(entries, keep_per_question=1, retention_days=0)
+
+    assert kept == [entries[1], entries[2]]
+
+
+def test_compact_entries_keeps_latest_per_document():
+    """Test one document's feedback does not evict another's for the same question."""
+    entries = [
+        {**_entry("Who are the parties?", 1), "doc_hash": "a"},
+        {**_entry("Who are the parties?", 2), "doc_hash": "b"},
+        {**_entry("who are the parties", 3), "doc_hash": "b"},
+    ]
+
+    kept = compact_entries(entries, keep_per_question=1, retention_days=0)
+
+    assert kept == [entries[0], entries[2]]
+
+
+def test_compact_entries_retention():
+    """Test entries older than the retention window are dropped."""
+    entries = [_entry("Q1", 1), _entry("Q2", 20)]
+    now = datetime(2024, 1, 25, tzinfo=timezone.utc)
+
+    assert compact_entries(entries, keep_per_question=0, retention_days=10, now=now) == [entries[1]]
+
+
+def test_compact_feedback(mock_feedback_path):
+    """Test compaction merges all segments into the snapshot."""
+    _write_log(mock_feedback_path, [_entry("Q1", 1), _entry("Q1", 2)])
+    rotate_segment(mock_feedback_path, max_bytes=0)
+    _write_log(mock_feedback_path, [_entry("Q1", 3), _entry("Q2", 4)])
+
+    assert compact_feedback(keep_per_question=2, retention_days=0) == 3
+
+    assert snapshot_path(mock_feedback_path).exists()
+    assert segment_paths(mock_feedback_path) == []
+    assert not mock_feedback_path.exists()
+    assert [e["timestamp"][8:10] for e in load_feedback()] == ["04", "03", "02"]
+
+
+def test_save_feedback_rotates_and_compacts(mock_feedback_path, monkeypatch):
+    """Test the writer rotates the log and compacts it past the segment limit."""
+    monkeypatch.setattr("core.feedback_store.FEEDBACK_SEGMENT_BYTES", 1)
+    monkeypatch.setattr("core.feedback_store.FEEDBACK_MAX_SEGMENTS", 2)
+
+    for i in range(5):
+        save_feedback(question=f"Q{i}", answer="A", rating="up")
+
+    assert snapshot_path(mock_feedback_path).exists()
+    assert len(segment_paths(mock_feedback_path)) <= 2
+    assert len(load_feedback()) == 5
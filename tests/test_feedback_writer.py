@@ -0,0 +1,104 @@
+"""Tests for feedback writer module."""
+
+import json
+import multiprocessing
+import threading
+
+import pytest
+
+from core.feedback_writer import FeedbackWriter
+
+
+def _read_entries(path):
+    with open(path) as f:
+        return [json.loads(line) for line in f]
+
+
+@pytest.mark.parametrize("durability", ["sync", "group", "async"])
+def test_feedback_writer_concurrent_appends(temp_dir, durability):
+    """Test entries appended from many threads are all written intact."""
+    path = temp_dir / "feedback.jsonl"
+    writer = FeedbackWriter(path, durability=durability, batch_size=8, flush_interval=0.01)
+
+    def append(thread):
+        for i in range(25):
+            writer.append({"id": f"{thread}-{i}", "answer": "x" * 1000})
+
+    threads = [threading.Thread(target=append, args=(t,)) for t in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    writer.flush()
+
+    ids = {entry["id"] for entry in _read_entries(path)}
+    assert len(ids) == 200
+
+
+def test_feedback_writer_group_commit_is_durable_on_return(temp_dir):
+    """Test "group" appends are in the file once append returns."""
+    path = temp_dir / "feedback.jsonl"
+    writer = FeedbackWriter(path, durability="group")
+
+    writer.append({"id": "1"})
+
+    assert _read_entries(path) == [{"id": "1"}]
+
+
+def test_feedback_writer_async_flush(temp_dir):
+    """Test flush waits for entries queued in "async" mode."""
+    path = temp_dir / "feedback.jsonl"
+    writer = FeedbackWriter(path, durability="async", flush_interval=60)
+
+    writer.append({"id": "1"})
+    writer.flush()
+
+    assert _read_entries(path) == [{"id": "1"}]
+
+
+def test_feedback_writer_tracks_pending_entries(temp_dir):
+    """Test has_pending reports entries queued but not yet written."""
+    path = temp_dir / "feedback.jsonl"
+    writer = FeedbackWriter(path, durability="async", flush_interval=60)
+
+    writer.append({"id": "1"})
+    pending = writer.has_pending()
+    writer.flush()
+
+    assert pending
+    assert not writer.has_pending()
+
+
+def test_feedback_writer_reports_write_errors(temp_dir):
+    """Test a failed batch raises to the waiting caller."""
+    writer = FeedbackWriter(temp_dir, durability="group")
+
+    with pytest.raises(RuntimeError, match="Failed to save feedback"):
+        writer.append({"id": "1"})
+
+
+def test_feedback_writer_unknown_durability(temp_dir):
+    """Test an unknown durability level is rejected."""
+    with pytest.raises(ValueError, match="Unknown feedback durability level"):
+        FeedbackWriter(temp_dir / "feedback.jsonl", durability="eventually")
+
+
+def _append_from_process(path, process):
+    writer = FeedbackWriter(path, durability="group", batch_size=4)
+    for i in range(50):
+        writer.append({"id": f"{process}-{i}", "answer": "x" * 5000})
+
+
+def test_feedback_writer_cross_process_appends(temp_dir):
+    """Test appends from several processes do not interleave lines."""
+    path = temp_dir / "feedback.jsonl"
+    context = multiprocessing.get_context("spawn")
+    processes = [
+        context.Process(target=_append_from_process, args=(str(path), p)) for p in range(3)
+    ]
+    for process in processes:
+        process.start()
+    for process in processes:
+        process.join()
+
+    assert len({entry["id"] for entry in _read_entries(path)}) == 150
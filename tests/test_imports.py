@@ -0,0 +1,42 @@
+"""Tests that entry points defer heavy dependencies to first use."""
+
+import json
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+
+from core.llm import create_chat_model
+
+ROOT = Path(__file__).parent.parent
+
+# Dependencies that must not be imported before they are needed
+HEAVY_MODULES = ("langchain_openai", "openai", "faiss", "langchain_community", "pdfplumber")
+
+
+def _imported_modules(module: str) -> set:
+    """Import a module in a fresh interpreter and return the loaded module names."""
+    code = f"import json, sys, {module}; print(json.dumps(sorted(sys.modules)))"
+    result = subprocess.run(
+        [sys.executable, "-c", code], cwd=ROOT, capture_output=True, text=True, check=True
+    )
+    return set(json.loads(result.stdout.splitlines()[-1]))
+
+
+@pytest.mark.parametrize("module", ["app", "core.qa", "cli.ask"])
+def test_entry_points_defer_heavy_imports(module):
+    """Test importing entry points does not load the LLM, FAISS or PDF stacks."""
+    imported = _imported_modules(module)
+
+    assert not imported.intersection(HEAVY_MODULES)
+
+
+def test_create_chat_model_imports_client_on_first_use(monkeypatch):
+    """Test create_chat_model builds a deterministic client for LLM_MODEL."""
+    monkeypatch.setenv("OPENAI_API_KEY", "test-key")
+
+    llm = create_chat_model()
+
+    assert type(llm).__name__ == "ChatOpenAI"
+    assert llm.temperature == 0
@@ -1,8 +1,14 @@
 """Tests for PDF ingestion module."""
 
+from pathlib import Path
+
 import pytest
 
-from core.ingest import load_pdf
+from core.extractors import EXTRACTION_BACKENDS
+from core.ingest import iter_pdf_pages, load_pdf
+from core.page_cache import load_cached_pages
+
+SAMPLE_PDF = Path(__file__).parent.parent / "data" / "sample_contract.pdf"
 
 
 def test_load_pdf_file_not_found():
@@ -18,3 +24,85 @@ def test_load_pdf_invalid_file(temp_dir):
 
     with pytest.raises(ValueError, match="Failed to load PDF"):
         load_pdf(invalid_pdf)
+
+
+def test_load_pdf_uses_page_cache(monkeypatch):
+    """Test loading the same PDF again skips text extraction."""
+    first = load_pdf(SAMPLE_PDF)
+
+    def fail_open(*args, **kwargs):
+        raise AssertionError("PDF should not be opened on a cache hit")
+
+    for backend in EXTRACTION_BACKENDS.values():
+        monkeypatch.setattr(backend, "__init__", fail_open)
+    second = load_pdf(SAMPLE_PDF)
+
+    assert [doc.page_content for doc in second] == [doc.page_content for doc in first]
+    assert [doc.metadata for doc in second] == [doc.metadata for doc in first]
+
+
+def test_iter_pdf_pages_reads_cache_in_windows(monkeypatch):
+    """Test cached pages are read a window at a time, not the whole document."""
+    load_pdf(SAMPLE_PDF)
+    windows = []
+
+    def load_window(pdf_hash, settings, start, stop):
+        windows.append((start, stop))
+        return load_cached_pages(pdf_hash, settings, start, stop)
+
+    monkeypatch.setattr("core.ingest.PAGE_CACHE_BATCH_SIZE", 1)
+    monkeypatch.setattr("core.ingest.load_cached_pages", load_window)
+    pages = list(iter_pdf_pages(SAMPLE_PDF))
+
+    assert windows == [(0, 1), (1, 2)]
+    assert [page.metadata["page"] for page in pages] == [1, 2]
+
+
+def test_load_pdf_with_unwritable_cache_directory(temp_dir, monkeypatch):
+    """Test a cache directory that cannot be created does not fail extraction."""
+    (temp_dir / "not_a_directory").write_text("")
+    cache_path = str(temp_dir / "not_a_directory" / "page_cache.sqlite3")
+    monkeypatch.setattr("core.ingest.PAGE_CACHE_PATH", cache_path)
+    monkeypatch.setattr("core.page_cache.PAGE_CACHE_PATH", cache_path)
+
+    documents = load_pdf(SAMPLE_PDF)
+
+    assert [doc.metadata["page"] for doc in documents] == [1, 2]
+
+
+def test_iter_pdf_pages_page_range():
+    """Test iter_pdf_pages yields only the requested pages."""
+    pages = list(iter_pdf_pages(SAMPLE_PDF, first_page=2, last_page=2))
+
+    assert [page.metadata["page"] for page in pages] == [2]
+    assert pages[0].page_content == load_pdf(SAMPLE_PDF)[1].page_content
+
+
+def test_iter_pdf_pages_is_lazy():
+    """Test pages are extracted only as the iterator is consumed."""
+    pages = iter_pdf_pages(SAMPLE_PDF, use_cache=False)
+
+    assert next(pages).metadata["page"] == 1
+    pages.close()
+
+
+def test_iter_pdf_pages_invalid_range():
+    """Test iter_pdf_pages rejects an invalid page range."""
+    with pytest.raises(ValueError, match="Invalid page range"):
+        list(iter_pdf_pages(SAMPLE_PDF, first_page=3, last_page=2))
+
+
+@pytest.mark.parametrize("extractor", ["auto", "pdfium", "pdfplumber"])
+def test_load_pdf_extractors(extractor):
+    """Test every extraction backend returns the text of each page."""
+    documents = load_pdf(SAMPLE_PDF, use_cache=False, extractor=extractor)
+
+    assert [doc.metadata["page"] for doc in documents] == [1, 2]
+    assert "NON-DISCLOSURE AGREEMENT" in documents[0].page_content
+    assert "\r" not in documents[0].page_content
+
+
+def test_load_pdf_unknown_extractor():
+    """Test load_pdf rejects an unknown extraction backend."""
+    with pytest.raises(ValueError, match="Unknown PDF extractor"):
+        load_pdf(SAMPLE_PDF, extractor="ocr")
@@ -1,8 +1,33 @@
 """Tests for NER module."""
 
 import pytest
+from langchain_core.messages import AIMessage
+from langchain_core.runnables import RunnableLambda
 
-from core.ner import extract_entities
+from core.ner import (
+    ENTITY_FIELDS,
+    extract_contract_entities,
+    extract_entities,
+    load_cached_entities,
+    save_cached_entities,
+)
+
+ENTITIES = {
+    "parties": ["Company A", "Company B"],
+    "effective_date": "2024-01-15",
+    "termination_date": None,
+    "payment_terms": "$10,000 per month",
+    "ip_owner": "Company A",
+    "governing_law": "California",
+}
+
+
+@pytest.fixture(autouse=True)
+def ner_cache_path(temp_dir, monkeypatch):
+    """Point the entity cache at a temporary directory."""
+    cache_path = temp_dir / "ner_cache"
+    monkeypatch.setattr("core.ner.NER_CACHE_PATH", str(cache_path))
+    return cache_path
 
 
 def test_extract_entities_empty_text():
@@ -19,3 +44,143 @@ def test_extract_entities_no_api_key(monkeypatch):
     monkeypatch.setattr("core.ner.OPENAI_API_KEY", "")
     with pytest.raises(RuntimeError, match="OPENAI_API_KEY is required"):
         extract_entities("This is a contract between Company A and Company B.")
+
+
+def test_entity_cache_round_trip():
+    """Test cached entities are returned for the same contract text only."""
+    save_cached_entities("contract text", ENTITIES)
+
+    assert load_cached_entities("contract text") == ENTITIES
+    assert load_cached_entities("other contract text") is None
+
+
+def test_entity_cache_keyed_by_model(monkeypatch):
+    """Test entities cached for another LLM model are not reused."""
+    save_cached_entities("contract text", ENTITIES)
+    monkeypatch.setattr("core.ner.LLM_MODEL", "another-model")
+
+    assert load_cached_entities("contract text") is None
+
+
+def test_extract_entities_cache_hit_skips_llm(monkeypatch):
+    """Test a cache hit returns the stored entities without calling the LLM."""
+    save_cached_entities("contract text", ENTITIES)
+    monkeypatch.setattr("core.ner.OPENAI_API_KEY", "")
+
+    assert extract_entities("contract text") == ENTITIES
+
+
+def _fake_chat_model(responses, prompts):
+    """Create a fake chat model class returning the given JSON responses in turn."""
+    responses = iter(responses)
+
+    class FakeChatOpenAI:
+        def __init__(self, **kwargs):
+            pass
+
+        def with_structured_output(self, schema, include_raw=False):
+            def respond(prompt_value):
+                prompts.append(prompt_value.to_string())
+                raw = AIMessage(content=next(responses))
+                try:
+                    parsed = schema.model_validate_json(raw.content)
+                except ValueError:
+                    parsed = None
+                return {"raw": raw, "parsed": parsed, "parsing_error": None}
+
+            return RunnableLambda(respond)
+
+    return FakeChatOpenAI
+
+
+def test_extract_entities_populates_cache(monkeypatch):
+    """Test a successful extraction is stored in the cache."""
+    prompts = []
+    monkeypatch.setattr("core.ner.OPENAI_API_KEY", "test-key")
+    monkeypatch.setattr(
+        "core.ner.create_chat_model", _fake_chat_model(['{"parties": ["Company A"]}'], prompts)
+    )
+
+    first = extract_entities("contract text")
+    second = extract_entities("contract text")
+
+    assert len(prompts) == 1
+    assert first == second
+    assert first["parties"] == ["Company A"]
+    assert first["governing_law"] is None
+
+
+def test_extract_entities_retries_only_invalid_fields(monkeypatch):
+    """Test fields with invalid values are requested again on their own."""
+    prompts = []
+    responses = [
+        '{"parties": "Company A", "effective_date": "soon", "ip_owner": "Company A"}',
+        '{"parties": ["Company A", "Company B"], "effective_date": "January 15, 2024"}',
+    ]
+    monkeypatch.setattr("core.ner.OPENAI_API_KEY", "test-key")
+    monkeypatch.setattr("core.ner.NER_MAX_RETRIES", 1)
+    monkeypatch.setattr("core.ner.create_chat_model", _fake_chat_model(responses, prompts))
+
+    entities = extract_entities("contract text", use_cache=False)
+
+    assert entities["parties"] == ["Company A", "Company B"]
+    assert entities["effective_date"] == "2024-01-15"
+    assert entities["ip_owner"] == "Company A"
+    assert len(prompts) == 2
+    assert "- ip_owner:" not in prompts[1]
+    assert "- effective_date:" in prompts[1]
+    prefix = prompts[0][: prompts[0].rindex("contract text") + len("contract text")]
+    assert prompts[1].startswith(prefix)
+
+
+def test_extract_entities_gives_up_after_retries(monkeypatch):
+    """Test fields still invalid after the retries are set to None."""
+    prompts = []
+    responses = ['{"effective_date": "soon"}', '{"effective_date": "later"}']
+    monkeypatch.setattr("core.ner.OPENAI_API_KEY", "test-key")
+    monkeypatch.setattr("core.ner.NER_MAX_RETRIES", 1)
+    monkeypatch.setattr("core.ner.create_chat_model", _fake_chat_model(responses, prompts))
+
+    entities = extract_entities("contract text", use_cache=False, fields=["effective_date"])
+
+    assert entities == {"effective_date": None}
+    assert len(prompts) == 2
+
+
+def test_extract_entities_retries_unparseable_response(monkeypatch):
+    """Test a garbage response is retried for all fields and never cached."""
+    prompts = []
+    responses = ["not json", '{"governing_law": "Delaware"}', "still not json"]
+    monkeypatch.setattr("core.ner.OPENAI_API_KEY", "test-key")
+    monkeypatch.setattr("core.ner.NER_MAX_RETRIES", 1)
+    monkeypatch.setattr("core.ner.create_chat_model", _fake_chat_model(responses, prompts))
+
+    entities = extract_entities("contract text", fields=["parties", "governing_law"])
+
+    assert entities == {"parties": None, "governing_law": "Delaware"}
+    assert len(prompts) == 2
+    assert "- parties:" in prompts[1]
+    assert "- governing_law:" in prompts[1]
+
+    monkeypatch.setattr("core.ner.NER_MAX_RETRIES", 0)
+    assert extract_entities("other text") == dict.fromkeys(ENTITY_FIELDS)
+    assert load_cached_entities("other text") is None
+    assert len(prompts) == 3
+
+
+def test_extract_contract_entities_asks_llm_only_for_missing_fields(monkeypatch, sample_documents):
+    """Test rule-resolved fields skip the LLM and the rest use a targeted prompt."""
+    prompts = []
+    response = '{"payment_terms": "$10,000 per month", "ip_owner": "A"}'
+    monkeypatch.setattr("core.ner.OPENAI_API_KEY", "test-key")
+    monkeypatch.setattr("core.ner.create_chat_model", _fake_chat_model([response], prompts))
+
+    entities = extract_contract_entities(sample_documents)
+
+    assert entities["parties"] == ["Company A", "Company B"]
+    assert entities["governing_law"] == "California"
+    assert entities["payment_terms"] == "$10,000 per month"
+    assert entities["termination_date"] is None
+    assert len(prompts) == 1
+    assert "- parties:" not in prompts[0]
+    assert "- termination_date:" in prompts[0]
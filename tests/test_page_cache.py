@@ -0,0 +1,27 @@
+"""Tests for PDF page text cache module."""
+
+from core.page_cache import load_cached_pages, load_page_count, save_cached_pages
+
+
+def test_page_cache_round_trip():
+    """Test cached pages are returned for the same PDF hash and settings."""
+    save_cached_pages("hash", "settings", 3, {0: "First page", 2: "Third page"})
+
+    assert load_page_count("hash", "settings") == 3
+    assert load_cached_pages("hash", "settings", 0, 3) == {0: "First page", 2: "Third page"}
+
+
+def test_page_cache_loads_only_requested_range():
+    """Test a window of pages is loaded without the rest of the document."""
+    save_cached_pages("hash", "settings", 4, {i: f"Page {i + 1}" for i in range(4)})
+
+    assert load_cached_pages("hash", "settings", 1, 3) == {1: "Page 2", 2: "Page 3"}
+
+
+def test_page_cache_keyed_by_settings():
+    """Test pages extracted with other settings are not returned."""
+    save_cached_pages("hash", "settings", 1, {0: "Text"})
+
+    assert load_page_count("hash", "other settings") is None
+    assert load_cached_pages("hash", "other settings", 0, 1) == {}
+    assert load_cached_pages("other hash", "settings", 0, 1) == {}
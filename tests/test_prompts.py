@@ -1,6 +1,16 @@
 """Tests for prompts module."""
 
-from core.prompts import QA_PROMPT, NER_PROMPT, get_enhanced_qa_prompt
+from core.prompts import (
+    NER_PROMPT,
+    NER_PROMPT_PREFIX,
+    QA_PROMPT,
+    QA_PROMPT_PREFIX,
+    clear_prompt_cache,
+    get_enhanced_qa_prompt,
+    get_feedback_prompt_key,
+    get_ner_prompt,
+    get_qa_prompt_template,
+)
 
 
 def test_qa_prompt_contains_required_placeholders():
@@ -54,3 +64,68 @@ def test_get_enhanced_qa_prompt_limits_examples():
     assert "Q0" in result
     assert "Q1" in result
     assert result.count("Question:") <= 4  # 2 positive + potentially 2 negative
+
+
+def test_get_feedback_prompt_key_uses_selected_example_ids():
+    """Test the prompt key lists IDs of the examples included in the prompt."""
+    feedback = [{"id": f"id{i}", "rating": "up", "question": f"Q{i}"} for i in range(5)]
+
+    assert get_feedback_prompt_key(feedback) == ("id0", "id1")
+    assert get_feedback_prompt_key([]) == ()
+
+
+def test_get_qa_prompt_template_is_memoized():
+    """Test repeated calls with the same feedback reuse the parsed template."""
+    clear_prompt_cache()
+    feedback = [{"id": "a", "rating": "up", "question": "Q1", "answer": "A1"}]
+
+    first = get_qa_prompt_template(feedback)
+    second = get_qa_prompt_template([dict(feedback[0])])
+
+    assert first is second
+    assert "Q1" in first.messages[0].prompt.template
+
+
+def test_clear_prompt_cache_invalidates_templates():
+    """Test clearing the cache forces templates to be rebuilt."""
+    feedback = [{"id": "a", "rating": "up", "question": "Q1", "answer": "A1"}]
+    first = get_qa_prompt_template(feedback)
+
+    clear_prompt_cache()
+
+    assert get_qa_prompt_template(feedback) is not first
+
+
+def test_get_enhanced_qa_prompt_keeps_static_prefix():
+    """Test feedback guidance is placed after the static instructions."""
+    feedback = [{"id": "a", "rating": "up", "question": "Q1", "answer": "A1"}]
+    prompt = get_enhanced_qa_prompt(feedback)
+
+    assert prompt.startswith(QA_PROMPT_PREFIX)
+    assert prompt.index("Learning from Previous Interactions") < prompt.index("{context}")
+
+
+def test_prompts_end_with_request_text():
+    """Test request-specific placeholders come after the static prompt prefixes."""
+    assert QA_PROMPT.startswith(QA_PROMPT_PREFIX)
+    assert "{" not in QA_PROMPT_PREFIX
+    assert NER_PROMPT_PREFIX.endswith("{contract_text}")
+    assert "{" not in NER_PROMPT_PREFIX[: -len("{contract_text}")]
+
+
+def test_ner_prompts_share_prefix_up_to_contract_text():
+    """Test targeted NER prompts differ only after the contract text."""
+    for fields in (None, ["effective_date"], ["ip_owner", "payment_terms"]):
+        prompt = get_ner_prompt(fields)
+        assert prompt.startswith(NER_PROMPT_PREFIX)
+        assert "- " not in prompt[: len(NER_PROMPT_PREFIX)]
+
+
+def test_get_ner_prompt_requests_only_given_fields():
+    """Test a targeted NER prompt lists only the requested entities."""
+    prompt = get_ner_prompt(["ip_owner", "payment_terms"])
+
+    assert "- ip_owner:" in prompt
+    assert "- payment_terms:" in prompt
+    assert "- parties:" not in prompt
+    assert "{contract_text}" in prompt
@@ -1,10 +1,21 @@
 """Tests for question answering module."""
 
+import asyncio
+
 import pytest
 from langchain_core.documents import Document
+from langchain_core.messages import AIMessage
+from langchain_core.runnables import RunnableLambda
 from langchain_community.vectorstores import FAISS
 
-from core.qa import answer_question
+from core.qa import (
+    _generate_answer,
+    aanswer_question,
+    answer_question,
+    answer_questions,
+    normalize_question,
+)
+from core.usage import get_llm_usage, reset_llm_usage
 
 
 def test_answer_question_empty_question(mock_embeddings):
@@ -28,3 +39,108 @@ def test_answer_question_no_api_key(monkeypatch, mock_embeddings):
 
     with pytest.raises(RuntimeError, match="OPENAI_API_KEY is required"):
         answer_question(vectorstore, "test question")
+
+
+def test_answer_questions_empty_question(mock_embeddings):
+    """Test answer_questions raises error when any question is empty."""
+    docs = [Document(page_content="test", metadata={"page": 1})]
+    vectorstore = FAISS.from_documents(docs, mock_embeddings)
+
+    with pytest.raises(ValueError, match="Question cannot be empty"):
+        answer_questions(vectorstore, ["Who are the parties?", "  "])
+
+
+def test_answer_questions_preserves_order_and_errors(monkeypatch, mock_embeddings):
+    """Test answer_questions returns results in order and isolates failures."""
+    docs = [Document(page_content="test", metadata={"page": 1})]
+    vectorstore = FAISS.from_documents(docs, mock_embeddings)
+
+    def fake_generate_answer(llm, question, candidates, doc_hash=None):
+        if question == "Q2":
+            raise RuntimeError("LLM unavailable")
+        return f"Answer to {question}", [{"content": "test", "page": 1}]
+
+    monkeypatch.setattr("core.qa.OPENAI_API_KEY", "test-key")
+    monkeypatch.setattr("core.qa.create_chat_model", lambda **kwargs: None)
+    monkeypatch.setattr("core.qa._generate_answer", fake_generate_answer)
+
+    results = answer_questions(vectorstore, ["Q1", "Q2", "Q3"], max_concurrency=2)
+
+    assert [result["question"] for result in results] == ["Q1", "Q2", "Q3"]
+    assert results[0]["answer"] == "Answer to Q1"
+    assert results[1]["error"] == "LLM unavailable"
+    assert results[2]["error"] is None
+
+
+def test_normalize_question():
+    """Test normalize_question lowercases, collapses whitespace and drops trailing punctuation."""
+    assert normalize_question("  Who are   the PARTIES? ") == "who are the parties"
+
+
+def test_aanswer_question_empty_question(mock_embeddings):
+    """Test aanswer_question raises error for empty question."""
+    docs = [Document(page_content="test", metadata={"page": 1})]
+    vectorstore = FAISS.from_documents(docs, mock_embeddings)
+
+    with pytest.raises(ValueError, match="Question cannot be empty"):
+        asyncio.run(aanswer_question(vectorstore, "  "))
+
+
+def test_aanswer_question_coalesces_identical_requests(monkeypatch, mock_embeddings):
+    """Test concurrent identical questions share a single LLM call."""
+    docs = [Document(page_content="test", metadata={"page": 1})]
+    vectorstore = FAISS.from_documents(docs, mock_embeddings)
+    calls = []
+
+    async def fake_agenerate_answer(llm, question, candidates, prompt):
+        calls.append(question)
+        await asyncio.sleep(0.05)
+        return f"Answer to {question}", []
+
+    monkeypatch.setattr("core.qa.OPENAI_API_KEY", "test-key")
+    monkeypatch.setattr("core.qa.create_chat_model", lambda **kwargs: None)
+    monkeypatch.setattr("core.qa.get_feedback_for_question", lambda question, doc_hash=None: [])
+    monkeypatch.setattr("core.qa._agenerate_answer", fake_agenerate_answer)
+
+    async def ask_all():
+        return await asyncio.gather(
+            aanswer_question(vectorstore, "Who are the parties?"),
+            aanswer_question(vectorstore, "who are  the parties?"),
+            aanswer_question(vectorstore, "Who are the parties?"),
+            aanswer_question(vectorstore, "Which law governs?"),
+        )
+
+    results = asyncio.run(ask_all())
+
+    assert len(calls) == 2
+    assert results[0] == results[1] == results[2]
+    assert results[3][0] == "Answer to Which law governs?"
+
+
+def test_generate_answer_records_cached_tokens(monkeypatch):
+    """Test answer generation reports the prompt-cache hits of the LLM call."""
+    prompts = []
+
+    def fake_llm(prompt_value):
+        prompts.append(prompt_value.to_string())
+        return AIMessage(
+            content="The parties are A and B.",
+            usage_metadata={
+                "input_tokens": 1200,
+                "output_tokens": 10,
+                "total_tokens": 1210,
+                "input_token_details": {"cache_read": 1024},
+            },
+        )
+
+    monkeypatch.setattr("core.qa.get_feedback_for_question", lambda question, doc_hash=None: [])
+    monkeypatch.setattr("core.context.count_tokens", lambda text: len(text.split()))
+    reset_llm_usage()
+
+    docs = [Document(page_content="Party A and Party B", metadata={"page": 1})]
+    answer, sources = _generate_answer(RunnableLambda(fake_llm), "Who are the parties?", docs)
+
+    assert answer == "The parties are A and B."
+    assert sources == [{"content": "Party A and Party B", "page": 1}]
+    assert "Party A and Party B" in prompts[0]
+    assert get_llm_usage()["qa"]["cached_input_tokens"] == 1024
@@ -0,0 +1,112 @@
+"""Tests for query_cache module."""
+
+import asyncio
+from typing import List
+
+import numpy as np
+from langchain_core.embeddings import Embeddings
+
+from core.query_cache import (
+    aembed_queries,
+    clear_query_cache,
+    embed_queries,
+    embedding_model_key,
+)
+
+
+class CountingEmbeddings(Embeddings):
+    """Embeddings deriving vectors from text length and recording each request."""
+
+    def __init__(self, model: str = "test-model") -> None:
+        self.model = model
+        self.requests: List[List[str]] = []
+
+    def embed_documents(self, texts: List[str]) -> List[List[float]]:
+        self.requests.append(list(texts))
+        return [[float(len(text)), 1.0, 0.0] for text in texts]
+
+    def embed_query(self, text: str) -> List[float]:
+        return self.embed_documents([text])[0]
+
+    async def aembed_documents(self, texts: List[str]) -> List[List[float]]:
+        return self.embed_documents(texts)
+
+
+def test_embedding_model_key_distinguishes_models():
+    """Test that the cache key includes the embedding model."""
+    assert embedding_model_key(CountingEmbeddings("a")) != embedding_model_key(
+        CountingEmbeddings("b")
+    )
+
+
+def test_embed_queries_reuses_normalized_questions():
+    """Test that repeated and differently spaced questions are embedded once."""
+    embeddings = CountingEmbeddings()
+
+    first = embed_queries(embeddings, ["What is the term?"])
+    second = embed_queries(embeddings, ["what is  the TERM", "What is the term?"])
+
+    assert embeddings.requests == [["What is the term?"]]
+    assert first.dtype == np.float32
+    assert second.shape == (2, 3)
+    np.testing.assert_array_equal(second[0], first[0])
+    np.testing.assert_array_equal(second[1], first[0])
+
+
+def test_embed_queries_batches_misses_in_one_request():
+    """Test that uncached questions are embedded together, each once."""
+    embeddings = CountingEmbeddings()
+    embed_queries(embeddings, ["Cached?"])
+
+    vectors = embed_queries(embeddings, ["New?", "Cached?", "Other question?", "new?"])
+
+    assert embeddings.requests == [["Cached?"], ["New?", "Other question?"]]
+    assert vectors[:, 0].tolist() == [4.0, 7.0, 15.0, 4.0]
+
+
+def test_embed_queries_persists_across_processes():
+    """Test that embeddings are read from the database when not in memory."""
+    embeddings = CountingEmbeddings()
+    expected = embed_queries(embeddings, ["What is the term?"])
+
+    clear_query_cache()
+    vectors = embed_queries(embeddings, ["What is the term?"])
+
+    assert len(embeddings.requests) == 1
+    np.testing.assert_array_equal(vectors, expected)
+
+
+def test_embed_queries_without_database(monkeypatch):
+    """Test that an empty QUERY_CACHE_PATH keeps the cache in memory only."""
+    monkeypatch.setattr("core.query_cache.QUERY_CACHE_PATH", "")
+    embeddings = CountingEmbeddings()
+
+    embed_queries(embeddings, ["What is the term?"])
+    embed_queries(embeddings, ["What is the term?"])
+    clear_query_cache()
+    embed_queries(embeddings, ["What is the term?"])
+
+    assert len(embeddings.requests) == 2
+
+
+def test_embed_queries_keeps_models_apart():
+    """Test that a question cached for one model is embedded again for another."""
+    small, large = CountingEmbeddings("small"), CountingEmbeddings("large")
+
+    embed_queries(small, ["What is the term?"])
+    embed_queries(large, ["What is the term?"])
+
+    assert small.requests == [["What is the term?"]]
+    assert large.requests == [["What is the term?"]]
+
+
+def test_aembed_queries_shares_the_cache():
+    """Test that the async variant uses and fills the same cache."""
+    embeddings = CountingEmbeddings()
+    embed_queries(embeddings, ["Cached?"])
+
+    vectors = asyncio.run(aembed_queries(embeddings, ["Cached?", "New?"]))
+    embed_queries(embeddings, ["new?"])
+
+    assert embeddings.requests == [["Cached?"], ["New?"]]
+    assert vectors[:, 0].tolist() == [7.0, 4.0]
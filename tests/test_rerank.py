@@ -0,0 +1,96 @@
+"""Tests for reranking module."""
+
+import time
+
+import numpy as np
+import pytest
+from langchain_core.documents import Document
+from langchain_community.vectorstores import FAISS
+
+from core.rerank import lexical_rerank, mmr_rerank, retrieve_documents, search_candidates
+from core.vectorstore import create_vectorstore
+
+
+@pytest.fixture
+def candidates():
+    """Create candidate documents for reranking."""
+    return [
+        Document(page_content="Confidential information must be protected.", metadata={"page": 1}),
+        Document(page_content="This contract is governed by California law.", metadata={"page": 2}),
+        Document(page_content="Payment terms are net 30 days.", metadata={"page": 3}),
+    ]
+
+
+def test_lexical_rerank_prefers_term_overlap(candidates):
+    """Test lexical reranking promotes chunks sharing question terms."""
+    similarities = np.zeros(3, dtype=np.float32)
+    vectors = np.zeros((3, 4), dtype=np.float32)
+
+    order = lexical_rerank(
+        "Which law governs?", similarities, candidates, vectors, time.perf_counter() + 1
+    )
+
+    assert order[0] == 1
+    assert sorted(order) == [0, 1, 2]
+
+
+def test_lexical_rerank_expired_deadline_keeps_order(candidates):
+    """Test lexical reranking keeps vector order once the time budget is spent."""
+    similarities = np.zeros(3, dtype=np.float32)
+    vectors = np.zeros((3, 4), dtype=np.float32)
+
+    order = lexical_rerank("Which law governs?", similarities, candidates, vectors, 0.0)
+
+    assert order == [0, 1, 2]
+
+
+def test_mmr_rerank_promotes_diversity(candidates):
+    """Test MMR reranking demotes near-duplicate candidates."""
+    similarities = np.array([1.0, 0.9, 0.8], dtype=np.float32)
+    vectors = np.array([[1, 0], [1, 0], [0, 1]], dtype=np.float32)
+
+    order = mmr_rerank("question", similarities, candidates, vectors, time.perf_counter() + 1)
+
+    assert order == [0, 2, 1]
+
+
+def test_retrieve_documents_with_reranker(mock_embeddings, candidates):
+    """Test retrieve_documents returns k reranked documents."""
+    vectorstore = FAISS.from_documents(candidates, mock_embeddings)
+
+    documents = retrieve_documents(vectorstore, "Which law governs?", k=2, method="lexical")
+
+    assert len(documents) == 2
+    assert documents[0].metadata["page"] == 2
+
+
+def test_retrieve_documents_without_reranker(mock_embeddings, candidates):
+    """Test retrieve_documents falls back to plain similarity search."""
+    vectorstore = FAISS.from_documents(candidates, mock_embeddings)
+
+    assert len(retrieve_documents(vectorstore, "Which law governs?", k=2, method="none")) == 2
+
+
+def test_retrieve_documents_unknown_reranker(mock_embeddings, candidates):
+    """Test retrieve_documents raises error for unknown reranker."""
+    vectorstore = FAISS.from_documents(candidates, mock_embeddings)
+
+    with pytest.raises(ValueError, match="Unknown reranker"):
+        retrieve_documents(vectorstore, "question", method="cross-encoder")
+
+
+def test_search_candidates_rescores_compact_index(mock_embeddings, monkeypatch):
+    """Test compact-index candidates are reordered by full-precision distance."""
+    monkeypatch.setattr("core.vectorstore.VECTOR_RESCORE_CANDIDATES", 20)
+    vectors = np.random.default_rng(0).normal(size=(50, 16)).astype(np.float32)
+    texts = [f"chunk {i}" for i in range(50)]
+    vectorstore = create_vectorstore(
+        texts, vectors, [{"id": i} for i in range(50)], mock_embeddings, storage="int8"
+    )
+
+    [(documents, found_vectors)] = search_candidates(
+        vectorstore, vectors[7:8], k=3, rescore_candidates=20
+    )
+
+    assert documents[0].metadata["id"] == 7
+    np.testing.assert_array_equal(found_vectors[0], vectors[7])
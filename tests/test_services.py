@@ -1,7 +1,7 @@
 """Tests for service modules."""
 
 from typing import Generator
-from unittest.mock import MagicMock, patch
+from unittest.mock import ANY, MagicMock, patch
 
 import pytest
 from langchain_core.documents import Document
@@ -45,7 +45,9 @@ def test_process_question(mock_vectorstore, mock_streamlit, monkeypatch):
             assert answer == mock_answer
             assert sources == mock_sources
             assert feedback_used is False
-            mock_answer_question.assert_called_once_with(mock_vectorstore, "Test question?")
+            mock_answer_question.assert_called_once_with(
+                mock_vectorstore, "Test question?", doc_hash=None, llm=ANY
+            )
 
 
 def test_process_question_with_feedback(mock_vectorstore, mock_streamlit, monkeypatch):
@@ -60,9 +62,11 @@ def test_process_question_with_feedback(mock_vectorstore, mock_streamlit, monkey
         with patch("services.qa_service.get_feedback_for_question") as mock_get_feedback:
             mock_get_feedback.return_value = mock_feedback
 
-            answer, sources, feedback_used = process_question(mock_vectorstore, "Test question?")
+            answer, sources, feedback_used = process_question(
+                mock_vectorstore, "Test question?", doc_hash="abc"
+            )
 
             assert answer == mock_answer
             assert sources == mock_sources
             assert feedback_used is True
-            mock_get_feedback.assert_called_once_with("Test question?")
+            mock_get_feedback.assert_called_once_with("Test question?", doc_hash="abc")
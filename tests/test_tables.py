@@ -0,0 +1,64 @@
+"""Tests for table extraction module."""
+
+import pdfplumber
+from langchain_core.documents import Document
+
+from benchmarks.common import synthetic_contract_pdf
+from core.tables import extract_text_with_tables, split_table_chunks, table_to_markdown
+
+TABLE = "| Milestone | Amount |\n|---|---|\n| Signing | $5,000 |\n| Delivery | $10,000 |"
+
+
+def test_table_to_markdown():
+    """Test rows are rendered as a Markdown table with flattened cells."""
+    rows = [["Milestone", "Amount"], ["Signing", None], [None, None], ["Final\nsign-off", "$1|2"]]
+
+    assert table_to_markdown(rows) == (
+        "| Milestone | Amount |\n|---|---|\n| Signing |  |\n| Final sign-off | $1\\|2 |"
+    )
+    assert table_to_markdown([[None, ""]]) == ""
+
+
+def test_extract_text_with_tables(temp_dir):
+    """Test table cells are moved out of the prose into a Markdown table."""
+    pdf_path = temp_dir / "table.pdf"
+    synthetic_contract_pdf(pdf_path, num_pages=1, table_every=1)
+
+    with pdfplumber.open(pdf_path) as pdf:
+        text = extract_text_with_tables(pdf.pages[0])
+
+    prose, table = text.split("\n\n| Milestone | Due date | Amount |\n|---|---|---|\n")
+    assert "Milestone 1" not in prose
+    assert table.startswith("| Milestone 1 | ")
+
+
+def test_split_table_chunks_keeps_prose_offsets():
+    """Test tables become separate chunks and prose offsets are unchanged."""
+    text = f"Payment schedule:\n\n{TABLE}\n\nLate fees apply."
+    document = Document(page_content=text, metadata={"page": 3})
+
+    prose, tables = split_table_chunks(document, chunk_size=1000)
+
+    assert len(prose.page_content) == len(text)
+    assert prose.page_content.index("Late fees") == text.index("Late fees")
+    assert "Milestone" not in prose.page_content
+    assert [chunk.page_content for chunk in tables] == [TABLE]
+    assert tables[0].metadata == {"page": 3, "start_index": 19, "content_type": "table"}
+
+
+def test_split_table_chunks_repeats_header():
+    """Test oversized tables are split between rows with the header repeated."""
+    document = Document(page_content=TABLE, metadata={"page": 1})
+
+    _, tables = split_table_chunks(document, chunk_size=50)
+
+    assert [chunk.page_content for chunk in tables] == [
+        "| Milestone | Amount |\n|---|---|\n| Signing | $5,000 |",
+        "| Milestone | Amount |\n|---|---|\n| Delivery | $10,000 |",
+    ]
+    assert tables[1].metadata["start_index"] == TABLE.index("| Delivery")
+
+
+def test_split_table_chunks_without_tables(sample_documents):
+    """Test documents without tables are returned unchanged."""
+    assert split_table_chunks(sample_documents[0], chunk_size=1000) == (sample_documents[0], [])
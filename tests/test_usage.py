@@ -0,0 +1,67 @@
+"""Tests for LLM usage reporting module."""
+
+from langchain_core.messages import AIMessage
+
+from core.usage import (
+    format_llm_usage,
+    get_cached_tokens,
+    get_llm_usage,
+    record_llm_usage,
+    reset_llm_usage,
+)
+
+
+def _response(input_tokens, cached_tokens):
+    """Create a chat model response with usage metadata."""
+    return AIMessage(
+        content="answer",
+        usage_metadata={
+            "input_tokens": input_tokens,
+            "output_tokens": 5,
+            "total_tokens": input_tokens + 5,
+            "input_token_details": {"cache_read": cached_tokens},
+        },
+    )
+
+
+def test_get_cached_tokens():
+    """Test cached input tokens are read from the response usage metadata."""
+    assert get_cached_tokens(_response(2000, 1536)) == 1536
+    assert get_cached_tokens(AIMessage(content="answer")) == 0
+
+
+def test_record_llm_usage_accumulates_totals():
+    """Test usage of several calls is accumulated per call name."""
+    reset_llm_usage()
+
+    record = record_llm_usage("qa", _response(2000, 0), 1.5)
+    record_llm_usage("qa", _response(2000, 1536), 0.5)
+    record_llm_usage("ner", _response(8000, 0), 3.0)
+
+    assert record["cached_input_tokens"] == 0
+    totals = get_llm_usage()
+    assert totals["qa"]["calls"] == 2
+    assert totals["qa"]["input_tokens"] == 4000
+    assert totals["qa"]["cached_input_tokens"] == 1536
+    assert totals["qa"]["seconds"] == 2.0
+    assert totals["ner"]["calls"] == 1
+
+
+def test_reset_llm_usage():
+    """Test resetting clears the accumulated totals."""
+    record_llm_usage("qa", _response(100, 0), 0.1)
+
+    reset_llm_usage()
+
+    assert get_llm_usage() == {}
+
+
+def test_format_llm_usage():
+    """Test usage totals are summarized with the cached share of input tokens."""
+    reset_llm_usage()
+    record_llm_usage("qa", _response(2000, 1536), 1.0)
+    record_llm_usage("qa", _response(2000, 0), 2.5)
+
+    assert format_llm_usage(get_llm_usage()) == [
+        "qa: 2 calls, 4,000 input tokens (1,536 cached, 38%), 10 output tokens, 3.5s"
+    ]
@@ -1,8 +1,17 @@
 """Tests for vectorstore module."""
 
+import numpy as np
 import pytest
 
-from core.vectorstore import build_vectorstore, save_vectorstore
+from core.chunk_store import ChunkStore
+from core.rerank import search_candidates
+from core.vectorstore import (
+    add_vectors,
+    build_vectorstore,
+    create_vectorstore,
+    load_vectorstore,
+    save_vectorstore,
+)
 
 
 def test_build_vectorstore(monkeypatch, sample_documents, mock_embeddings):
@@ -32,4 +41,231 @@ def test_save_vectorstore(monkeypatch, temp_dir, sample_documents, mock_embeddin
 
     assert save_path.exists()
     assert (save_path / "index.faiss").exists()
-    assert (save_path / "index.pkl").exists()
+    assert (save_path / "chunks.sqlite").exists()
+    assert not (save_path / "index.pkl").exists()
+
+
+def test_load_vectorstore(monkeypatch, temp_dir, sample_documents, mock_embeddings):
+    """Test loading a saved vectorstore from disk."""
+    monkeypatch.setattr("core.vectorstore.get_embeddings", lambda: mock_embeddings)
+    save_path = temp_dir / "test_index"
+    save_vectorstore(build_vectorstore(sample_documents), path=save_path)
+
+    vectorstore = load_vectorstore(path=save_path)
+
+    assert vectorstore.index.ntotal == len(sample_documents)
+
+
+def test_load_vectorstore_reads_chunks_lazily(monkeypatch, temp_dir, mock_embeddings):
+    """Test a loaded vectorstore fetches chunks from the chunk store on search."""
+    monkeypatch.setattr("core.vectorstore.get_embeddings", lambda: mock_embeddings)
+    monkeypatch.setattr("core.vectorstore.EMBEDDING_DIMENSIONS", 4)
+    vectors = np.eye(4, dtype=np.float32)
+    metadatas = [{"page": i + 1} for i in range(4)]
+    save_vectorstore(
+        create_vectorstore(list("abcd"), vectors, metadatas, mock_embeddings), temp_dir / "index"
+    )
+
+    vectorstore = load_vectorstore(temp_dir / "index")
+    (document, _), *_ = vectorstore.similarity_search_with_score_by_vector(vectors[2], k=1)
+
+    assert isinstance(vectorstore.docstore, ChunkStore)
+    assert vectorstore.index_mmapped
+    assert document.page_content == "c"
+    assert document.metadata == {"page": 3}
+
+
+def test_load_vectorstore_legacy_pickle_format(monkeypatch, temp_dir, mock_embeddings, caplog):
+    """Test indexes saved with FAISS.save_local are migrated on their first load."""
+    monkeypatch.setattr("core.vectorstore.get_embeddings", lambda: mock_embeddings)
+    monkeypatch.setattr("core.vectorstore.EMBEDDING_DIMENSIONS", 2)
+    vectors = np.eye(2, dtype=np.float32)
+    create_vectorstore(["a", "b"], vectors, [{}, {}], mock_embeddings).save_local(
+        str(temp_dir / "index")
+    )
+
+    vectorstore = load_vectorstore(temp_dir / "index")
+
+    assert "pickled docstore" in caplog.text
+    assert vectorstore.index.ntotal == 2
+    assert (temp_dir / "index" / "chunks.sqlite").exists()
+    assert not (temp_dir / "index" / "index.pkl").exists()
+    assert (
+        load_vectorstore(temp_dir / "index")
+        .docstore.search(vectorstore.index_to_docstore_id[1])
+        .page_content
+        == "b"
+    )
+
+
+def test_mmapped_vectorstore_rejects_add_vectors(monkeypatch, temp_dir, mock_embeddings):
+    """Test add_vectors refuses to extend a memory-mapped index."""
+    monkeypatch.setattr("core.vectorstore.get_embeddings", lambda: mock_embeddings)
+    monkeypatch.setattr("core.vectorstore.EMBEDDING_DIMENSIONS", 2)
+    vectors = np.eye(2, dtype=np.float32)
+    save_vectorstore(
+        create_vectorstore(["a", "b"], vectors, [{}, {}], mock_embeddings), temp_dir / "index"
+    )
+    vectorstore = load_vectorstore(temp_dir / "index", mmap=True)
+
+    with pytest.raises(ValueError, match="memory-mapped"):
+        add_vectors(vectorstore, ["c"], vectors[:1], [{}])
+
+
+def test_extended_vectorstore_appends_chunks(monkeypatch, temp_dir, mock_embeddings):
+    """Test saving a loaded and extended vectorstore appends the new chunks."""
+    monkeypatch.setattr("core.vectorstore.get_embeddings", lambda: mock_embeddings)
+    monkeypatch.setattr("core.vectorstore.EMBEDDING_DIMENSIONS", 4)
+    vectors = np.eye(4, dtype=np.float32)
+    save_vectorstore(
+        create_vectorstore(["a", "b"], vectors[:2], [{}, {}], mock_embeddings), temp_dir / "index"
+    )
+    vectorstore = load_vectorstore(temp_dir / "index", mmap=False)
+
+    add_vectors(vectorstore, ["c", "d"], vectors[2:], [{"page": 3}, {"page": 4}])
+    save_vectorstore(vectorstore, temp_dir / "index")
+    reloaded = load_vectorstore(temp_dir / "index")
+
+    assert reloaded.index.ntotal == 4
+    assert reloaded.docstore.positions() == vectorstore.index_to_docstore_id
+    assert reloaded.docstore.search(reloaded.index_to_docstore_id[3]).page_content == "d"
+
+
+def test_load_vectorstore_not_found(temp_dir):
+    """Test loading a vectorstore raises error when path does not exist."""
+    with pytest.raises(FileNotFoundError, match="Vector store not found"):
+        load_vectorstore(path=temp_dir / "missing")
+
+
+@pytest.mark.parametrize("storage", ["float16", "int8"])
+def test_create_vectorstore_compact_storage(storage, temp_dir, mock_embeddings):
+    """Test compact vector storage round-trips through save and load."""
+    vectors = np.random.default_rng(0).normal(size=(20, 8)).astype(np.float32)
+    texts = [f"chunk {i}" for i in range(20)]
+    vectorstore = create_vectorstore(
+        texts, vectors, [{"page": 1}] * 20, mock_embeddings, storage=storage
+    )
+    save_path = temp_dir / "compact_index"
+
+    save_vectorstore(vectorstore, path=save_path)
+
+    assert vectorstore.index.ntotal == 20
+    assert not (save_path / "vectors.npy").exists()
+    np.testing.assert_allclose(vectorstore.index.reconstruct(3), vectors[3], atol=0.05)
+
+
+def test_create_vectorstore_keeps_vectors_for_rescoring(temp_dir, mock_embeddings, monkeypatch):
+    """Test full-precision vectors are saved and memory-mapped only with rescoring."""
+    monkeypatch.setattr("core.vectorstore.VECTOR_RESCORE_CANDIDATES", 10)
+    monkeypatch.setattr("core.vectorstore.EMBEDDING_DIMENSIONS", 8)
+    monkeypatch.setattr("core.vectorstore.get_embeddings", lambda: mock_embeddings)
+    vectors = np.random.default_rng(0).normal(size=(20, 8)).astype(np.float32)
+    vectorstore = create_vectorstore(
+        [f"chunk {i}" for i in range(20)], vectors, [{}] * 20, mock_embeddings, storage="int8"
+    )
+    save_path = temp_dir / "compact_index"
+
+    save_vectorstore(vectorstore, path=save_path)
+    reloaded = load_vectorstore(save_path)
+
+    assert isinstance(reloaded.full_vectors, np.memmap)
+    np.testing.assert_array_equal(reloaded.full_vectors, vectors)
+
+
+def test_save_vectorstore_removes_stale_full_vectors(temp_dir, mock_embeddings, monkeypatch):
+    """Test saving an index without full vectors drops those of the previous index."""
+    monkeypatch.setattr("core.vectorstore.VECTOR_RESCORE_CANDIDATES", 10)
+    monkeypatch.setattr("core.vectorstore.EMBEDDING_DIMENSIONS", 8)
+    monkeypatch.setattr("core.vectorstore.get_embeddings", lambda: mock_embeddings)
+    vectors = np.random.default_rng(0).normal(size=(20, 8)).astype(np.float32)
+    save_path = temp_dir / "index"
+    compact = create_vectorstore(
+        [f"chunk {i}" for i in range(20)], vectors, [{}] * 20, mock_embeddings, storage="int8"
+    )
+    save_vectorstore(compact, path=save_path)
+
+    plain = create_vectorstore(
+        [f"new {i}" for i in range(5)], vectors[:5], [{}] * 5, mock_embeddings, storage="float32"
+    )
+    save_vectorstore(plain, path=save_path)
+    reloaded = load_vectorstore(save_path)
+    [(documents, _)] = search_candidates(reloaded, vectors[3:4], k=2)
+
+    assert not (save_path / "vectors.npy").exists()
+    assert getattr(reloaded, "full_vectors", None) is None
+    assert documents[0].page_content == "new 3"
+
+
+def test_load_vectorstore_ignores_mismatched_full_vectors(temp_dir, mock_embeddings, monkeypatch):
+    """Test full vectors whose row count differs from the index are not attached."""
+    monkeypatch.setattr("core.vectorstore.EMBEDDING_DIMENSIONS", 8)
+    monkeypatch.setattr("core.vectorstore.get_embeddings", lambda: mock_embeddings)
+    vectors = np.random.default_rng(0).normal(size=(5, 8)).astype(np.float32)
+    save_path = temp_dir / "index"
+    save_vectorstore(
+        create_vectorstore(["a", "b", "c", "d", "e"], vectors, [{}] * 5, mock_embeddings),
+        path=save_path,
+    )
+    np.save(save_path / "vectors.npy", np.zeros((20, 8), dtype=np.float32))
+
+    assert getattr(load_vectorstore(save_path), "full_vectors", None) is None
+
+
+def test_add_vectors_indexes_documents_in_order(mock_embeddings):
+    """Test add_vectors adds array vectors and their documents to the store."""
+    vectors = np.eye(4, dtype=np.float32)
+    vectorstore = create_vectorstore(
+        ["a", "b"], vectors[:2], [{"page": 1}, {"page": 2}], mock_embeddings
+    )
+
+    add_vectors(vectorstore, ["c", "d"], vectors[2:], [{"page": 3}, {"page": 4}])
+    _, indices = vectorstore.index.search(vectors[2:3], 1)
+    document = vectorstore.docstore.search(vectorstore.index_to_docstore_id[int(indices[0][0])])
+
+    assert vectorstore.index.ntotal == 4
+    assert document.page_content == "c"
+    assert document.metadata == {"page": 3}
+
+
+def test_add_vectors_rejects_length_mismatch(mock_embeddings):
+    """Test add_vectors raises error when texts and vectors differ in number."""
+    vectors = np.zeros((2, 4), dtype=np.float32)
+    vectorstore = create_vectorstore(["a", "b"], vectors, [{}, {}], mock_embeddings)
+
+    with pytest.raises(ValueError, match="Got 1 texts, 2 vectors"):
+        add_vectors(vectorstore, ["c"], vectors, [{}])
+
+
+def test_create_vectorstore_unknown_storage(mock_embeddings):
+    """Test create_vectorstore raises error for unknown storage format."""
+    vectors = np.zeros((2, 4), dtype=np.float32)
+    with pytest.raises(ValueError, match="Unknown vector storage format"):
+        create_vectorstore(["a", "b"], vectors, [{}, {}], mock_embeddings, storage="int4")
+
+
+def test_load_vectorstore_shortens_larger_index(monkeypatch, temp_dir, mock_embeddings):
+    """Test loading an index with more dimensions truncates it to EMBEDDING_DIMENSIONS."""
+    vectors = np.random.default_rng(0).normal(size=(5, 16)).astype(np.float32)
+    vectorstore = create_vectorstore(
+        [str(i) for i in range(5)], vectors, [{}] * 5, mock_embeddings, storage="float32"
+    )
+    save_vectorstore(vectorstore, path=temp_dir / "index")
+    monkeypatch.setattr("core.vectorstore.get_embeddings", lambda: mock_embeddings)
+    monkeypatch.setattr("core.vectorstore.EMBEDDING_DIMENSIONS", 8)
+
+    loaded = load_vectorstore(path=temp_dir / "index")
+
+    assert loaded.index.d == 8
+    assert loaded.index.ntotal == 5
+    np.testing.assert_allclose(np.linalg.norm(loaded.index.reconstruct(0)), 1.0, rtol=1e-5)
+
+
+def test_load_vectorstore_rejects_smaller_index(monkeypatch, temp_dir, mock_embeddings):
+    """Test loading an index with fewer dimensions than configured raises error."""
+    vectors = np.ones((2, 4), dtype=np.float32)
+    vectorstore = create_vectorstore(["a", "b"], vectors, [{}, {}], mock_embeddings)
+    save_vectorstore(vectorstore, path=temp_dir / "index")
+    monkeypatch.setattr("core.vectorstore.get_embeddings", lambda: mock_embeddings)
+
+    with pytest.raises(ValueError, match="rebuild the index"):
+        load_vectorstore(path=temp_dir / "index")
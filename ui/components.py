@@ -14,7 +14,8 @@ from config.settings import (
     QUICK_QUESTIONS_COLS,
     SOURCE_CONTENT_PREVIEW_LENGTH,
 )
-from core.feedback import get_feedback_stats, load_feedback
+from core.feedback import get_feedback_stats, load_feedback_page
+from core.usage import format_llm_usage, get_llm_usage
 
 
 def display_entities(entities: Dict[str, Optional[str | List[str]]]) -> None:
@@ -42,13 +43,21 @@ def format_timestamp(timestamp: str) -> str:
 
 
 def render_feedback_history() -> None:
-    """Render feedback history in an expander."""
-    feedback_entries = load_feedback(limit=FEEDBACK_HISTORY_LIMIT)
+    """Render one page of the feedback history of the active document."""
+    doc_hash = st.session_state.get("doc_hash")
+    # Cursors of the pages viewed so far, per document; the last one is shown
+    cursors = st.session_state.setdefault("feedback_history_cursors", {}).setdefault(
+        doc_hash, [None]
+    )
+    feedback_entries, next_cursor = load_feedback_page(
+        cursor=cursors[-1], limit=FEEDBACK_HISTORY_LIMIT, doc_hash=doc_hash
+    )
     if not feedback_entries:
         st.info("No feedback entries yet.")
         return
 
-    st.caption(f"Showing {len(feedback_entries)} most recent entries")
+    first = (len(cursors) - 1) * FEEDBACK_HISTORY_LIMIT + 1
+    st.caption(f"Showing entries {first}-{first + len(feedback_entries) - 1}, most recent first")
     for entry in feedback_entries:
         rating_emoji = "👍" if entry.get("rating") == "up" else "👎"
         st.markdown(f"**{rating_emoji} {format_timestamp(entry.get('timestamp', ''))}**")
@@ -58,11 +67,28 @@ def render_feedback_history() -> None:
             st.markdown(f"*Comment:* {entry.get('comment')}")
         st.divider()
 
+    col_newer, col_older = st.columns(2)
+    with col_newer:
+        if len(cursors) > 1:
+            st.button("← Newer", key="feedback_history_newer", on_click=cursors.pop)
+    with col_older:
+        if next_cursor:
+            st.button(
+                "Older →",
+                key="feedback_history_older",
+                on_click=cursors.append,
+                args=(next_cursor,),
+            )
+
 
+@st.fragment
 def render_feedback_stats() -> None:
-    """Render feedback statistics section in sidebar."""
+    """Render feedback statistics section in sidebar.
+
+    Runs as a fragment, so paging through the history reruns only this panel.
+    """
     try:
-        feedback_stats = get_feedback_stats()
+        feedback_stats = get_feedback_stats(doc_hash=st.session_state.get("doc_hash"))
         st.divider()
         st.header("📊 Feedback Statistics")
 
@@ -81,6 +107,22 @@ def render_feedback_stats() -> None:
         st.warning(f"⚠️ Could not load feedback statistics: {str(e)}")
 
 
+def render_llm_usage() -> None:
+    """Render LLM token usage, including prompt-cache hits, in the sidebar."""
+    usage = get_llm_usage()
+    if not usage:
+        return
+    with st.expander("🧮 LLM Usage", expanded=False):
+        st.caption("Totals of this server process since start-up")
+        for line in format_llm_usage(usage):
+            st.text(line)
+
+
+def _use_quick_question(question: str) -> None:
+    """Fill the question input with a quick question before the rerun."""
+    st.session_state.question_input = question
+
+
 def render_quick_questions() -> None:
     """Render quick questions section."""
     st.subheader("💡 Quick Questions")
@@ -91,11 +133,13 @@ def render_quick_questions() -> None:
         for j, col in enumerate(cols):
             if i + j < len(PREFILLED_QUESTIONS):
                 with col:
-                    if st.button(
-                        PREFILLED_QUESTIONS[i + j], key=f"question_{i + j}", width="stretch"
-                    ):
-                        st.session_state.question_input = PREFILLED_QUESTIONS[i + j]
-                        st.rerun()
+                    st.button(
+                        PREFILLED_QUESTIONS[i + j],
+                        key=f"question_{i + j}",
+                        width="stretch",
+                        on_click=_use_quick_question,
+                        args=(PREFILLED_QUESTIONS[i + j],),
+                    )
 
 
 def render_question_input() -> Tuple[str, bool]:
@@ -141,10 +185,7 @@ def render_answer_and_sources(answer: str, sources: List[Dict[str, str]]) -> Non
 
 
 def render_sidebar() -> None:
-    """Render sidebar with PDF upload and feedback statistics."""
-    from core.feedback import clear_all_feedback
-    from services.pdf_service import process_pdf
-
+    """Render sidebar with PDF upload, feedback statistics and LLM usage."""
     with st.sidebar:
         st.header("📤 Upload Contract")
         uploaded_file = st.file_uploader(
@@ -153,11 +194,8 @@ def render_sidebar() -> None:
 
         if uploaded_file is not None:
             if st.button("Process PDF", type="primary"):
-                try:
-                    clear_all_feedback()
-                except RuntimeError:
-                    # Feedback file may not exist, continue
-                    pass
+                # Imported on first upload: the ingestion stack is not needed to render the page
+                from services.pdf_service import process_pdf
 
                 vectorstore = process_pdf(uploaded_file)
                 if vectorstore:
@@ -169,3 +207,4 @@ def render_sidebar() -> None:
                     st.session_state.vectorstore = None
 
         render_feedback_stats()
+        render_llm_usage()
@@ -19,6 +19,8 @@ def handle_positive_feedback() -> None:
             answer=st.session_state.last_answer,
             rating="up",
             sources=st.session_state.get("last_sources"),
+            doc_hash=st.session_state.get("doc_hash"),
+            doc_id=st.session_state.get("doc_id"),
         )
         st.session_state.feedback_submitted = True
         st.success(
@@ -44,6 +46,8 @@ def handle_negative_feedback(comment: str) -> None:
             rating="down",
             comment=comment if comment.strip() else None,
             sources=st.session_state.get("last_sources"),
+            doc_hash=st.session_state.get("doc_hash"),
+            doc_id=st.session_state.get("doc_id"),
         )
         st.session_state.feedback_submitted = True
         st.session_state.show_comment = False
@@ -57,8 +61,19 @@ def handle_negative_feedback(comment: str) -> None:
             st.code(traceback.format_exc())
 
 
+def _set_show_comment(show: bool) -> None:
+    """Show or hide the comment field before the rerun."""
+    st.session_state.show_comment = show
+
+
+@st.fragment
 def render_feedback_section() -> None:
-    """Render feedback section with buttons and comment field."""
+    """Render feedback section with buttons and comment field.
+
+    Runs as a fragment: opening or cancelling the comment field reruns only
+    this section. Submitting feedback reruns the app once to refresh the
+    sidebar statistics.
+    """
     if not st.session_state.get("last_answer") or st.session_state.feedback_submitted:
         if st.session_state.get("last_answer") and st.session_state.feedback_submitted:
             st.divider()
@@ -80,9 +95,13 @@ def render_feedback_section() -> None:
         if st.button("👍 Helpful", width="stretch", type="primary", key="feedback_up"):
             handle_positive_feedback()
     with col2:
-        if st.button("👎 Not Helpful", width="stretch", key="feedback_down"):
-            st.session_state.show_comment = True
-            st.rerun()
+        st.button(
+            "👎 Not Helpful",
+            width="stretch",
+            key="feedback_down",
+            on_click=_set_show_comment,
+            args=(True,),
+        )
 
     if st.session_state.get("show_comment", False):
         if st.session_state.get("last_question"):
@@ -99,6 +118,4 @@ def render_feedback_section() -> None:
             if st.button("Submit Feedback", type="primary", key="feedback_submit"):
                 handle_negative_feedback(comment)
         with col_cancel:
-            if st.button("Cancel"):
-                st.session_state.show_comment = False
-                st.rerun()
+            st.button("Cancel", on_click=_set_show_comment, args=(False,))